@@ -0,0 +1,96 @@
+"""Конвертация 1000 маленьких CSV в JSON: по очереди и одновременно (asyncio).
+
+Асинхронная версия отдает чтение и запись в ограниченный пул потоков
+lib.aio; выигрыш по времени зависит от того, сколько уходит на ожидание
+диска (на медленном или сетевом диске больше, на кеше ОС - меньше).
+Кроме времени печатается наибольшая задержка цикла событий: синхронный
+вызов внутри сервиса на asyncio останавливает все остальные задачи.
+Запуск из корня репозитория:
+    python benchmarks/bench_async_io.py --files 1000 --workers 8
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.lib import aio
+from src.lab5.json_csv import csv_to_json
+from src.lab5.json_csv_async import convert_many_async
+
+
+def make_files(folder: Path, count: int) -> list:
+    pairs = []
+    for i in range(count):
+        src = folder / f"in_{i}.csv"
+        rows = "".join(f"Студент {i}-{j},{j},{j % 5}.5\n" for j in range(20))
+        src.write_text("name,age,gpa\n" + rows, encoding="utf-8")
+        pairs.append((str(src), str(folder / f"out_{i}.json")))
+    return pairs
+
+
+async def _heartbeat(lag: list, period: float = 0.001) -> None:
+    # Насколько позже запланированного просыпается задача цикла событий
+    while True:
+        planned = time.perf_counter() + period
+        await asyncio.sleep(period)
+        lag[0] = max(lag[0], time.perf_counter() - planned)
+
+
+async def _measure(convert) -> tuple:
+    lag = [0.0]
+    beat = asyncio.create_task(_heartbeat(lag))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await convert()
+    elapsed = time.perf_counter() - start
+    # Даем задаче проснуться и учесть последнюю задержку
+    await asyncio.sleep(0.01)
+    beat.cancel()
+    return elapsed, lag[0]
+
+
+def run_sequential(pairs: list) -> tuple:
+    async def convert():
+        for src, dst in pairs:
+            csv_to_json(src, dst)
+
+    return asyncio.run(_measure(convert))
+
+
+def run_concurrent(pairs: list) -> tuple:
+    async def convert():
+        errors = await convert_many_async(pairs)
+        assert not any(errors), "есть ошибки конвертации"
+
+    return asyncio.run(_measure(convert))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=aio.IO_WORKERS)
+    args = parser.parse_args()
+    aio.IO_WORKERS = args.workers
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pairs = make_files(Path(tmp), args.files)
+        sequential = run_sequential(pairs)
+        expected = [Path(dst).read_bytes() for _, dst in pairs]
+        concurrent = run_concurrent(pairs)
+        assert [Path(dst).read_bytes() for _, dst in pairs] == expected
+        print(f"Файлов: {args.files}, потоков в пуле: {args.workers}")
+        print(f"{'режим':<12} {'время, c':>10} {'файлов/с':>10} {'задержка, мс':>14}")
+        for name, (elapsed, lag) in (
+            ("по очереди", sequential),
+            ("asyncio", concurrent),
+        ):
+            rate = args.files / elapsed
+            print(f"{name:<12} {elapsed:>10.3f} {rate:>10.0f} {lag * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
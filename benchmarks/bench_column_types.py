@@ -0,0 +1,83 @@
+"""Конвертация CSV с определением типов против строковой: время с потреблением.
+
+"Потребление" - то, что делает код после конвертации: загрузить JSON
+и посчитать сумму и среднее по числовым колонкам. Для строкового
+вывода числа приходится разбирать заново.
+Запуск из корня репозитория:
+    python benchmarks/bench_column_types.py --rows 500000
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.lab5.json_csv import csv_to_json_stream
+
+NUMERIC = ("age", "gpa", "score")
+
+
+def make_csv(path: Path, rows: int, seed: int = 0) -> None:
+    rnd = random.Random(seed)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "age", "gpa", "score", "active", "born"])
+        for i in range(rows):
+            writer.writerow(
+                [
+                    f"Студент {i}",
+                    rnd.randint(17, 30),
+                    round(rnd.uniform(2, 5), 2),
+                    rnd.randint(0, 100),
+                    rnd.choice(["true", "false"]),
+                    f"{rnd.randint(1995, 2008)}-{rnd.randint(1, 12):02d}-15",
+                ]
+            )
+
+
+def consume(path: Path, parse_numbers: bool) -> dict:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    totals = {}
+    for name in NUMERIC:
+        if parse_numbers:
+            values = [float(row[name]) for row in data]
+        else:
+            values = [row[name] for row in data]
+        totals[name] = sum(values) / len(values)
+    return totals
+
+
+def run(src: Path, dst: Path, typed: bool) -> tuple:
+    start = time.perf_counter()
+    csv_to_json_stream(str(src), str(dst), indent=None, infer_types=typed)
+    converted = time.perf_counter()
+    result = consume(dst, parse_numbers=not typed)
+    finished = time.perf_counter()
+    return converted - start, finished - converted, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "input.csv"
+        make_csv(src, args.rows)
+        print(f"Строк: {args.rows}")
+        print(f"{'вывод':<10} {'конверт., c':>12} {'потребл., c':>12} {'всего, c':>10}")
+        results = []
+        for name, typed in (("строки", False), ("типы", True)):
+            conv, cons, result = run(src, Path(tmp) / f"{name}.json", typed)
+            results.append(result)
+            print(f"{name:<10} {conv:>12.2f} {cons:>12.2f} {conv + cons:>10.2f}")
+        assert results[0] == results[1], "результаты не совпадают"
+
+
+if __name__ == "__main__":
+    main()
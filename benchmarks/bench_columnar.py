@@ -0,0 +1,69 @@
+"""Повторное чтение колонки: разбор CSV против файла .col через mmap.
+
+Сценарий аналитики: конвертируем один раз, затем много раз считаем
+среднее по числовой колонке.
+Запуск из корня репозитория:
+    python benchmarks/bench_columnar.py --rows 1000000 --repeat 5
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from benchmarks.bench_column_types import make_csv
+from src.lab5.columnar import ColumnarFile, csv_to_columnar
+
+
+def mean_csv(path: Path, name: str) -> float:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        col_idx = next(reader).index(name)
+        values = [float(row[col_idx]) for row in reader]
+    return sum(values) / len(values)
+
+
+def mean_col(path: Path, name: str) -> float:
+    with ColumnarFile(path) as table:
+        values = table.column(name)
+        return sum(values) / len(values)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "input.csv"
+        col = Path(tmp) / "input.col"
+        make_csv(src, args.rows)
+        _, t_convert = timed(csv_to_columnar, str(src), str(col))
+        print(f"Строк: {args.rows}, конвертация в .col: {t_convert:.2f} c")
+        print(f"CSV: {src.stat().st_size} байт, .col: {col.stat().st_size} байт")
+
+        t_csv = t_col = 0.0
+        for _ in range(args.repeat):
+            expected, elapsed = timed(mean_csv, src, "gpa")
+            t_csv += elapsed
+            result, elapsed = timed(mean_col, col, "gpa")
+            t_col += elapsed
+            assert abs(result - expected) < 1e-9, "результаты не совпадают"
+        print(f"{'формат':<8} {'чтение колонки, c':>18}")
+        print(f"{'csv':<8} {t_csv / args.repeat:>18.4f}")
+        print(f"{'col':<8} {t_col / args.repeat:>18.4f}")
+        print(f"ускорение: {t_csv / t_col:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
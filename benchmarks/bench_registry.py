@@ -0,0 +1,91 @@
+"""Запросы к StudentRegistry против перебора list[Student].
+
+Точечные (по ФИО), по группе, диапазон GPA, топ по GPA и возрастной
+диапазон. 10^7 студентов требуют нескольких ГБ памяти.
+Запуск из корня репозитория:
+    python benchmarks/bench_registry.py --min-power 5 --max-power 6
+"""
+
+import argparse
+import heapq
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from benchmarks.bench_students_load import make_records
+from src.lab8 import StudentRegistry, students_from_dicts
+
+TODAY = date(2025, 9, 1)
+
+
+def queries(students):
+    """Запрос -> (через реестр, перебором списка)."""
+    fio = students[len(students) // 2].fio
+    return {
+        "по ФИО": (
+            lambda r: r.by_fio(fio),
+            lambda: [s for s in students if s.fio == fio],
+        ),
+        "по группе": (
+            lambda r: r.by_group("SE-01"),
+            lambda: [s for s in students if s.group == "SE-01"],
+        ),
+        "GPA 4.95..5": (
+            lambda r: r.gpa_between(4.95, 5.0),
+            lambda: [s for s in students if 4.95 <= s.gpa <= 5.0],
+        ),
+        "топ-10 GPA": (
+            lambda r: [s.gpa for s in r.top_gpa(10)],
+            lambda: heapq.nlargest(10, (s.gpa for s in students)),
+        ),
+        "возраст 20 лет": (
+            lambda r: r.age_between(20, 20, TODAY),
+            lambda: [s for s in students if _age(s) == 20],
+        ),
+    }
+
+
+def _age(student) -> int:
+    # То же, что Student.age(), но на фиксированную дату
+    year, month, day = map(int, student.birthdate.split("-"))
+    return TODAY.year - year - ((TODAY.month, TODAY.day) < (month, day))
+
+
+def timed(func, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-power", type=int, default=5)
+    parser.add_argument("--max-power", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for power in range(args.min_power, args.max_power + 1):
+        students, _ = students_from_dicts(make_records(10**power, invalid=0.0))
+        registry, t_build = timed(lambda: StudentRegistry(students), 1)
+        print(f"\nСтудентов: {10**power}, построение индексов: {t_build:.2f} c")
+        header = f"{'запрос':<16} {'реестр, мс':>11} {'перебор, мс':>12}"
+        print(f"{header} {'ускорение':>10}")
+        for name, (indexed, scan) in queries(students).items():
+            result, t_index = timed(lambda: indexed(registry), args.repeat)
+            expected, t_scan = timed(scan, args.repeat)
+            if name != "топ-10 GPA":
+                # Порядок у реестра свой (по ключу индекса)
+                result, expected = sorted(map(id, result)), sorted(map(id, expected))
+            assert result == expected, f"результаты не совпадают: {name}"
+            speedup = t_scan / t_index if t_index else float("inf")
+            print(
+                f"{name:<16} {t_index * 1000:>11.3f} {t_scan * 1000:>12.1f} "
+                f"{speedup:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
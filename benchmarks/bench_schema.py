@@ -0,0 +1,54 @@
+"""Кодирование и разбор студентов: методы Student против compile_codec.
+
+Разбор сравнивается в двух режимах: с проверками (как from_dict)
+и trusted - для словарей, записанных нами же через to_dict.
+Запуск из корня репозитория:
+    python benchmarks/bench_schema.py --rows 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from benchmarks.bench_students_load import make_records
+from src.lab8 import Student, compile_codec
+
+
+def timed(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = make_records(args.rows, invalid=0.0)
+    codec = compile_codec(Student)
+    trusted = compile_codec(Student, trusted=True)
+
+    students, t_from = timed(lambda: [Student.from_dict(r) for r in records])
+    decoded, t_decode = timed(codec.decode_many, records)
+    dicts, t_to = timed(lambda: [student.to_dict() for student in students])
+    encoded, t_encode = timed(codec.encode_many, students)
+    restored, t_trusted = timed(trusted.decode_many, dicts)
+    assert decoded == students and encoded == dicts and restored == students
+
+    print(f"Строк: {args.rows}")
+    print(f"{'операция':<28} {'время, c':>9} {'записей/с':>12}")
+    for name, elapsed in (
+        ("Student.from_dict", t_from),
+        ("decode_many", t_decode),
+        ("decode_many (trusted)", t_trusted),
+        ("Student.to_dict", t_to),
+        ("encode_many", t_encode),
+    ):
+        print(f"{name:<28} {elapsed:>9.3f} {args.rows / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
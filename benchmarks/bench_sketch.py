@@ -0,0 +1,73 @@
+"""Полнота (recall) приближенного топа SpaceSaving относительно точного подсчета.
+
+Слова берутся из распределения Ципфа, как в обычном тексте.
+Запуск из корня репозитория:
+    python benchmarks/bench_sketch.py --words 2000000 --top 100
+"""
+
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.lib.sketch import BYTES_PER_ENTRY, count_freq_approx
+from src.lib.text import count_words, top_n
+
+
+def make_text(words: int, vocabulary: int, seed: int = 0) -> str:
+    rnd = random.Random(seed)
+    vocab = [_word(i) for i in range(vocabulary)]
+    weights = [1 / (i + 1) for i in range(vocabulary)]
+    return " ".join(rnd.choices(vocab, weights, k=words))
+
+
+def _word(i: int) -> str:
+    letters = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
+    word = ""
+    i += 1
+    while i:
+        i, r = divmod(i - 1, len(letters))
+        word += letters[r]
+    return word
+
+
+def recall(exact: dict, approx, k: int) -> float:
+    expected = {word for word, _ in top_n(exact, k)}
+    found = {word for word, _ in top_n(approx, k)}
+    return len(expected & found) / len(expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=2_000_000)
+    parser.add_argument("--vocabulary", type=int, default=200_000)
+    parser.add_argument("--top", type=int, default=100)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    text = make_text(args.words, args.vocabulary)
+    exact = count_words(text)
+    print(f"Слов: {args.words}, различных: {len(exact)}")
+    print(
+        f"{'счетчиков':>10} {'память':>10} {'recall':>8} "
+        f"{'погрешность':>12} {'c':>8}"
+    )
+    for capacity in (args.top, args.top * 4, args.top * 16, args.top * 64):
+        start = time.perf_counter()
+        sketch = count_freq_approx(
+            io.StringIO(text), capacity * BYTES_PER_ENTRY, args.chunk_size
+        )
+        elapsed = time.perf_counter() - start
+        memory_kb = capacity * BYTES_PER_ENTRY // 1024
+        share = recall(exact, sketch, args.top)
+        print(
+            f"{capacity:>10} {memory_kb:>8}KB {share:>8.3f} "
+            f"{sketch.max_error:>12} {elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
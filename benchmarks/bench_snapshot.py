@@ -0,0 +1,60 @@
+"""Восстановление списка студентов: JSON (students_from_json) против снимка.
+
+Для снимка отдельно замеряются открытие с чтением одной записи
+и полная материализация списка (to_students).
+Запуск из корня репозитория:
+    python benchmarks/bench_snapshot.py --rows 1000000
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from benchmarks.bench_students_load import make_records, timed
+from src.lab8 import StudentSnapshot, students_from_dicts, students_to_json
+from src.lab8 import students_from_json, write_snapshot
+
+
+def open_and_peek(path: str):
+    with StudentSnapshot(path) as snapshot:
+        return len(snapshot), snapshot[len(snapshot) // 2]
+
+
+def load_all(path: str):
+    with StudentSnapshot(path) as snapshot:
+        return snapshot.to_students()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Даты в генераторе с ведущими нулями: снимок возвращает их без изменений
+    students, _ = students_from_dicts(make_records(args.rows, invalid=0.0))
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = str(Path(tmp) / "students.json")
+        snap_path = str(Path(tmp) / "students.stus")
+        timed(lambda path: students_to_json(students, path), json_path)
+        _, t_write = timed(lambda path: write_snapshot(students, path), snap_path)
+
+        loaded, t_json = timed(students_from_json, json_path)
+        (count, middle), t_open = timed(open_and_peek, snap_path)
+        restored, t_all = timed(load_all, snap_path)
+        assert loaded == students and restored == students
+        assert count == len(students) and middle == students[count // 2]
+
+        mib = 2**20
+        print(f"Строк: {args.rows}, запись снимка: {t_write:.2f} c")
+        print(f"{'вариант':<28} {'файл, МБ':>9} {'время, c':>9}")
+        json_size = Path(json_path).stat().st_size / mib
+        snap_size = Path(snap_path).stat().st_size / mib
+        print(f"{'students_from_json':<28} {json_size:>9.1f} {t_json:>9.3f}")
+        print(f"{'снимок: открыть + 1 запись':<28} {snap_size:>9.1f} {t_open:>9.4f}")
+        print(f"{'снимок: to_students()':<28} {snap_size:>9.1f} {t_all:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
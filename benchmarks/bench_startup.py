@@ -0,0 +1,112 @@
+"""Холодный старт CLI по подкомандам: время процесса и импортов.
+
+Каждая подкоманда запускается в новом процессе с python -X importtime
+на маленьком файле, так что время почти целиком уходит на старт.
+Печатается медиана времени процесса, сумма времени импортов и самые
+дорогие модули верхнего уровня.
+Запуск из корня репозитория:
+    python benchmarks/bench_startup.py --repeat 5 --top 3
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI_CONVERT = ROOT / "src" / "lab6" / "cli_convert.py"
+CLI_TEXT = ROOT / "src" / "lab6" / "cli_text.py"
+
+# Строка вывода -X importtime: "import time: self | cumulative | module"
+_IMPORT_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def make_inputs(folder: Path) -> dict:
+    csv_path = folder / "small.csv"
+    csv_path.write_text("name,age\nАня,20\nBob,21\n", encoding="utf-8")
+    json_path = folder / "small.json"
+    json_path.write_text('[{"name": "Аня", "age": 20}]', encoding="utf-8")
+    txt_path = folder / "small.txt"
+    txt_path.write_text("мама мыла раму\n", encoding="utf-8")
+    return {".csv": csv_path, ".json": json_path, ".txt": txt_path}
+
+
+def commands(inputs: dict, out: Path) -> dict:
+    convert = {
+        "json2csv": (".json", ".csv"),
+        "csv2json": (".csv", ".json"),
+        "csv2xlsx": (".csv", ".xlsx"),
+        "csv2col": (".csv", ".col"),
+        "json2col": (".json", ".col"),
+    }
+    result = {
+        f"convert {cmd}": [
+            str(CLI_CONVERT),
+            cmd,
+            "--in",
+            str(inputs[src]),
+            "--out",
+            str(out / f"{cmd}{dst}"),
+        ]
+        for cmd, (src, dst) in convert.items()
+    }
+    result["text cat"] = [str(CLI_TEXT), "cat", "--input", str(inputs[".txt"])]
+    result["text stats"] = [str(CLI_TEXT), "stats", "--input", str(inputs[".txt"])]
+    return result
+
+
+def parse_importtime(stderr: str) -> tuple:
+    """Сумма собственного времени импортов (мкс) и модули верхнего уровня."""
+    total, top_level = 0, []
+    for line in stderr.splitlines():
+        match = _IMPORT_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative, indent, module = match.groups()
+        total += int(self_us)
+        if len(indent) == 1:
+            top_level.append((int(cumulative), module))
+    return total, sorted(top_level, reverse=True)
+
+
+def measure(argv: list, repeat: int) -> tuple:
+    wall, imports, top_level, code = [], [], [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *argv],
+            capture_output=True,
+            text=True,
+        )
+        wall.append(time.perf_counter() - start)
+        total, top_level = parse_importtime(proc.stderr)
+        imports.append(total)
+        code = proc.returncode
+    return statistics.median(wall), statistics.median(imports), top_level, code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3, help="Сколько модулей показать")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = make_inputs(Path(tmp))
+        print(f"{'подкоманда':<18} {'процесс, мс':>12} {'импорты, мс':>12}  модули")
+        for name, argv in commands(inputs, Path(tmp)).items():
+            wall, imports, top_level, code = measure(argv, args.repeat)
+            heavy = ", ".join(
+                f"{module} {us / 1000:.1f}" for us, module in top_level[: args.top]
+            )
+            if code != 0:
+                heavy += f" (код выхода {code})"
+            print(f"{name:<18} {wall * 1000:>12.1f} {imports / 1000:>12.1f}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Отчет по студентам с возрастом: прежний Student против кеша дат.
+
+Отчет: создание студентов из словарей (с проверкой в __post_init__)
+и строка на каждого студента с возрастом; age() вызывается дважды
+(в строке и при подсчете совершеннолетних), как в типичном отчете.
+Прежняя модель (strptime в __post_init__ и в каждом age()) воспроизведена
+здесь как LegacyStudent.
+Запуск из корня репозитория:
+    python benchmarks/bench_student_ages.py --rows 1000000
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from benchmarks.bench_students_load import make_records
+from src.lab8 import Student, student_ages
+
+
+@dataclass
+class LegacyStudent:
+    __slots__ = ("fio", "birthdate", "group", "gpa")
+
+    fio: str
+    birthdate: str
+    group: str
+    gpa: float
+
+    def __post_init__(self):
+        datetime.strptime(self.birthdate, "%Y-%m-%d")
+        if not (0 <= self.gpa <= 5):
+            raise ValueError(f"GPA вне диапазона: {self.gpa}")
+
+    def age(self) -> int:
+        birth_date = datetime.strptime(self.birthdate, "%Y-%m-%d").date()
+        today = date.today()
+        age = today.year - birth_date.year
+        if (today.month, today.day) < (birth_date.month, birth_date.day):
+            age -= 1
+        return age
+
+    def __str__(self) -> str:
+        return f"Студент: {self.fio}, группа: {self.group}, GPA: {self.gpa:.2f}"
+
+
+def report(cls, records) -> tuple:
+    students = [cls(**record) for record in records]
+    lines = [f"{student}, возраст: {student.age()}" for student in students]
+    adults = sum(1 for student in students if student.age() >= 18)
+    return lines, adults
+
+
+def report_as_of(records, as_of: date) -> tuple:
+    students = [Student(**record) for record in records]
+    ages = student_ages(students, as_of)
+    lines = [f"{student}, возраст: {age}" for student, age in zip(students, ages)]
+    return lines, sum(1 for age in ages if age >= 18)
+
+
+def timed(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = make_records(args.rows, invalid=0.0)
+    expected, t_legacy = timed(report, LegacyStudent, records)
+    cached, t_cached = timed(report, Student, records)
+    batch, t_batch = timed(report_as_of, records, date.today())
+    assert cached == expected and batch == expected
+
+    print(f"Строк: {args.rows}")
+    print(f"{'вариант':<34} {'время, c':>9}")
+    print(f"{'прежний Student (strptime)':<34} {t_legacy:>9.2f}")
+    print(f"{'Student: кеш дат и age()':<34} {t_cached:>9.2f}")
+    print(f"{'Student + student_ages(as_of)':<34} {t_batch:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
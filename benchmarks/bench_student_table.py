@@ -0,0 +1,118 @@
+"""Память и обход: list[Student] против StudentTable.
+
+Для сравнения с прежней версией модели строится и список объектов
+dataclass без __slots__ (с __dict__).
+Запуск из корня репозитория:
+    python benchmarks/bench_student_table.py --rows 1000000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from benchmarks.bench_students_load import make_records
+from src.lab8 import StudentTable, students_from_dicts
+
+
+@dataclass
+class DictStudent:
+    fio: str
+    birthdate: str
+    group: str
+    gpa: float
+
+
+def build_dict_students(records):
+    return [DictStudent(**record) for record in records]
+
+
+def build_students(records):
+    return students_from_dicts(records)[0]
+
+
+def build_table(records):
+    return StudentTable.from_dicts(records)[0]
+
+
+def measure_memory(build, rows: int) -> float:
+    """Сколько памяти остается занято после загрузки (исходные словари удалены)."""
+    gc.collect()
+    tracemalloc.start()
+    records = make_records(rows, invalid=0.0)
+    result = build(records)
+    del records
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size / 2**20
+
+
+def timed(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def scan_gpa(rows) -> float:
+    return sum(row.gpa for row in rows) / len(rows)
+
+
+def scan_table_gpa(table) -> float:
+    # Колоночный доступ: без объектов строк
+    return sum(table.gpa) / len(table)
+
+
+def count_groups(rows) -> dict:
+    counts = {}
+    for row in rows:
+        counts[row.group] = counts.get(row.group, 0) + 1
+    return counts
+
+
+def count_table_groups(table) -> dict:
+    counts = [0] * len(table.groups)
+    for code in table.group_codes:
+        counts[code] += 1
+    return dict(zip(table.groups, counts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Генератор иногда портит записи; здесь нужны только корректные
+    records = make_records(args.rows, invalid=0.0)
+    print(f"Строк: {args.rows}")
+    print(f"{'вариант':<22} {'память, МБ':>11}")
+    for name, build in (
+        ("dataclass с __dict__", build_dict_students),
+        ("Student (__slots__)", build_students),
+        ("StudentTable", build_table),
+    ):
+        print(f"{name:<22} {measure_memory(build, args.rows):>11.1f}")
+
+    students = build_students(records)
+    table = build_table(records)
+    print(f"\n{'обход':<26} {'list, c':>9} {'таблица, c':>11}")
+    checks = (
+        ("средний GPA (строки)", scan_gpa, scan_gpa),
+        ("средний GPA (колонка)", scan_gpa, scan_table_gpa),
+        ("студентов по группам", count_groups, count_table_groups),
+        ("str() каждой строки", lambda rows: [str(r) for r in rows], None),
+    )
+    for name, list_func, table_func in checks:
+        expected, t_list = timed(list_func, students)
+        result, t_table = timed(table_func or list_func, table)
+        assert result == expected, f"результаты не совпадают: {name}"
+        print(f"{name:<26} {t_list:>9.3f} {t_table:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
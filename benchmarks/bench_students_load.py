@@ -0,0 +1,73 @@
+"""Загрузка студентов из JSON: поэлементно и пакетно (students_from_json_bulk).
+
+Запуск из корня репозитория:
+    python benchmarks/bench_students_load.py --rows 1000000 --invalid 0.01
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.lab8 import students_from_json, students_from_json_bulk
+
+GROUPS = [f"{name}-{n:02d}" for name in ("SE", "AI", "IKBO") for n in range(1, 11)]
+BROKEN = [("birthdate", "2000-13-01"), ("gpa", 7), ("birthdate", "01.02.2000")]
+
+
+def make_records(rows: int, invalid: float, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    records = []
+    for i in range(rows):
+        record = {
+            "fio": f"Студент{i} Тестовый",
+            "birthdate": f"{rnd.randint(1995, 2007)}-{rnd.randint(1, 12):02d}-"
+            f"{rnd.randint(1, 28):02d}",
+            "group": rnd.choice(GROUPS),
+            "gpa": round(rnd.uniform(2, 5), 2),
+        }
+        if rnd.random() < invalid:
+            field, value = rnd.choice(BROKEN)
+            record[field] = value
+        records.append(record)
+    return records
+
+
+def timed(func, path: str) -> tuple:
+    # Вывод функций (по строке на пропущенную запись) в замер не входит
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(path)
+        elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--invalid", type=float, default=0.01)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "students.json"
+        path.write_text(
+            json.dumps(make_records(args.rows, args.invalid), ensure_ascii=False),
+            encoding="utf-8",
+        )
+        expected, t_item = timed(students_from_json, str(path))
+        result, t_bulk = timed(students_from_json_bulk, str(path))
+        assert result == expected, "результаты не совпадают"
+        print(f"Записей: {args.rows}, загружено: {len(result)}")
+        print(f"{'способ':<12} {'время, c':>10} {'записей/с':>12}")
+        for name, elapsed in (("поэлементно", t_item), ("пакетно", t_bulk)):
+            print(f"{name:<12} {elapsed:>10.2f} {args.rows / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Скорость подсчета частот слов: обычный конвейер и count_words.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_text.py --size-mb 300
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.lib.text import normalize, tokenize, count_freq, count_words
+
+WORDS = (
+    "привет мир Ёжик ёлка Туман текст слово частота Москва данные "
+    "hello world Python stream token count Word data FAST slow"
+).split()
+SEPARATORS = [" ", " ", " ", ", ", ". ", "\n", "  ", "\t", "! "]
+
+
+def make_text(size_mb: int, seed: int = 0) -> str:
+    """Собирает смешанный русско-английский текст примерно size_mb мегабайт."""
+    rnd = random.Random(seed)
+    block = "".join(rnd.choice(WORDS) + rnd.choice(SEPARATORS) for _ in range(100_000))
+    repeat = max(1, size_mb * 1024 * 1024 // len(block.encode("utf-8")))
+    return block * repeat
+
+
+def measure(name: str, func, text: str, size_mb: float) -> dict:
+    start = time.perf_counter()
+    result = func(text)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {elapsed:8.2f} c  {size_mb / elapsed:8.1f} МБ/с")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=300)
+    args = parser.parse_args()
+
+    text = make_text(args.size_mb)
+    size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+    print(f"Размер текста: {size_mb:.1f} МБ")
+
+    expected = measure(
+        "count_freq(tokenize(normalize(text)))",
+        lambda t: count_freq(tokenize(normalize(t))),
+        text,
+        size_mb,
+    )
+    result = measure("count_words(text)", count_words, text, size_mb)
+    assert result == expected, "результаты не совпадают"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Время top_n: полная сортировка словаря и выбор через кучу.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_top_n.py --max-power 7 --n 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.lib.text import top_n
+
+
+def sort_top_n(freq, n):
+    return sorted(freq.items(), key=lambda x: (-x[1], x[0]))[:n]
+
+
+def make_freq(size: int, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    return {f"w{i:08d}": rnd.randint(1, 1000) for i in range(size)}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-power", type=int, default=3)
+    parser.add_argument("--max-power", type=int, default=6)
+    parser.add_argument("--n", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'V':>10} {'sorted, c':>12} {'top_n, c':>12} {'ускорение':>10}")
+    for power in range(args.min_power, args.max_power + 1):
+        freq = make_freq(10**power)
+        expected, t_sort = timed(sort_top_n, freq, args.n)
+        result, t_heap = timed(top_n, freq, args.n)
+        assert result == expected, "результаты не совпадают"
+        speedup = t_sort / t_heap
+        print(f"{10**power:>10} {t_sort:>12.4f} {t_heap:>12.4f} {speedup:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,23 +26,24 @@ def flatten_list(nested):
     return flat_list
 
 
-print("find_min_max")
-print(find_min_max([3, -1, 5, 5, 0]))
-print(find_min_max([42]))
-print(find_min_max([-5, -2, -9]))
-print(find_min_max([]))
-print(" ")
-
-print("get_unique_sorted")
-print(get_unique_sorted([3, 1, 2, 1, 3]))
-print(get_unique_sorted([]))
-print(get_unique_sorted([-1, -1, 0, 2, 2]))
-print(get_unique_sorted([1.0, 1, 2.5, 2.5, 0]))
-
-print(" ")
-
-print("flatten_list")
-print(flatten_list([[1, 2], [3, 4]]))
-print(flatten_list([[1, 2], (3, 4, 5)]))
-print(flatten_list([[1], [], [2, 3]]))
-print(flatten_list([[[1, 2], "ab"]]))
+if __name__ == "__main__":
+    print("find_min_max")
+    print(find_min_max([3, -1, 5, 5, 0]))
+    print(find_min_max([42]))
+    print(find_min_max([-5, -2, -9]))
+    print(find_min_max([]))
+    print(" ")
+
+    print("get_unique_sorted")
+    print(get_unique_sorted([3, 1, 2, 1, 3]))
+    print(get_unique_sorted([]))
+    print(get_unique_sorted([-1, -1, 0, 2, 2]))
+    print(get_unique_sorted([1.0, 1, 2.5, 2.5, 0]))
+
+    print(" ")
+
+    print("flatten_list")
+    print(flatten_list([[1, 2], [3, 4]]))
+    print(flatten_list([[1, 2], (3, 4, 5)]))
+    print(flatten_list([[1], [], [2, 3]]))
+    print(flatten_list([[[1, 2], "ab"]]))
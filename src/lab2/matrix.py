@@ -46,23 +46,24 @@ def col_sums(mat):
     return res
 
 
-print("transpose")
-print(transpose([[1, 2, 3]]))
-print(transpose([[1], [2], [3]]))
-print(transpose([[1, 2], [3, 4]]))
-print(transpose([]))
-print(transpose([[1, 2], [3]]))
+if __name__ == "__main__":
+    print("transpose")
+    print(transpose([[1, 2, 3]]))
+    print(transpose([[1], [2], [3]]))
+    print(transpose([[1, 2], [3, 4]]))
+    print(transpose([]))
+    print(transpose([[1, 2], [3]]))
 
-print("................................................... ")
-print("row_sums")
-print(row_sums([[1, 2, 3], [4, 5, 6]]))
-print(row_sums([[-1, 1], [10, -10]]))
-print(row_sums([[0, 0], [0, 0]]))
-print(row_sums([[1, 2], [3]]))
+    print("................................................... ")
+    print("row_sums")
+    print(row_sums([[1, 2, 3], [4, 5, 6]]))
+    print(row_sums([[-1, 1], [10, -10]]))
+    print(row_sums([[0, 0], [0, 0]]))
+    print(row_sums([[1, 2], [3]]))
 
-print("................................................... ")
-print("col_sums")
-print(col_sums([[1, 2, 3], [4, 5, 6]]))
-print(col_sums([[-1, 1], [10, -10]]))
-print(col_sums([[0, 0], [0, 0]]))
-print(col_sums([[1, 2], [3]]))
+    print("................................................... ")
+    print("col_sums")
+    print(col_sums([[1, 2, 3], [4, 5, 6]]))
+    print(col_sums([[-1, 1], [10, -10]]))
+    print(col_sums([[0, 0], [0, 0]]))
+    print(col_sums([[1, 2], [3]]))
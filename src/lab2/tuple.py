@@ -22,8 +22,9 @@ def format_record(s):
     return end
 
 
-print(format_record(("Иванов Иван Иванович", "BIVT-25", 4.6)))
-print(format_record(("Петров Пётр", "IKBO-12", 5.0)))
-print(format_record(("Петров Пётр Петрович", "IKBO-12", 5.0)))
-print(format_record(("  сидорова  анна   сергеевна ", "ABB-01", 3.999)))
-print(format_record(("", "BIVT-25", 3.999)))
+if __name__ == "__main__":
+    print(format_record(("Иванов Иван Иванович", "BIVT-25", 4.6)))
+    print(format_record(("Петров Пётр", "IKBO-12", 5.0)))
+    print(format_record(("Петров Пётр Петрович", "IKBO-12", 5.0)))
+    print(format_record(("  сидорова  анна   сергеевна ", "ABB-01", 3.999)))
+    print(format_record(("", "BIVT-25", 3.999)))
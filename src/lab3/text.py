@@ -1,5 +1,10 @@
+import heapq
 import re
 
+# Во сколько раз словарь должен быть больше n, чтобы top_n выбирал через кучу;
+# держать равным lib.text.HEAP_RATIO
+HEAP_RATIO = 8
+
 
 def normalize(text: str, *, casefold: bool = True, yo2e: bool = True) -> str:
     if yo2e:
@@ -23,30 +28,35 @@ def count_freq(tokens: list[str]) -> dict[str, int]:
 
 
 def top_n(freq: dict[str, int], n: int = 5) -> list[tuple[str, int]]:
+    # при маленьком n частичный выбор через кучу: O(V log n) вместо O(V log V);
+    # порог тот же, что у lib.text.top_n
+    if 0 <= n and n * HEAP_RATIO < len(freq):
+        return heapq.nsmallest(n, freq.items(), key=lambda x: (-x[1], x[0]))
     return sorted(freq.items(), key=lambda x: (-x[1], x[0]))[:n]
 
 
-print("----------------------------------------------")
-print("Тестирование normalize")
-print("----------------------------------------------")
-print(normalize("ПрИвЕт\nМИр\t"))
-print(normalize("ёжик, Ёлка"))
-print(normalize("Hello\r\nWorld"))
-print(normalize("  двойные   пробелы  "))
-print("----------------------------------------------")
-print("Тестирование tokenize")
-print("----------------------------------------------")
-print(tokenize("привет мир"))
-print(tokenize("hello,world!!!"))
-print(tokenize("по-настоящему круто"))
-print(tokenize("2025 год"))
-print(tokenize("emoji 😀 не слово"))
-print("----------------------------------------------")
-print("Тестирование count_freq + top_n")
-print("----------------------------------------------")
-tokens_example = ["a", "b", "a", "c", "b", "a"]
-freq_example = count_freq(tokens_example)
-print(top_n(freq_example, n=2))
-tokens_example_2 = ["bb", "aa", "bb", "aa", "cc"]
-freq_example_2 = count_freq(tokens_example_2)
-print(top_n(freq_example_2, n=2))
+if __name__ == "__main__":
+    print("----------------------------------------------")
+    print("Тестирование normalize")
+    print("----------------------------------------------")
+    print(normalize("ПрИвЕт\nМИр\t"))
+    print(normalize("ёжик, Ёлка"))
+    print(normalize("Hello\r\nWorld"))
+    print(normalize("  двойные   пробелы  "))
+    print("----------------------------------------------")
+    print("Тестирование tokenize")
+    print("----------------------------------------------")
+    print(tokenize("привет мир"))
+    print(tokenize("hello,world!!!"))
+    print(tokenize("по-настоящему круто"))
+    print(tokenize("2025 год"))
+    print(tokenize("emoji 😀 не слово"))
+    print("----------------------------------------------")
+    print("Тестирование count_freq + top_n")
+    print("----------------------------------------------")
+    tokens_example = ["a", "b", "a", "c", "b", "a"]
+    freq_example = count_freq(tokens_example)
+    print(top_n(freq_example, n=2))
+    tokens_example_2 = ["bb", "aa", "bb", "aa", "cc"]
+    freq_example_2 = count_freq(tokens_example_2)
+    print(top_n(freq_example_2, n=2))
@@ -1,8 +1,46 @@
 from lab4.text3 import normalize, tokenize, count_freq, top_n
+from lib.sketch import SpaceSaving
+import argparse
 import sys
 
 
+def print_report(total_words, freq_dict):
+    print(f"Всего слов: {total_words}")
+    print(f"Уникальных слов: {len(freq_dict)}")
+    print("Топ-5:")
+    for word, count in top_n(freq_dict, 5):
+        print(f"{word}:{count}")
+
+
+def approx_main(memory):
+    # поток читается построчно, поэтому подходит и для tail -f (Ctrl+C — отчет)
+    sketch = SpaceSaving.from_memory(memory)
+    try:
+        for line in sys.stdin:
+            sketch.update(count_freq(tokenize(normalize(line))))
+    except KeyboardInterrupt:
+        pass
+
+    if not sketch.total:
+        print("Нет входных данных")
+        return
+
+    print_report(sketch.total, sketch)
+    print(f"Погрешность частот не больше {sketch.max_error}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Статистика слов из stdin")
+    parser.add_argument(
+        "--approx", action="store_true", help="Приближенный подсчет частых слов"
+    )
+    parser.add_argument("--memory", default="64MB", help="Память для --approx")
+    args = parser.parse_args()
+
+    if args.approx:
+        approx_main(args.memory)
+        return
+
     text = sys.stdin.read()
 
     if not text.strip():
@@ -14,13 +52,7 @@ def main():
 
     total_words = len(tokens)
     freq_dict = count_freq(tokens)
-    unique_words = len(freq_dict)
-    top_words = top_n(freq_dict, 5)
-    print(f"Всего слов: {total_words}")
-    print(f"Уникальных слов: {unique_words}")
-    print("Топ-5:")
-    for word, count in top_words:
-        print(f"{word}:{count}")
+    print_report(total_words, freq_dict)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    from .text3 import normalize, tokenize, count_freq
+except ImportError:
+    from text3 import normalize, tokenize, count_freq
+
+INDEX_VERSION = 1
+CHUNK_SIZE = 1 << 20
+# Сколько байт из начала и из конца обработанной части идет в отпечаток
+SAMPLE_SIZE = 64 * 1024
+
+_WHITESPACE = [bytes((b,)) for b in b" \t\n\r\f\v"]
+
+
+def _fingerprint(f, end: int) -> str:
+    """Хеш начала и конца первых end байт файла.
+
+    Полный хеш пришлось бы пересчитывать по всему файлу при каждом запуске,
+    а для дописываемых логов достаточно проверить, что начало и место
+    последней остановки не изменились.
+    """
+    digest = hashlib.sha256(str(end).encode())
+    f.seek(0)
+    digest.update(f.read(min(SAMPLE_SIZE, end)))
+    tail_start = max(0, end - SAMPLE_SIZE)
+    f.seek(tail_start)
+    digest.update(f.read(end - tail_start))
+    return digest.hexdigest()
+
+
+def _count_bytes(data: bytes, encoding: str) -> Dict[str, int]:
+    return count_freq(tokenize(normalize(data.decode(encoding))))
+
+
+def _merge(target: Dict[str, int], part: Dict[str, int]) -> None:
+    for word, cnt in part.items():
+        target[word] = target.get(word, 0) + cnt
+
+
+def load_index(index_path: Union[str, Path]) -> Optional[dict]:
+    """Читает индекс; при отсутствии или повреждении возвращает None."""
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def save_index(index: dict, index_path: Union[str, Path]) -> None:
+    # пишем во временный файл, чтобы прерванный запуск не испортил индекс
+    Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+
+def update_index(
+    path: Union[str, Path], index_path: Union[str, Path], encoding: str = "utf-8"
+) -> Dict[str, int]:
+    """Возвращает частоты слов файла, обрабатывая только дописанные байты.
+
+    В индексе хранятся частоты для уже обработанной части файла (она всегда
+    заканчивается пробельным символом), ее длина, отпечаток содержимого,
+    а также размер и mtime файла. Если начало файла изменилось или файл
+    стал короче, индекс строится заново.
+    """
+    stat = os.stat(path)
+    index = load_index(index_path)
+    counts: Dict[str, int] = {}
+    processed = 0
+    start = None
+
+    with open(path, "rb") as f:
+        if (
+            index is not None
+            and index["encoding"] == encoding
+            and index["processed"] <= stat.st_size
+        ):
+            unchanged = (
+                index["size"] == stat.st_size and index["mtime_ns"] == stat.st_mtime_ns
+            )
+            if unchanged or index["fingerprint"] == _fingerprint(f, index["processed"]):
+                counts = index["counts"]
+                processed = start = index["processed"]
+
+        f.seek(processed)
+        tail = b""
+        while True:
+            block = f.read(CHUNK_SIZE)
+            if not block:
+                break
+            data = tail + block
+            cut = max(data.rfind(space) for space in _WHITESPACE) + 1
+            if not cut:
+                tail = data
+                continue
+            _merge(counts, _count_bytes(data[:cut], encoding))
+            processed += cut
+            tail = data[cut:]
+
+        if processed != start:
+            index = {
+                "version": INDEX_VERSION,
+                "encoding": encoding,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "processed": processed,
+                "fingerprint": _fingerprint(f, processed),
+                "counts": counts,
+            }
+            save_index(index, index_path)
+
+    # Последнее слово может быть еще не дописано, поэтому в индекс оно не идет
+    result = dict(counts)
+    _merge(result, _count_bytes(tail, encoding))
+    return result
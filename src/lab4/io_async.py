@@ -0,0 +1,27 @@
+from pathlib import Path
+from typing import AnyStr, List, Optional, Tuple, Union
+
+try:
+    from .io_txt_csv import read_text, write_csv
+except ImportError:
+    from io_txt_csv import read_text, write_csv
+
+# lib лежит рядом с пакетами лабораторных: src.lib или lib, если src в пути
+try:
+    from ..lib.aio import run_blocking
+except ImportError:
+    from lib.aio import run_blocking
+
+
+async def read_text_async(path: Union[str, Path], encoding: str = "utf-8") -> str:
+    """Асинхронный read_text: чтение идет в общем пуле потоков lib.aio."""
+    return await run_blocking(read_text, path, encoding)
+
+
+async def write_csv_async(
+    rows: List[Union[Tuple[AnyStr, ...], List[AnyStr]]],
+    path: Union[str, Path],
+    header: Optional[Tuple[str, ...]] = None,
+) -> None:
+    """Асинхронный write_csv с теми же проверками и исключениями."""
+    await run_blocking(write_csv, rows, path, header)
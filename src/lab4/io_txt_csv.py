@@ -1,7 +1,12 @@
 from pathlib import Path
+import codecs
 import csv
+import io
+import mmap
 import os
-from typing import List, Tuple, Optional, Union, AnyStr
+from typing import BinaryIO, Iterator, List, Tuple, Optional, Union, AnyStr
+
+CHUNK_SIZE = 1 << 20
 
 
 def read_text(path: Union[str, Path], encoding: str = "utf-8") -> str:
@@ -13,6 +18,59 @@ def read_text(path: Union[str, Path], encoding: str = "utf-8") -> str:
         return "Ошибка изменения кодировки."
 
 
+def iter_text(
+    source: Union[str, Path, BinaryIO],
+    encoding: str = "utf-8",
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[str]:
+    """Читает текст кусками через mmap, не загружая файл целиком.
+
+    Файл отображается в память и декодируется по кускам инкрементальным
+    декодером, поэтому многобайтовый символ на границе куска не рвется.
+    Каналы, сокеты и пустые файлы mmap не поддерживают - их читаем
+    обычным read(). Принимает путь или открытый двоичный файл.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from _iter_decoded(f, decoder, chunk_size)
+    else:
+        yield from _iter_decoded(source, decoder, chunk_size)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_decoded(f: BinaryIO, decoder, chunk_size: int) -> Iterator[str]:
+    try:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError, io.UnsupportedOperation):
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                return
+            text = decoder.decode(block)
+            if text:
+                yield text
+
+    with buffer:
+        view = memoryview(buffer)
+        try:
+            # открытый файл может быть уже частично прочитан
+            for start in range(f.tell(), len(view), chunk_size):
+                chunk = view[start : start + chunk_size]
+                try:
+                    text = decoder.decode(chunk)
+                finally:
+                    # иначе при ошибке декодирования срез, удерживаемый
+                    # трассировкой, не даст закрыть mmap (BufferError)
+                    chunk.release()
+                if text:
+                    yield text
+        finally:
+            view.release()
+
+
 def write_csv(
     rows: List[Union[Tuple[AnyStr, ...], List[AnyStr]]],
     path: Union[str, Path],
@@ -44,10 +102,11 @@ def ensure_parent_dir(path: Union[str, Path]) -> None:
     Path(parent_path).mkdir(parents=True, exist_ok=True)
 
 
-print(read_text(r"C:\Users\1\Documents\GitHub\ulyana\data\input.txt"))
+if __name__ == "__main__":
+    print(read_text(r"C:\Users\1\Documents\GitHub\ulyana\data\input.txt"))
 
-# Запись CSV-файла
-write_csv(
-    [("word", "count"), ("test", 3)],
-    r"C:\Users\1\Documents\GitHub\ulyana\data\check.csv",
-)
+    # Запись CSV-файла
+    write_csv(
+        [("word", "count"), ("test", 3)],
+        r"C:\Users\1\Documents\GitHub\ulyana\data\check.csv",
+    )
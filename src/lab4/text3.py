@@ -1,6 +1,11 @@
+import heapq
 import re
 from collections import Counter
 
+# Во сколько раз словарь должен быть больше n, чтобы top_n выбирал через кучу;
+# держать равным lib.text.HEAP_RATIO
+HEAP_RATIO = 8
+
 
 def normalize(text):
     normalized = text.lower()
@@ -14,6 +19,10 @@ def tokenize(text):
 
 
 def top_n(freq: dict[str, int], n: int = 5) -> list[tuple[str, int]]:
+    # при маленьком n частичный выбор через кучу: O(V log n) вместо O(V log V);
+    # порог тот же, что у lib.text.top_n
+    if 0 <= n and n * HEAP_RATIO < len(freq):
+        return heapq.nsmallest(n, freq.items(), key=lambda x: (-x[1], x[0]))
     return sorted(freq.items(), key=lambda x: (-x[1], x[0]))[:n]
 
 
@@ -1,23 +1,42 @@
-import sys, csv, os
-
-sys.path.append(r"C:\Users\1\Documents\GitHub\ulyana\src")
-from text3 import normalize, tokenize, top_n, count_freq
-from io_txt_csv import read_text, write_csv, ensure_parent_dir
-
-in1 = True
-if in1:
-    print("Режим один файл:")
-
-    path = r"C:\Users\1\Documents\GitHub\ulyana\src\data\input.txt"
-    text = read_text(path)
-    words = tokenize(normalize(text))
-    total_words = len(words)
-    freqs = count_freq(words)
+import sys, csv, os, argparse, glob, time
+from pathlib import Path
+
+try:
+    from ..lib.paths import unique_names
+    from .text3 import normalize, tokenize, count_freq
+    from .io_txt_csv import read_text, write_csv, ensure_parent_dir
+    from .freq_index import update_index
+except ImportError:
+    # Запуск скрипта напрямую: папка src, чтобы пакет lib находился
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from lib.paths import unique_names
+    from text3 import normalize, tokenize, count_freq
+    from io_txt_csv import read_text, write_csv, ensure_parent_dir
+    from freq_index import update_index
+
+# Данные по умолчанию лежат в src/data, независимо от текущей папки
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+INPUT_PATH = str(DATA_DIR / "input.txt")
+OUTPUT_DIR = str(DATA_DIR)
+
+
+def report_one_file(path, output_dir, index_path=None):
+    """Считает частоты слов в файле и пишет report.csv.
+
+    С index_path частоты берутся из индекса, и заново разбираются только
+    байты, дописанные в файл после прошлого запуска.
+    """
+    if index_path:
+        freqs = update_index(path, index_path)
+    else:
+        text = read_text(path)
+        words = tokenize(normalize(text))
+        freqs = count_freq(words)
+    total_words = sum(freqs.values())
     unique_words = len(freqs)
     sorted_words = sorted(freqs.items(), key=lambda x: (-x[1], x[0]))
 
-    output_dir = r"C:\Users\1\Documents\GitHub\ulyana\src\data"
-    ensure_parent_dir(r"C:\Users\1\Documents\GitHub\ulyana\src\data")
+    ensure_parent_dir(os.path.join(output_dir, "report.csv"))
 
     output_path = os.path.join(output_dir, "report.csv")
     with open(output_path, "w", encoding="cp65001", newline="") as f:
@@ -32,6 +51,144 @@ if in1:
         print(i[0], i[1])
 
 
+def _read_timed(path):
+    # read_text возвращает сообщение об ошибке вместо текста, и в пакете
+    # оно посчиталось бы словами отчета: ошибки чтения отдаем отдельно
+    start = time.perf_counter()
+    try:
+        text, error = Path(path).read_text(encoding="utf-8"), None
+    except UnicodeDecodeError:
+        text, error = None, "Ошибка изменения кодировки."
+    except OSError as e:
+        text, error = None, str(e)
+    return text, error, time.perf_counter() - start
+
+
+def _count_timed(text):
+    start = time.perf_counter()
+    freqs = dict(count_freq(tokenize(normalize(text))))
+    return freqs, time.perf_counter() - start
+
+
+def _write_report(freqs, path):
+    start = time.perf_counter()
+    sorted_words = sorted(freqs.items(), key=lambda x: (-x[1], x[0]))
+    write_csv(sorted_words, path, header=("word", "count"))
+    return time.perf_counter() - start
+
+
+def collect_paths(pattern):
+    """Файлы для пакетного режима: все *.txt в папке или файлы по glob-шаблону."""
+    if os.path.isdir(pattern):
+        return sorted(str(p) for p in Path(pattern).glob("*.txt") if p.is_file())
+    return sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+
+
+def report_batch(pattern, output_dir, workers=None, io_workers=8):
+    """Пакетный режим: report_<имя>.csv для каждого файла и общий report.csv.
+
+    Файлы читаются и отчеты пишутся в пуле потоков, а разбор текста идет
+    в пуле процессов. Время каждого этапа по файлам пишется в timings.csv.
+    Файлы, которые не удалось прочитать, в отчеты не попадают.
+    :return: словарь {путь: сообщение об ошибке} для непрочитанных файлов
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from concurrent.futures import as_completed
+
+    paths = collect_paths(pattern)
+    if not paths:
+        print(f"Нет файлов по шаблону: {pattern}")
+        return {}
+
+    ensure_parent_dir(os.path.join(output_dir, "report.csv"))
+    names = dict(zip(paths, unique_names(paths)))
+    timings = {path: [0.0, 0.0, 0.0] for path in paths}
+    failed = {}
+    corpus = {}
+    started = time.perf_counter()
+
+    io_pool = ThreadPoolExecutor(io_workers)
+    cpu_pool = ProcessPoolExecutor(workers)
+    with io_pool, cpu_pool:
+        reads = {io_pool.submit(_read_timed, path): path for path in paths}
+        counts = {}
+        for future in as_completed(reads):
+            path = reads[future]
+            text, error, timings[path][0] = future.result()
+            if error is not None:
+                failed[path] = error
+                del timings[path]
+                continue
+            counts[cpu_pool.submit(_count_timed, text)] = path
+
+        writes = {}
+        for future in as_completed(counts):
+            path = counts[future]
+            freqs, timings[path][1] = future.result()
+            for word, cnt in freqs.items():
+                corpus[word] = corpus.get(word, 0) + cnt
+            out = os.path.join(output_dir, f"report_{names[path]}.csv")
+            writes[io_pool.submit(_write_report, freqs, out)] = path
+
+        for future in as_completed(writes):
+            timings[writes[future]][2] = future.result()
+
+    _write_report(corpus, os.path.join(output_dir, "report.csv"))
+    rows = [
+        (path, f"{r:.4f}", f"{c:.4f}", f"{w:.4f}", f"{r + c + w:.4f}")
+        for path, (r, c, w) in timings.items()
+    ]
+    rows.sort(key=lambda row: -float(row[4]))
+    write_csv(
+        rows,
+        os.path.join(output_dir, "timings.csv"),
+        header=("file", "read_s", "count_s", "write_s", "total_s"),
+    )
+
+    elapsed = time.perf_counter() - started
+    print(f"Файлов: {len(paths)}, время: {elapsed:.2f} c")
+    print(f"Всего слов: {sum(corpus.values())}")
+    print(f"Уникальных слов: {len(corpus)}")
+    print("Самые медленные файлы (чтение, разбор, запись, всего):")
+    for row in rows[:5]:
+        print(*row)
+    if failed:
+        print(f"Не удалось прочитать файлов: {len(failed)}")
+        for path, error in sorted(failed.items()):
+            print(f"  {path}: {error}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Отчет по частоте слов")
+    parser.add_argument("--in", dest="input", default=INPUT_PATH)
+    parser.add_argument("--out-dir", dest="output_dir", default=OUTPUT_DIR)
+    parser.add_argument(
+        "--index",
+        help="Файл индекса частот: при повторном запуске разбираются только "
+        "дописанные в конец файла строки",
+    )
+    parser.add_argument(
+        "--batch", help="Папка или glob-шаблон: отчет по каждому файлу и общий"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Процессов для разбора текста"
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        print("Пакетный режим:")
+        report_batch(args.batch, args.output_dir, args.workers)
+        return
+
+    print("Режим один файл:")
+    report_one_file(args.input, args.output_dir, args.index)
+
+
+if __name__ == "__main__":
+    main()
+
+
 # src/lab4/text_report.py
 
 
@@ -0,0 +1,151 @@
+import glob  # Поиск входных файлов по шаблону
+import importlib  # Конвертеры импортируются только при первом использовании
+import os  # Размеры и время изменения файлов
+import time  # Замер времени пакета
+from pathlib import Path  # Работа с путями файлов
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    from ..lib.paths import unique_names
+except ImportError:
+    from lib.paths import unique_names
+
+# Команда -> (модуль, функция, расширение входа, расширение выхода).
+# Модули загружаются лениво: openpyxl нужен только для csv2xlsx.
+CONVERTERS = {
+    "json2csv": ("json_csv", "json_to_csv", ".json", ".csv"),
+    "csv2json": ("json_csv", "csv_to_json", ".csv", ".json"),
+    "csv2xlsx": ("csv_xlsx", "csv_to_xlsx", ".csv", ".xlsx"),
+    "csv2col": ("columnar", "csv_to_columnar", ".csv", ".col"),
+    "json2col": ("columnar", "json_to_columnar", ".json", ".col"),
+}
+
+# Задание: (команда, входной файл, выходной файл)
+Task = Tuple[str, str, str]
+
+
+def get_converter(cmd: str):
+    """Функция конвертации для команды (импорт модуля при первом вызове)."""
+    module_name, func_name = CONVERTERS[cmd][:2]
+    if __package__:
+        module = importlib.import_module(f".{module_name}", __package__)
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def _read_manifest(manifest: Path, out_dir: Path, suffix: str) -> List[Task]:
+    """
+    Файл-список: одна строка - один входной файл, после табуляции можно
+    указать выходной. Пустые строки и строки с # пропускаются.
+    Относительные пути считаются от папки списка.
+    """
+    base = manifest.parent
+    inputs, outputs = [], []
+    with manifest.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            src, _, dst = line.partition("\t")
+            inputs.append(str(base / src.strip()))
+            outputs.append(str(base / dst.strip()) if dst.strip() else None)
+    names = unique_names(inputs, suffix)
+    return [
+        (src, dst or str(out_dir / name))
+        for src, dst, name in zip(inputs, outputs, names)
+    ]
+
+
+def collect_tasks(cmd: str, source: str, out_dir: str) -> List[Task]:
+    """
+    Задания пакетного режима.
+    :param source: папка (все файлы с входным расширением), glob-шаблон
+        или файл-список (любой файл с другим расширением)
+    :param out_dir: папка для результатов, имя берется от входного файла
+    """
+    in_ext, out_ext = CONVERTERS[cmd][2:]
+    out_path = Path(out_dir)
+    if os.path.isdir(source):
+        paths = sorted(str(p) for p in Path(source).glob(f"*{in_ext}") if p.is_file())
+    elif os.path.isfile(source) and Path(source).suffix.lower() != in_ext:
+        pairs = _read_manifest(Path(source), out_path, out_ext)
+        return [(cmd, src, dst) for src, dst in pairs]
+    else:
+        paths = sorted(
+            p for p in glob.glob(source, recursive=True) if os.path.isfile(p)
+        )
+    names = unique_names(paths, out_ext)
+    return [(cmd, src, str(out_path / name)) for src, name in zip(paths, names)]
+
+
+def is_up_to_date(src: str, dst: str) -> bool:
+    """Результат уже есть и изменен не раньше входного файла."""
+    try:
+        return os.stat(dst).st_mtime_ns >= os.stat(src).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def convert_task(task: Task) -> Tuple[str, int, Optional[str]]:
+    """Выполняет одно задание; ошибка возвращается текстом, а не исключением."""
+    cmd, src, dst = task
+    try:
+        size = os.path.getsize(src)
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+        get_converter(cmd)(src, dst)
+    except Exception as e:
+        return src, 0, f"{type(e).__name__}: {e}"
+    return src, size, None
+
+
+def convert_batch(
+    tasks: Iterable[Task], jobs: Optional[int] = None, force: bool = False
+) -> dict:
+    """
+    Пакетная конвертация в пуле из jobs процессов (jobs=1 - в текущем).
+    Задания, результат которых новее входного файла, пропускаются
+    (force=True - конвертировать все).
+    Возвращает сводку, см. batch_summary.
+    """
+    started = time.perf_counter()
+    tasks = list(tasks)
+    todo = [t for t in tasks if force or not is_up_to_date(t[1], t[2])]
+
+    if jobs == 1 or len(todo) <= 1:
+        results = list(map(convert_task, todo))
+    else:
+        # Пул нужен только здесь, импорт не замедляет запуск остальных команд
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = jobs or os.cpu_count() or 1
+        # Мелкие файлы отдаем пачками, чтобы не платить за пересылку каждого
+        chunksize = max(1, len(todo) // (workers * 4))
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(convert_task, todo, chunksize=chunksize))
+
+    return batch_summary(len(tasks), results, time.perf_counter() - started)
+
+
+def batch_summary(
+    files: int, results: List[Tuple[str, int, Optional[str]]], elapsed: float
+) -> dict:
+    """
+    Сводка пакета: файлы (всего, сконвертировано, пропущено),
+    байты входа, время, файлов и байт в секунду, список ошибок.
+    :param files: сколько заданий было всего, включая пропущенные
+    :param results: результаты convert_task для выполненных заданий
+    """
+    failures = [(src, error) for src, _, error in results if error]
+    converted = len(results) - len(failures)
+    size = sum(size for _, size, _ in results)
+    return {
+        "files": files,
+        "converted": converted,
+        "skipped": files - len(results),
+        "failures": failures,
+        "bytes": size,
+        "seconds": elapsed,
+        "files_per_sec": converted / elapsed if elapsed else 0.0,
+        "bytes_per_sec": size / elapsed if elapsed else 0.0,
+    }
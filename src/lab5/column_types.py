@@ -0,0 +1,162 @@
+import math  # isfinite: 1e400 не помещается в float и в JSON не пишется
+import re  # Регулярные выражения для распознавания чисел и дат
+from datetime import date  # Даты в формате ISO (YYYY-MM-DD)
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Сколько первых строк смотреть при определении типов
+SAMPLE_ROWS = 100
+
+# Числа без ведущих нулей: "007" - скорее код, чем число
+_INT_RE = re.compile(r"^[+-]?(0|[1-9]\d*)$")
+_FLOAT_RE = re.compile(r"^[+-]?((0|[1-9]\d*)(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_BOOLS = {"true": True, "false": False}
+ALL_TYPES = ("bool", "int", "float", "date")
+
+
+def _is_int(value: str) -> bool:
+    return bool(_INT_RE.match(value))
+
+
+def _is_float(value: str) -> bool:
+    return bool(_FLOAT_RE.match(value)) and math.isfinite(float(value))
+
+
+def _is_bool(value: str) -> bool:
+    return value.lower() in _BOOLS
+
+
+def _is_date(value: str) -> bool:
+    if not _DATE_RE.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _to_bool(value: str) -> bool:
+    return _BOOLS[value.lower()]
+
+
+def _to_float(value: str) -> float:
+    # Только конечные числа: float("1e400") и float("nan") дали бы
+    # Infinity/NaN, которых нет в стандартном JSON
+    result = float(value)
+    if not math.isfinite(result):
+        raise ValueError(f"не конечное число: {value}")
+    return result
+
+
+# Типы в порядке проверки: берется первый, которому подходят все значения
+_TYPES = [
+    ("bool", _is_bool, _to_bool),
+    ("int", _is_int, int),
+    ("float", _is_float, _to_float),
+    ("date", _is_date, date.fromisoformat),
+]
+
+
+def infer_column_type(values: Iterable[str], types: Iterable[str] = ALL_TYPES) -> str:
+    """
+    Определяет тип колонки по образцу значений.
+    Пустые строки не учитываются; колонка из одних пустых считается "str".
+    :param types: какие типы допустимы (например, без "date" для JSON)
+    :return: "bool", "int", "float", "date" или "str"
+    """
+    values = [value for value in values if value != ""]
+    if not values:
+        return "str"
+    for name, check, _ in _TYPES:
+        if name in types and all(check(value) for value in values):
+            return name
+    return "str"
+
+
+def make_converter(type_name: str) -> Optional[Callable[[str], Any]]:
+    """
+    Готовит функцию преобразования строки в значение нужного типа.
+    Пустая строка превращается в None, а значение, которое не удалось
+    преобразовать (тип определялся по образцу), остается строкой.
+    Для "str" возвращает None - значения не меняются.
+    """
+    for name, _, parse in _TYPES:
+        if name == type_name:
+            break
+    else:
+        return None
+
+    def convert(value: str) -> Any:
+        if value == "":
+            return None
+        try:
+            return parse(value)
+        except (ValueError, KeyError):
+            return value
+
+    return convert
+
+
+def detect_types(
+    header: List[str], sample: List[List[str]], types: Iterable[str] = ALL_TYPES
+) -> List[str]:
+    """
+    Определяет типы колонок по образцу строк CSV.
+    :param header: заголовок CSV
+    :param sample: первые строки данных
+    :param types: какие типы допустимы
+    :return: список имен типов по колонкам
+    """
+    return [
+        infer_column_type((row[i] for row in sample if i < len(row)), types)
+        for i in range(len(header))
+    ]
+
+
+def narrow_types(
+    rows: Iterable[List[str]], ncols: int, types: Iterable[str] = ALL_TYPES
+) -> List[str]:
+    """
+    Определяет типы колонок по всем строкам за один проход, без образца.
+    Для каждой колонки хранится только список еще возможных типов,
+    поэтому память не зависит от числа строк.
+    :return: список имен типов по колонкам
+    """
+    candidates = [[t for t in _TYPES if t[0] in types] for _ in range(ncols)]
+    seen = [False] * ncols
+    for row in rows:
+        for col_idx, value in enumerate(row[:ncols]):
+            if value != "" and candidates[col_idx]:
+                seen[col_idx] = True
+                candidates[col_idx] = [t for t in candidates[col_idx] if t[1](value)]
+    return [
+        column[0][0] if column and was_seen else "str"
+        for column, was_seen in zip(candidates, seen)
+    ]
+
+
+def make_converters(type_names: List[str]) -> Dict[int, Callable[[str], Any]]:
+    """Номер колонки -> функция преобразования (только нестроковые колонки)."""
+    converters = {}
+    for col_idx, type_name in enumerate(type_names):
+        converter = make_converter(type_name)
+        if converter is not None:
+            converters[col_idx] = converter
+    return converters
+
+
+def infer_converters(
+    header: List[str], sample: List[List[str]], types: Iterable[str] = ALL_TYPES
+) -> Dict[int, Callable[[str], Any]]:
+    """Определяет типы колонок по образцу и сразу готовит преобразователи."""
+    return make_converters(detect_types(header, sample, types))
+
+
+def convert_row(row: List[str], converters: Dict[int, Callable[[str], Any]]) -> list:
+    """Применяет преобразователи колонок к одной строке CSV."""
+    result = list(row)
+    for col_idx, convert in converters.items():
+        if col_idx < len(result):
+            result[col_idx] = convert(result[col_idx])
+    return result
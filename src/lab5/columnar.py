@@ -0,0 +1,324 @@
+import csv  # Чтение исходного CSV
+import json  # Метаданные файла хранятся в JSON
+import mmap  # Отображение файла в память при чтении
+import struct  # Заголовок фиксированного размера
+import sys  # Порядок байт текущей машины
+from array import array  # Компактные типизированные массивы колонок
+from datetime import date  # Колонки дат хранятся как порядковые номера дней
+from pathlib import Path  # Работа с путями файлов
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+try:
+    from .column_types import make_converter, narrow_types
+    from .json_csv import CHUNK_SIZE, _iter_records, check_file_extension
+except ImportError:
+    from column_types import make_converter, narrow_types
+    from json_csv import CHUNK_SIZE, _iter_records, check_file_extension
+
+# Формат файла .col:
+#   заголовок: MAGIC, версия, число строк, длина метаданных (struct _HEADER)
+#   метаданные: JSON с описанием колонок (имя, тип, смещения блоков)
+#   данные: блоки колонок подряд, каждый выровнен на 8 байт
+MAGIC = b"COLF"
+VERSION = 1
+_HEADER = struct.Struct("<4sHxxQI")
+_ALIGN = 8
+
+# Тип колонки -> код элемента array / memoryview
+_ARRAY_CODES = {"int": "q", "float": "d", "bool": "B", "date": "q"}
+
+
+def _pad(size: int) -> int:
+    return -size % _ALIGN
+
+
+class _ColumnBuilder:
+    """Накопитель значений одной колонки при записи."""
+
+    def __init__(self, name: str, type_name: str):
+        self.name = name
+        self.type = type_name
+        self.nulls = array("B")
+        self.has_nulls = False
+        if type_name == "str":
+            self.offsets = array("Q", [0])
+            self.blob = bytearray()
+        elif type_name == "date":
+            self.values = array("q")
+            self.parse = lambda value: date.fromisoformat(value).toordinal()
+        else:
+            self.values = array(_ARRAY_CODES[type_name])
+            self.parse = make_converter(type_name)
+
+    def append(self, value: str) -> None:
+        if self.type == "str":
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+            return
+        if value == "":
+            self.values.append(0)
+            self.nulls.append(1)
+            self.has_nulls = True
+            return
+        try:
+            self.values.append(self.parse(value))
+        except OverflowError:
+            raise ValueError(
+                f"Число {value} в колонке {self.name} не помещается в 64 бита"
+            )
+        self.nulls.append(0)
+
+    def blocks(self) -> Dict[str, memoryview]:
+        # Байтовые представления массивов без копирования
+        if self.type == "str":
+            parts = {"offsets": self.offsets, "strings": self.blob}
+        else:
+            parts = {"values": self.values}
+            if self.has_nulls:
+                parts["nulls"] = self.nulls
+        return {kind: memoryview(part).cast("B") for kind, part in parts.items()}
+
+
+def write_columnar(
+    header: Sequence[str],
+    rows: Callable[[], Iterator[List[str]]],
+    col_path: str,
+) -> int:
+    """
+    Записывает таблицу в колоночный формат .col.
+    :param header: имена колонок
+    :param rows: функция, которая каждый раз заново отдает строки таблицы
+        (нужны два прохода: определение типов и запись)
+    :param col_path: путь к результирующему файлу
+    :return: число записанных строк
+    """
+    header = list(header)
+    # Колонки читаются по имени: одинаковые имена затерли бы друг друга
+    duplicates = sorted({name for name in header if header.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Повторяющиеся имена колонок: {', '.join(duplicates)}")
+    types = narrow_types(rows(), len(header))
+    builders = [_ColumnBuilder(name, t) for name, t in zip(header, types)]
+
+    nrows = 0
+    for row in rows():
+        nrows += 1
+        for col_idx, builder in enumerate(builders):
+            builder.append(row[col_idx] if col_idx < len(row) else "")
+
+    # Сначала раскладываем блоки, чтобы записать смещения в метаданные
+    columns = []
+    data = []
+    position = 0
+    for builder in builders:
+        info = {"name": builder.name, "type": builder.type}
+        for kind, block in builder.blocks().items():
+            info[kind] = [position, block.nbytes]
+            data.append(block)
+            data.append(b"\0" * _pad(block.nbytes))
+            position += block.nbytes + _pad(block.nbytes)
+        columns.append(info)
+
+    meta = json.dumps(
+        {"byteorder": sys.byteorder, "columns": columns}, ensure_ascii=False
+    ).encode("utf-8")
+    with open(col_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, nrows, len(meta)))
+        f.write(meta)
+        f.write(b"\0" * _pad(_HEADER.size + len(meta)))
+        for block in data:
+            f.write(block)
+    return nrows
+
+
+class StrColumn:
+    """Строковая колонка: строки декодируются только при обращении."""
+
+    def __init__(self, offsets: Sequence[int], strings: memoryview):
+        self._offsets = offsets
+        self._strings = strings
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("индекс вне таблицы")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return bytes(self._strings[start:end]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+class ColumnarFile:
+    """
+    Чтение файла .col через mmap.
+    Числовые колонки отдаются как memoryview поверх отображенного файла:
+    сумма или фильтр по колонке не разбирают текст и не копируют данные.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл {path} пуст.")
+        self._view = memoryview(self._mmap)
+        self._views: List[memoryview] = [self._view]
+
+        if len(self._view) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Файл {path} не является файлом .col.")
+        magic, version, self.nrows, meta_len = _HEADER.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Файл {path} не является файлом .col версии {VERSION}.")
+        meta_end = _HEADER.size + meta_len
+        meta = json.loads(bytes(self._view[_HEADER.size : meta_end]).decode("utf-8"))
+        self._data_start = meta_end + _pad(meta_end)
+        self._swap = meta["byteorder"] != sys.byteorder
+        self._columns = {column["name"]: column for column in meta["columns"]}
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def column_type(self, name: str) -> str:
+        return self._columns[name]["type"]
+
+    def _block(self, info: list) -> memoryview:
+        start = self._data_start + info[0]
+        block = self._view[start : start + info[1]]
+        self._views.append(block)
+        return block
+
+    def _typed(self, info: list, code: str):
+        block = self._block(info)
+        if self._swap:
+            # Файл записан на машине с другим порядком байт: нужна копия
+            values = array(code)
+            values.frombytes(block)
+            values.byteswap()
+            return values
+        view = block.cast(code)
+        self._views.append(view)
+        return view
+
+    def column(self, name: str):
+        """
+        Значения колонки: memoryview ('q', 'd' или 'B') для чисел, логических
+        значений и дат (номер дня, date.fromordinal), StrColumn для строк.
+        Пустые ячейки числовых колонок хранятся как 0, см. nulls().
+        """
+        info = self._columns[name]
+        if info["type"] == "str":
+            offsets = self._typed(info["offsets"], "Q")
+            return StrColumn(offsets, self._block(info["strings"]))
+        return self._typed(info["values"], _ARRAY_CODES[info["type"]])
+
+    def nulls(self, name: str) -> Optional[memoryview]:
+        """Маска пустых ячеек (1 - пусто) или None, если пустых нет."""
+        info = self._columns[name]
+        if "nulls" not in info:
+            return None
+        return self._block(info["nulls"])
+
+    def rows(self) -> Iterator[dict]:
+        """Строки таблицы в виде словарей (для проверки и выгрузки)."""
+        columns = []
+        for name in self._columns:
+            values, nulls = self.column(name), self.nulls(name)
+            kind = self.column_type(name)
+            columns.append((name, kind, values, nulls))
+        for index in range(self.nrows):
+            row = {}
+            for name, kind, values, nulls in columns:
+                if nulls is not None and nulls[index]:
+                    row[name] = None
+                elif kind == "bool":
+                    row[name] = bool(values[index])
+                elif kind == "date":
+                    row[name] = date.fromordinal(values[index])
+                else:
+                    row[name] = values[index]
+            yield row
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "ColumnarFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _check_paths(src_path: str, col_path: str, src_ext: str) -> Path:
+    if not check_file_extension(src_path, (src_ext,)):
+        raise ValueError(
+            f"Входной файл '{src_path}' не является {src_ext[1:].upper()}."
+        )
+    if not check_file_extension(col_path, (".col",)):
+        raise ValueError(f"Выходной файл '{col_path}' не является COL.")
+    src_file = Path(src_path)
+    if not src_file.exists():
+        raise FileNotFoundError(f"Файл {src_path} не найден.")
+    return src_file
+
+
+# Функция для преобразования CSV файла в колоночный файл .col
+def csv_to_columnar(csv_path: str, col_path: str) -> int:
+    """
+    Преобразует CSV в колоночный двоичный файл .col.
+    Типы колонок (int, float, bool, дата, строка) определяются по всем строкам.
+    :return: число строк данных
+    """
+    csv_file = _check_paths(csv_path, col_path, ".csv")
+
+    with csv_file.open("r", encoding="utf-8") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise ValueError("CSV-файл пуст.")
+
+    def rows() -> Iterator[List[str]]:
+        with csv_file.open("r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader)
+            yield from reader
+
+    return write_columnar(header, rows, col_path)
+
+
+def _cell(value) -> str:
+    # Так же, как значение записал бы csv.DictWriter в json_to_csv
+    return "" if value is None else str(value)
+
+
+# Функция для преобразования JSON файла в колоночный файл .col
+def json_to_columnar(json_path: str, col_path: str) -> int:
+    """
+    Преобразует JSON (список словарей) в колоночный двоичный файл .col.
+    Колонки - объединение ключей всех записей, как в json_to_csv.
+    :return: число записей
+    """
+    json_file = _check_paths(json_path, col_path, ".json")
+
+    keys = set()
+    for item in _iter_records(json_file, CHUNK_SIZE):
+        keys.update(item.keys())
+    header = sorted(keys)
+
+    def rows() -> Iterator[List[str]]:
+        for item in _iter_records(json_file, CHUNK_SIZE):
+            yield [_cell(item.get(key)) for key in header]
+
+    return write_columnar(header, rows, col_path)
@@ -1,10 +1,20 @@
 import csv  # Импорт библиотеки для работы с CSV файлами
+import time  # Замер времени конвертации
 from pathlib import Path  # Импорт модуля для удобной работы с путями файлов
+from typing import BinaryIO, Iterator, List, Optional
 from openpyxl import Workbook  # Импорт основной библиотеки для работы с Excel файлами
 from openpyxl.utils import (
     get_column_letter,
 )  # Импорт утилиты для перевода индекса столбца в букву Excel
 
+try:
+    from .column_types import SAMPLE_ROWS, convert_row, detect_types, make_converters
+except ImportError:
+    from column_types import SAMPLE_ROWS, convert_row, detect_types, make_converters
+
+# Максимум строк на листе Excel
+EXCEL_MAX_ROWS = 1_048_576
+
 
 # Функция для проверки типа файла по расширению
 def check_file_type(file_path: str, valid_types: tuple) -> bool:
@@ -23,6 +33,8 @@ def csv_to_xlsx(csv_path: str, xlsx_path: str) -> None:
     Первая строка CSV — заголовок.
     Лист называется "Sheet1".
     Колонки — автоширина по длине текста (не менее 8 символов).
+    Если строк больше, чем вмещает лист Excel, данные автоматически
+    разбиваются на листы Sheet1, Sheet2, ... (csv_to_xlsx_split).
     """
 
     # Проверка расширения входящего файла (должен быть .csv)
@@ -53,6 +65,12 @@ def csv_to_xlsx(csv_path: str, xlsx_path: str) -> None:
         # Поднимает ошибку, если файл пуст
         raise ValueError("CSV-файл пуст.")  # [4]
 
+    # Лишние строки Excel молча обрезал бы: делим на несколько листов
+    if len(data) > EXCEL_MAX_ROWS:
+        del data
+        csv_to_xlsx_split(csv_path, xlsx_path, max_rows=EXCEL_MAX_ROWS)
+        return
+
     # Создание нового рабочего документа Excel
     workbook = Workbook()  # [5]
     # Получение активного листа
@@ -80,6 +98,246 @@ def csv_to_xlsx(csv_path: str, xlsx_path: str) -> None:
     workbook.save(xlsx_path)  # [12]
 
 
+# Потоковый вариант csv_to_xlsx для больших CSV
+def csv_to_xlsx_stream(
+    csv_path: str,
+    xlsx_path: str,
+    infer_types: bool = False,
+    sample_rows: int = SAMPLE_ROWS,
+) -> None:
+    """
+    Конвертирует CSV в XLSX в режиме write-only openpyxl.
+    Строки пишутся в файл по мере чтения, объекты ячеек в памяти не копятся.
+    Лист называется "Sheet1", ширина колонок такая же, как у csv_to_xlsx
+    (по длине текста, не менее 8 символов). Слишком длинный для одного
+    листа CSV, как и в csv_to_xlsx, разбивается на листы.
+    С infer_types типы колонок определяются по первым sample_rows строкам
+    данных, и числа, true/false и даты YYYY-MM-DD пишутся как значения
+    Excel, а не как текст.
+    """
+
+    # Те же проверки, что и в csv_to_xlsx
+    if not check_file_type(csv_path, (".csv",)):
+        raise ValueError(f"Входной файл '{csv_path}' не является CSV.")
+
+    if not check_file_type(xlsx_path, (".xlsx",)):
+        raise ValueError(f"Выходной файл '{xlsx_path}' не является XLSX.")
+
+    csv_file = Path(csv_path)
+
+    if not csv_file.exists():
+        raise FileNotFoundError(f"Файл {csv_path} не найден.")
+
+    # В write-only режиме ширину колонок нужно задать до первой строки,
+    # поэтому сначала быстрый проход: только разбор CSV и длины значений
+    widths = []
+    row_count = 0
+    sample = []
+    with csv_file.open("r", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            row_count += 1
+            if 1 < row_count <= sample_rows + 1:
+                sample.append(row)
+            if len(row) > len(widths):
+                widths.extend([0] * (len(row) - len(widths)))
+            for col_idx, value in enumerate(row):
+                if len(value) > widths[col_idx]:
+                    widths[col_idx] = len(value)
+
+    if not row_count:
+        raise ValueError("CSV-файл пуст.")
+
+    if row_count > EXCEL_MAX_ROWS:
+        csv_to_xlsx_split(
+            csv_path,
+            xlsx_path,
+            max_rows=EXCEL_MAX_ROWS,
+            infer_types=infer_types,
+            sample_rows=sample_rows,
+        )
+        return
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    for col_idx, max_length in enumerate(widths, 1):
+        sheet.column_dimensions[get_column_letter(col_idx)].width = max(
+            max_length + 2, 8
+        )
+
+    # Второй проход: строки сразу уходят в файл
+    with csv_file.open("r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        sheet.append(header)
+        converters = {}
+        if infer_types:
+            converters = make_converters(detect_types(header, sample))
+        for row in reader:
+            sheet.append(convert_row(row, converters) if converters else row)
+
+    workbook.save(xlsx_path)
+
+
+def _iter_lines(
+    f: BinaryIO, offset: List[int], end: Optional[int] = None
+) -> Iterator[str]:
+    # Строки файла с учетом байтового смещения: после каждой строки,
+    # выданной csv.reader, offset[0] указывает на начало следующей
+    f.seek(offset[0])
+    while end is None or offset[0] < end:
+        line = f.readline()
+        if not line:
+            return
+        offset[0] += len(line)
+        yield line.decode("utf-8")
+
+
+def _scan_parts(csv_file: Path, rows_per_part: int, sample_rows: int = 0):
+    """
+    Один проход по CSV: заголовок и части по rows_per_part строк данных.
+    Для каждой части запоминаются байтовые границы и ширины колонок,
+    а первые sample_rows строк данных сохраняются для определения типов.
+    """
+    with csv_file.open("rb") as f:
+        offset = [0]
+        reader = csv.reader(_iter_lines(f, offset))
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV-файл пуст.")
+        header_widths = [len(value) for value in header]
+
+        parts = []
+        part = None
+        sample = []
+        row_start = offset[0]
+        for row in reader:
+            if len(sample) < sample_rows:
+                sample.append(row)
+            if part is None or part["rows"] == rows_per_part:
+                part = {"start": row_start, "rows": 0}
+                part["widths"] = list(header_widths)
+                parts.append(part)
+            row_start = offset[0]
+            part["rows"] += 1
+            part["end"] = offset[0]
+            widths = part["widths"]
+            if len(row) > len(widths):
+                widths.extend([0] * (len(row) - len(widths)))
+            for col_idx, value in enumerate(row):
+                if len(value) > widths[col_idx]:
+                    widths[col_idx] = len(value)
+    return header, parts, sample
+
+
+def _fill_sheet(
+    sheet, csv_path: str, header: list, part: dict, type_names: List[str]
+) -> None:
+    for col_idx, max_length in enumerate(part["widths"], 1):
+        sheet.column_dimensions[get_column_letter(col_idx)].width = max(
+            max_length + 2, 8
+        )
+    # Заголовок повторяется на каждом листе
+    sheet.append(header)
+    converters = make_converters(type_names)
+    with open(csv_path, "rb") as f:
+        lines = _iter_lines(f, [part["start"]], part["end"])
+        for row in csv.reader(lines):
+            sheet.append(convert_row(row, converters) if converters else row)
+
+
+def _write_part_file(args) -> str:
+    csv_path, header, part, type_names, xlsx_path = args
+    workbook = Workbook(write_only=True)
+    _fill_sheet(workbook.create_sheet("Sheet1"), csv_path, header, part, type_names)
+    workbook.save(xlsx_path)
+    return xlsx_path
+
+
+# Конвертация CSV, который не помещается на один лист Excel
+def csv_to_xlsx_split(
+    csv_path: str,
+    xlsx_path: str,
+    mode: str = "sheets",
+    max_rows: int = EXCEL_MAX_ROWS,
+    workers: Optional[int] = None,
+    infer_types: bool = False,
+    sample_rows: int = SAMPLE_ROWS,
+) -> dict:
+    """
+    Конвертирует CSV в XLSX, разбивая данные на части по max_rows строк
+    (вместе с заголовком, который повторяется в каждой части).
+    mode="sheets" - листы Sheet1, Sheet2, ... в одной книге xlsx_path;
+    mode="files" - отдельные книги name_1.xlsx, name_2.xlsx, ...,
+    которые собираются параллельно в workers процессах.
+    infer_types - как в csv_to_xlsx_stream.
+    Возвращает статистику: строки, части, файлы, время и строк в секунду.
+    """
+
+    if not check_file_type(csv_path, (".csv",)):
+        raise ValueError(f"Входной файл '{csv_path}' не является CSV.")
+
+    if not check_file_type(xlsx_path, (".xlsx",)):
+        raise ValueError(f"Выходной файл '{xlsx_path}' не является XLSX.")
+
+    if mode not in ("sheets", "files"):
+        raise ValueError(f"Неизвестный режим разбиения: {mode}")
+
+    if not 2 <= max_rows <= EXCEL_MAX_ROWS:
+        raise ValueError(f"max_rows должен быть от 2 до {EXCEL_MAX_ROWS}")
+
+    csv_file = Path(csv_path)
+
+    if not csv_file.exists():
+        raise FileNotFoundError(f"Файл {csv_path} не найден.")
+
+    started = time.perf_counter()
+    header, parts, sample = _scan_parts(
+        csv_file, max_rows - 1, sample_rows if infer_types else 0
+    )
+    # В процессы передаются имена типов: функции-преобразователи не сериализуются
+    type_names = detect_types(header, sample) if infer_types else []
+    if not parts:
+        # Только заголовок: одна часть без данных
+        end = csv_file.stat().st_size
+        parts = [{"start": end, "end": end, "rows": 0}]
+        parts[0]["widths"] = [len(value) for value in header]
+
+    if mode == "sheets":
+        workbook = Workbook(write_only=True)
+        for number, part in enumerate(parts, 1):
+            sheet = workbook.create_sheet(f"Sheet{number}")
+            _fill_sheet(sheet, csv_path, header, part, type_names)
+        workbook.save(xlsx_path)
+        outputs = [xlsx_path]
+    else:
+        # Пул процессов нужен только здесь: не импортируем его при запуске
+        from concurrent.futures import ProcessPoolExecutor
+
+        target = Path(xlsx_path)
+        jobs = [
+            (
+                csv_path,
+                header,
+                part,
+                type_names,
+                str(target.with_name(f"{target.stem}_{n}.xlsx")),
+            )
+            for n, part in enumerate(parts, 1)
+        ]
+        with ProcessPoolExecutor(workers) as pool:
+            outputs = list(pool.map(_write_part_file, jobs))
+
+    elapsed = time.perf_counter() - started
+    rows = sum(part["rows"] for part in parts)
+    return {
+        "rows": rows,
+        "parts": len(parts),
+        "outputs": outputs,
+        "seconds": elapsed,
+        "rows_per_sec": rows / elapsed if elapsed else 0.0,
+    }
+
+
 # Основной код программы
 if __name__ == "__main__":
     # Примеры использования функции
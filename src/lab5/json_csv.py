@@ -1,6 +1,19 @@
 import json  # Импортируем библиотеку для работы с JSON файлами
 import csv  # Импортируем библиотеку для работы с CSV файлами
+import itertools  # chain: вернуть первую прочитанную строку в поток
+import os  # Нужен для атомарной замены итогового файла
+import re  # Хвост числа у конца буфера при потоковом чтении
 from pathlib import Path  # Используем модуль Path для удобной работы с путями файлов
+from typing import IO, Any, Iterator, List, Optional, Sequence, Union
+
+# Размер куска, которым читается JSON в потоковом режиме
+CHUNK_SIZE = 64 * 1024
+
+# Ошибка разбора не дальше этого от конца буфера может означать, что значение
+# обрезано (например, "tru" или "-Infin"), и его нужно дочитать
+_CUT_MARGIN = 16
+_NUMBER_START = "-0123456789"
+_NUMBER_TAIL = re.compile(r"[-+.eE0-9]*")
 
 
 # Функция для проверки расширения файла
@@ -67,6 +80,196 @@ def json_to_csv(json_path: str, csv_path: str) -> None:
         writer.writerows(data)  # [7]
 
 
+class _JsonArrayReader:
+    """Читает элементы JSON-массива верхнего уровня по одному."""
+
+    def __init__(self, f: IO[str], chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        # Положение начала буфера в файле: смещение, число строк до него
+        # и смещение начала строки, в которой он начинается
+        self.offset = 0
+        self.lines = 0
+        self.line_start = 0
+
+    def _fill(self, size: int) -> bool:
+        # Дочитывает данные; уже разобранное начало буфера отбрасывается
+        if self.eof:
+            return False
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        newlines = self.buf.count("\n", 0, self.pos)
+        if newlines:
+            self.lines += newlines
+            self.line_start = self.offset + self.buf.rindex("\n", 0, self.pos) + 1
+        self.offset += self.pos
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self) -> str:
+        # Пропускает пробелы и возвращает следующий символ ("" в конце файла)
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill(self.chunk_size):
+                return self.buf[self.pos : self.pos + 1]
+
+    def _relocate(self, err: json.JSONDecodeError) -> json.JSONDecodeError:
+        # Переводит позицию ошибки внутри буфера в позицию в файле
+        pos = self.offset + err.pos
+        lineno = self.lines + err.lineno
+        colno = pos - self.line_start + 1 if err.lineno == 1 else err.colno
+        err.pos, err.lineno, err.colno = pos, lineno, colno
+        err.args = (f"{err.msg}: line {lineno} column {colno} (char {pos})",)
+        return err
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return self._relocate(json.JSONDecodeError(message, self.buf, self.pos))
+
+    def __iter__(self) -> Iterator[Any]:
+        first = self._peek()
+        if first != "[":
+            # Не массив: разбираем целиком, чтобы ошибка была той же, что у json.load
+            try:
+                json.loads(self.buf + self.f.read())
+            except json.JSONDecodeError as e:
+                raise self._relocate(e)
+            raise ValueError("JSON должен содержать список словарей.")
+        self.pos += 1
+        if self._peek() == "]":
+            self.pos += 1
+            return self._check_end()
+        while True:
+            yield self._decode_value()
+            sep = self._peek()
+            if sep == "]":
+                self.pos += 1
+                return self._check_end()
+            if sep != ",":
+                raise self._error("Expecting ',' delimiter")
+            self.pos += 1
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Элемент мог не поместиться в буфер: дочитываем все большими
+                # кусками, чтобы большой объект не разбирался много раз.
+                # Ошибка далеко от конца буфера - битый JSON, дочитывать незачем
+                cut = e.pos >= len(self.buf) - _CUT_MARGIN or e.msg.startswith(
+                    "Unterminated string"
+                )
+                if not (cut and self._fill(size)):
+                    raise self._relocate(e)
+                size *= 2
+                continue
+            # Число у конца буфера могло быть обрезано: "12" вместо "12345"
+            if (
+                self.buf[self.pos] in _NUMBER_START
+                and _NUMBER_TAIL.match(self.buf, end).end() == len(self.buf)
+                and self._fill(size)
+            ):
+                size *= 2
+                continue
+            self.pos = end
+            return value
+
+    def _check_end(self) -> None:
+        if self._peek():
+            raise self._error("Extra data")
+
+
+def iter_json_array(f: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Потоково выдает элементы JSON-массива из открытого файла.
+    В памяти держится только текущий элемент и кусок текста.
+    :param f: открытый текстовый файл
+    :param chunk_size: размер куска чтения в символах
+    """
+    return iter(_JsonArrayReader(f, chunk_size))
+
+
+def _iter_records(json_file: Path, chunk_size: int) -> Iterator[dict]:
+    with json_file.open("r", encoding="utf-8") as f:
+        for item in iter_json_array(f, chunk_size):
+            if not isinstance(item, dict):
+                raise ValueError("JSON должен содержать список словарей.")
+            yield item
+
+
+# Потоковый вариант json_to_csv для больших файлов
+def json_to_csv_stream(
+    json_path: str,
+    csv_path: str,
+    header: Union[str, Sequence[str]] = "prescan",
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Преобразует JSON в CSV, не загружая весь массив в память.
+    :param json_path: путь к исходному JSON файлу
+    :param csv_path: путь к результирующему CSV файлу
+    :param header: как получить заголовок:
+        "prescan" - быстрый первый проход собирает только ключи
+        (результат такой же, как у json_to_csv);
+        "first" - ключи первой записи;
+        список строк - заданный пользователем заголовок
+    :param chunk_size: размер куска чтения в символах
+    """
+
+    # Те же проверки, что и в json_to_csv
+    if not check_file_extension(json_path, (".json",)):
+        raise ValueError(f"Входной файл '{json_path}' не является JSON.")
+
+    if not check_file_extension(csv_path, (".csv",)):
+        raise ValueError(f"Выходной файл '{csv_path}' не является CSV.")
+
+    json_file = Path(json_path)
+
+    if not json_file.exists():
+        raise FileNotFoundError(f"Файл {json_path} не найден.")
+
+    records = _iter_records(json_file, chunk_size)
+    first = None
+    if header == "prescan":
+        keys = set()
+        for item in records:
+            keys.update(item.keys())
+        headers: List[str] = sorted(keys)
+        records = _iter_records(json_file, chunk_size)
+    elif header == "first":
+        first = next(records, None)
+        headers = sorted(first.keys()) if first is not None else []
+    elif isinstance(header, str):
+        raise ValueError(f"Неизвестный способ получить заголовок: {header}")
+    else:
+        headers = list(header)
+
+    # Пишем во временный файл: при ошибке в середине не остается недописанный CSV
+    tmp_path = f"{csv_path}.tmp"
+    try:
+        with Path(tmp_path).open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            if first is not None:
+                writer.writerow(first)
+            for item in records:
+                writer.writerow(item)
+        os.replace(tmp_path, csv_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 # Функция для преобразования CSV файла в JSON файл
 def csv_to_json(csv_path: str, json_path: str) -> None:
     """
@@ -109,6 +312,108 @@ def csv_to_json(csv_path: str, json_path: str) -> None:
         json.dump(data, f, ensure_ascii=False, indent=2)  # [12]
 
 
+# Потоковый вариант csv_to_json для больших файлов
+def csv_to_json_stream(
+    csv_path: str,
+    json_path: str,
+    indent: Union[int, None] = 2,
+    lines: bool = False,
+    infer_types: bool = False,
+    sample_rows: Optional[int] = None,
+) -> None:
+    """
+    Преобразует CSV в JSON, записывая строки по одной, без списка в памяти.
+    :param csv_path: путь к исходному CSV файлу
+    :param json_path: путь к результирующему JSON файлу
+    :param indent: отступ; при indent=2 результат совпадает с csv_to_json,
+        None - компактный JSON в одну строку
+    :param lines: True - формат JSON Lines (одна запись в строке, без массива)
+    :param infer_types: определить типы колонок по первым sample_rows строкам
+        (по умолчанию column_types.SAMPLE_ROWS) и писать числа и true/false
+        как JSON-числа и логические значения, а пустые ячейки таких
+        колонок - как null
+    """
+
+    # Те же проверки, что и в csv_to_json; для JSON Lines допустимы и .jsonl/.ndjson
+    if not check_file_extension(csv_path, (".csv",)):
+        raise ValueError(f"Входной файл '{csv_path}' не является CSV.")
+
+    json_extensions = (".json", ".jsonl", ".ndjson") if lines else (".json",)
+    if not check_file_extension(json_path, json_extensions):
+        raise ValueError(f"Выходной файл '{json_path}' не является JSON.")
+
+    csv_file = Path(csv_path)
+
+    if not csv_file.exists():
+        raise FileNotFoundError(f"Файл {csv_path} не найден.")
+
+    with csv_file.open("r", encoding="utf-8") as src:
+        reader = csv.DictReader(src)
+        first = next(reader, None)
+
+        # Проверяем наличие данных до создания выходного файла
+        if first is None:
+            raise ValueError("CSV-файл пуст.")
+        rows = itertools.chain([first], reader)
+        if infer_types:
+            rows = _typed_rows(rows, reader.fieldnames, sample_rows)
+
+        with Path(json_path).open("w", encoding="utf-8") as f:
+            if lines:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False))
+                    f.write("\n")
+                return
+
+            if indent is None:
+                # Как json.dump без indent: [{...}, {...}]
+                f.write("[")
+                sep = ""
+                for row in rows:
+                    f.write(sep)
+                    f.write(json.dumps(row, ensure_ascii=False))
+                    sep = ", "
+                f.write("]")
+                return
+
+            # Как json.dump с indent: каждая запись сдвинута на один уровень
+            pad = " " * indent
+            f.write("[\n")
+            sep = ""
+            for row in rows:
+                text = json.dumps(row, ensure_ascii=False, indent=indent)
+                f.write(sep)
+                f.write(pad + text.replace("\n", "\n" + pad))
+                sep = ",\n"
+            f.write("\n]")
+
+
+def _typed_rows(
+    rows: Iterator[dict], fieldnames: List[str], sample_rows: Optional[int]
+) -> Iterator[dict]:
+    # column_types импортируется только с infer_types: json2csv и csv2json
+    # без типов не платят за него при запуске
+    try:
+        from .column_types import SAMPLE_ROWS, infer_converters
+    except ImportError:
+        from column_types import SAMPLE_ROWS, infer_converters
+
+    if sample_rows is None:
+        sample_rows = SAMPLE_ROWS
+    # Типы определяются один раз по образцу, дальше только преобразование.
+    # Даты в JSON остаются строками: отдельного типа для них там нет
+    sample = list(itertools.islice(rows, sample_rows))
+    values = [[row.get(name) or "" for name in fieldnames] for row in sample]
+    converters = infer_converters(fieldnames, values, ("bool", "int", "float"))
+    named = [(fieldnames[col_idx], conv) for col_idx, conv in converters.items()]
+    for row in itertools.chain(sample, rows):
+        for name, convert in named:
+            value = row.get(name)
+            if value is not None:
+                row[name] = convert(value)
+        yield row
+
+
 # Основная секция программы
 if __name__ == "__main__":
     # Выполняем преобразование JSON->CSV и CSV->JSON
@@ -0,0 +1,50 @@
+import asyncio  # Одновременная конвертация многих файлов
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    from .json_csv import csv_to_json, json_to_csv
+except ImportError:
+    from json_csv import csv_to_json, json_to_csv
+
+# lib лежит рядом с пакетами лабораторных: src.lib или lib, если src в пути
+try:
+    from ..lib import aio
+    from ..lib.aio import run_blocking
+except ImportError:
+    from lib import aio
+    from lib.aio import run_blocking
+
+
+async def json_to_csv_async(json_path: str, csv_path: str) -> None:
+    """Асинхронный json_to_csv: те же проверки и исключения."""
+    await run_blocking(json_to_csv, json_path, csv_path)
+
+
+async def csv_to_json_async(csv_path: str, json_path: str) -> None:
+    """Асинхронный csv_to_json: те же проверки и исключения."""
+    await run_blocking(csv_to_json, csv_path, json_path)
+
+
+async def convert_many_async(
+    pairs: Iterable[Tuple[str, str]], to_json: bool = True
+) -> List[Optional[BaseException]]:
+    """
+    Конвертирует много файлов одновременно (сколько именно - ограничивает
+    пул lib.aio). Ошибка одного файла не прерывает остальные.
+    :param pairs: пары (входной файл, выходной файл)
+    :param to_json: True - CSV → JSON, False - JSON → CSV
+    :return: для каждой пары None или исключение
+    """
+    convert = csv_to_json_async if to_json else json_to_csv_async
+    # Не больше заданий в полете, чем потоков в пуле: остальные ждут здесь,
+    # а не в очереди пула, и цикл событий не разбирает тысячи ответов разом
+    limit = asyncio.Semaphore(aio.IO_WORKERS)
+
+    async def limited(src: str, dst: str) -> None:
+        async with limit:
+            await convert(src, dst)
+
+    results = await asyncio.gather(
+        *(limited(src, dst) for src, dst in pairs), return_exceptions=True
+    )
+    return [result if isinstance(result, BaseException) else None for result in results]
@@ -1,16 +1,88 @@
 import sys
+import os
 import argparse
-from lib import csv_to_xlsx, json_to_csv, csv_to_json
+
+# Папка src, чтобы пакет lab5 находился при запуске скрипта напрямую
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Конвертеры импортируются лениво (get_converter): json2csv не должен
+# платить за импорт openpyxl, который нужен только csv2xlsx
+from lab5.batch import collect_tasks, convert_batch, get_converter
 from ex1 import check_file
 
 
-def main():
-    # Настройка парсера аргументов
+def convert_xlsx(args):
+    """csv2xlsx: обычная конвертация или с разбиением на части"""
+    if not args.split:
+        get_converter("csv2xlsx")(args.input, args.output)
+        return
+
+    from lab5.csv_xlsx import csv_to_xlsx_split
+
+    options = {"mode": args.split, "workers": args.workers}
+    if args.max_rows:
+        options["max_rows"] = args.max_rows
+    print_split_stats(csv_to_xlsx_split(args.input, args.output, **options))
+
+
+def print_split_stats(stats):
+    """Итоги csv2xlsx --split (их же печатает клиент демона)"""
+    print(
+        f"Строк: {stats['rows']}, частей: {stats['parts']}, "
+        f"время: {stats['seconds']:.2f} c, "
+        f"скорость: {stats['rows_per_sec']:.0f} строк/с"
+    )
+    for path in stats["outputs"]:
+        print(path)
+
+
+def convert_many(args):
+    """Пакетный режим: --in - папка, glob-шаблон или файл-список, --out - папка"""
+    tasks = collect_tasks(args.cmd, args.input, args.output)
+    if not tasks:
+        print(f"Нет файлов: {args.input}")
+        sys.exit(1)
+
+    print_batch_stats(convert_batch(tasks, jobs=args.jobs, force=args.force))
+
+
+def print_batch_stats(stats):
+    """Сводка пакетного режима; при ошибках код выхода 1"""
+    print(
+        f"Файлов: {stats['files']}, сконвертировано: {stats['converted']}, "
+        f"пропущено (актуальны): {stats['skipped']}, "
+        f"ошибок: {len(stats['failures'])}"
+    )
+    print(
+        f"Время: {stats['seconds']:.2f} c, "
+        f"{stats['files_per_sec']:.1f} файлов/с, "
+        f"{stats['bytes_per_sec'] / 1e6:.2f} МБ/с"
+    )
+    for path, error in stats["failures"]:
+        print(f"Ошибка: {path}: {error}")
+    if stats["failures"]:
+        sys.exit(1)
+
+
+def positive_int(value):
+    """Тип аргумента: целое число больше 0 (число процессов пула)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается целое число: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"должно быть больше 0: {value}")
+    return number
+
+
+def build_parser():
+    """Парсер аргументов (его же использует клиент демона)"""
     parser = argparse.ArgumentParser(description="Конвертер данных")
     commands = parser.add_subparsers(dest="cmd", required=True)
 
     # Создаем команды
-    cmd_list = ["json2csv", "csv2json", "csv2xlsx"]
+    # csv2col и json2col пишут колоночный двоичный формат .col (lab5/columnar.py)
+    cmd_list = ["json2csv", "csv2json", "csv2xlsx", "csv2col", "json2col"]
 
     for cmd in cmd_list:
         # Создаем парсер для каждой команды
@@ -21,25 +93,63 @@ def main():
         cmd_parser.add_argument(
             "--out", dest="output", required=True, help="Выходной файл"
         )
+        # Пакетный режим: один запуск на много файлов вместо запуска на каждый
+        cmd_parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="--in - папка, glob-шаблон или файл-список, --out - папка",
+        )
+        cmd_parser.add_argument(
+            "--jobs", type=positive_int, default=None, help="Процессов для --batch"
+        )
+        cmd_parser.add_argument(
+            "--force",
+            action="store_true",
+            help="В --batch конвертировать и файлы с актуальным результатом",
+        )
+        if cmd == "csv2xlsx":
+            # Excel вмещает 1 048 576 строк на лист: большие CSV нужно делить
+            cmd_parser.add_argument(
+                "--split",
+                choices=["sheets", "files"],
+                help="Делить данные на листы Sheet1, Sheet2, ... или на файлы",
+            )
+            cmd_parser.add_argument(
+                "--max-rows", type=int, default=None, help="Строк в одной части"
+            )
+            cmd_parser.add_argument(
+                "--workers",
+                type=positive_int,
+                default=None,
+                help="Процессов для --split files",
+            )
+    return parser
 
+
+def main():
     # Получаем аргументы
+    parser = build_parser()
     args = parser.parse_args()
 
+    if args.batch:
+        if getattr(args, "split", None):
+            parser.error("--split нельзя использовать вместе с --batch")
+        convert_many(args)
+        return
+
     # Проверяем входной файл
     if not check_file(args.input):
         print(f"Ошибка: Файл {args.input} не существует")
         sys.exit(1)
 
-    # Выбираем действие
-    actions = {
-        "json2csv": lambda: json_to_csv(args.input, args.output),
-        "csv2json": lambda: csv_to_json(args.input, args.output),
-        "csv2xlsx": lambda: csv_to_xlsx(args.input, args.output),
-    }
+    # Выбираем действие: у csv2xlsx есть разбиение на части, остальные
+    # команды просто вызывают свою функцию конвертации
+    actions = {"csv2xlsx": lambda: convert_xlsx(args)}
+    default = lambda: get_converter(args.cmd)(args.input, args.output)
 
     # Выполняем команду
     try:
-        actions[args.cmd]()
+        actions.get(args.cmd, default)()
         print(f"Успешно: {args.cmd}")
     except Exception as e:
         print(f"Ошибка конвертации: {e}")
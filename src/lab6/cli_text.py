@@ -1,7 +1,10 @@
 import sys
 import os
 import argparse
-from lib import stats_text
+
+# Папка src, чтобы пакет lib находился при запуске скрипта напрямую
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib import stats_text, print_stats, count_freq_parallel, count_freq_approx
 
 
 def check_file(file_path):
@@ -29,7 +32,7 @@ def show_file_content(file_path, show_numbers=False):
         sys.exit(1)
 
 
-def analyze_file(file_path, top_words=5):
+def analyze_file(file_path, top_words=5, workers=1, approx=False, memory="64MB"):
     """Анализирует частоту слов в файле"""
     if not check_file(file_path):
         return
@@ -38,7 +41,27 @@ def analyze_file(file_path, top_words=5):
         print("Ошибка: --top должен быть больше 0", file=sys.stderr)
         sys.exit(1)
 
+    if workers <= 0:
+        print("Ошибка: --workers должен быть больше 0", file=sys.stderr)
+        sys.exit(1)
+
+    if approx and workers > 1:
+        print("Ошибка: --approx нельзя совмещать с --workers", file=sys.stderr)
+        sys.exit(1)
+
     try:
+        if approx:
+            with open(file_path, "r", encoding="utf-8") as file:
+                sketch = count_freq_approx(file, memory)
+            print_stats(sketch, top_words)
+            print(
+                f"Приближенный подсчет: до {sketch.capacity} слов в памяти, "
+                f"погрешность частот не больше {sketch.max_error}"
+            )
+            return
+        if workers > 1:
+            print_stats(count_freq_parallel(file_path, workers), top_words)
+            return
         with open(file_path, "r", encoding="utf-8") as file:
             text = file.read()
             stats_text(text, top_words)
@@ -47,8 +70,8 @@ def analyze_file(file_path, top_words=5):
         sys.exit(1)
 
 
-def main():
-    """Главная функция"""
+def build_parser():
+    """Парсер аргументов (его же использует клиент демона)"""
     parser = argparse.ArgumentParser(description="Утилита для работы с текстом")
 
     # Создаем подкоманды
@@ -63,15 +86,30 @@ def main():
     stats_cmd = subparsers.add_parser("stats", help="Статистика слов")
     stats_cmd.add_argument("--input", required=True, help="Путь к файлу")
     stats_cmd.add_argument("--top", type=int, default=5, help="Количество топ-слов")
+    stats_cmd.add_argument(
+        "--workers", type=int, default=1, help="Количество процессов для подсчета"
+    )
+    stats_cmd.add_argument(
+        "--approx", action="store_true", help="Приближенный подсчет частых слов"
+    )
+    stats_cmd.add_argument(
+        "--memory", default="64MB", help="Память для --approx, например 64MB"
+    )
+
+    return parser
+
 
+def main():
+    """Главная функция"""
     # Разбираем аргументы
+    parser = build_parser()
     args = parser.parse_args()
 
     # Выполняем команды
     if args.command == "cat":
         show_file_content(args.input, args.n)
     elif args.command == "stats":
-        analyze_file(args.input, args.top)
+        analyze_file(args.input, args.top, args.workers, args.approx, args.memory)
     else:
         parser.print_help()
 
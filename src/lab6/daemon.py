@@ -0,0 +1,405 @@
+"""Демон конвертации и статистики текста с JSON API на Unix-сокете.
+
+Каждый вызов cli_convert.py / cli_text.py - новый процесс, который заново
+запускает интерпретатор и импортирует модули. Демон держит их загруженными
+в пуле процессов и принимает задания через Unix-сокет: одна строка JSON -
+запрос, одна строка JSON - ответ {"ok": true, "result": ...} или
+{"ok": false, "error": "..."}.
+
+Запуск и клиент (аргументы такие же, как у cli_convert.py и cli_text.py):
+    python src/lab6/daemon.py serve --workers 4 &
+    python src/lab6/daemon.py convert csv2json --in a.csv --out a.json
+    python src/lab6/daemon.py text stats --input text.txt --top 10
+    python src/lab6/daemon.py status
+    python src/lab6/daemon.py shutdown
+"""
+
+import argparse
+import json
+import math
+import os
+import socket
+import sys
+import time
+from collections import deque
+from typing import Optional
+
+# Папка src, чтобы пакеты lab5 и lib находились при запуске скрипта напрямую
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lab5.batch import (
+    CONVERTERS,
+    batch_summary,
+    collect_tasks,
+    convert_task,
+    get_converter,
+    is_up_to_date,
+)
+
+DEFAULT_SOCKET = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or "/tmp", "lab6-daemon.sock"
+)
+# По скольким последним запросам каждой команды считаются перцентили
+LATENCY_WINDOW = 1000
+# Обязательные поля запроса: stats читает input, конвертеры - input и output
+STATS_FIELDS = ("input",)
+CONVERT_FIELDS = ("input", "output")
+
+
+# --- Задания: выполняются в процессах пула ---
+
+
+def _warm_up() -> None:
+    """Импортирует конвертеры и текстовый конвейер один раз на процесс."""
+    for cmd in CONVERTERS:
+        try:
+            get_converter(cmd)
+        except ImportError:
+            # openpyxl может быть не установлен: csv2xlsx вернет ошибку
+            pass
+    import lib  # noqa: F401
+
+
+def _stats_job(request: dict) -> dict:
+    from lib import count_freq_approx, count_freq_parallel, count_freq_stream, top_n
+
+    top, workers = request.get("top", 5), request.get("workers", 1)
+    if top <= 0:
+        raise ValueError("--top должен быть больше 0")
+    if workers <= 0:
+        raise ValueError("--workers должен быть больше 0")
+    if request.get("approx") and workers > 1:
+        raise ValueError("--approx нельзя совмещать с --workers")
+
+    result = {}
+    if request.get("approx"):
+        with open(request["input"], "r", encoding="utf-8") as file:
+            freq = count_freq_approx(file, request.get("memory", "64MB"))
+        result = {"capacity": freq.capacity, "max_error": freq.max_error}
+    elif workers > 1:
+        freq = count_freq_parallel(request["input"], workers)
+    else:
+        with open(request["input"], "r", encoding="utf-8") as file:
+            freq = count_freq_stream(file)
+    result.update(total=sum(freq.values()), unique=len(freq), top=top_n(freq, top))
+    return result
+
+
+def run_job(request: dict) -> dict:
+    """Одно задание: stats или конвертация одного файла."""
+    cmd = request["cmd"]
+    if cmd == "stats":
+        return _stats_job(request)
+    if cmd == "csv2xlsx" and request.get("split"):
+        from lab5.csv_xlsx import csv_to_xlsx_split
+
+        options = {"mode": request["split"], "workers": request.get("workers")}
+        if request.get("max_rows"):
+            options["max_rows"] = request["max_rows"]
+        return csv_to_xlsx_split(request["input"], request["output"], **options)
+    get_converter(cmd)(request["input"], request["output"])
+    return {}
+
+
+# --- Сервер ---
+
+
+def _percentile(values: list, q: float) -> float:
+    # Ближайший ранг по отсортированному списку
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+class Counters:
+    """Счетчики запросов: число, ошибки, задержки по командам."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self._latency = {}
+        self._counts = {}
+
+    def record(self, cmd: str, seconds: float, ok: bool) -> None:
+        self.requests += 1
+        self.errors += not ok
+        self._counts[cmd] = self._counts.get(cmd, 0) + 1
+        window = self._latency.setdefault(cmd, deque(maxlen=LATENCY_WINDOW))
+        window.append(seconds)
+
+    def snapshot(self) -> dict:
+        uptime = time.monotonic() - self.started
+        commands = {}
+        for cmd, window in self._latency.items():
+            values = sorted(window)
+            commands[cmd] = {
+                "count": self._counts[cmd],
+                "avg_ms": 1000 * sum(values) / len(values),
+                "p50_ms": 1000 * _percentile(values, 0.5),
+                "p95_ms": 1000 * _percentile(values, 0.95),
+                "max_ms": 1000 * values[-1],
+            }
+        return {
+            "uptime": uptime,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "requests_per_sec": self.requests / uptime if uptime else 0.0,
+            "commands": commands,
+        }
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Удаляет сокет, оставшийся от завершившегося демона.
+    Если по этому пути отвечает работающий демон, поднимает RuntimeError:
+    молча отнять у него сокет нельзя.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError:
+            # Файл есть, но никто не слушает: демон завершился аварийно
+            os.unlink(socket_path)
+            return
+    raise RuntimeError(f"Демон уже запущен: {socket_path}")
+
+
+class Daemon:
+    """
+    asyncio-сервер на Unix-сокете. Соединения обслуживаются параллельно,
+    а сами задания (разбор текста, конвертация) идут в пул процессов,
+    чтобы не блокировать цикл событий.
+    """
+
+    def __init__(
+        self, socket_path: str = DEFAULT_SOCKET, workers: Optional[int] = None
+    ):
+        self.socket_path = socket_path
+        self.workers = workers
+        self.counters = Counters()
+        self._pool = None
+        self._stop = None
+
+    async def serve(self, ready=None) -> None:
+        """Работает до запроса shutdown или сигнала SIGINT/SIGTERM."""
+        import asyncio
+        import signal
+        from concurrent.futures import ProcessPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop.set)
+            except (RuntimeError, ValueError):
+                # Не главный поток (например, в тестах): только shutdown
+                pass
+
+        _remove_stale_socket(self.socket_path)
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_warm_up)
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        try:
+            if ready is not None:
+                ready()
+            async with server:
+                await self._stop.wait()
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    async def _handle(self, reader, writer) -> None:
+        import asyncio
+
+        # В одном соединении можно отправить несколько запросов подряд
+        try:
+            while not self._stop.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._dispatch(line)
+                data = json.dumps(response, ensure_ascii=False).encode()
+                writer.write(data + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # Клиент отключился или демон останавливается
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> dict:
+        started = time.perf_counter()
+        cmd = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict) or "cmd" not in request:
+                raise ValueError("Нет обязательного поля: cmd")
+            cmd = request["cmd"]
+            if cmd == "status":
+                return {"ok": True, "result": self.counters.snapshot()}
+            if cmd == "shutdown":
+                self._stop.set()
+                return {"ok": True, "result": {}}
+            if cmd != "stats" and cmd not in CONVERTERS:
+                raise ValueError(f"Неизвестная команда: {cmd}")
+            for field in STATS_FIELDS if cmd == "stats" else CONVERT_FIELDS:
+                if field not in request:
+                    raise ValueError(f"Нет обязательного поля: {field}")
+            self.counters.in_flight += 1
+            try:
+                result = await self._execute(request)
+            finally:
+                self.counters.in_flight -= 1
+        except Exception as e:
+            self.counters.record(str(cmd), time.perf_counter() - started, False)
+            return {"ok": False, "error": str(e) or type(e).__name__}
+        self.counters.record(cmd, time.perf_counter() - started, True)
+        return {"ok": True, "result": result}
+
+    async def _execute(self, request: dict) -> dict:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if not request.get("batch"):
+            if not os.path.isfile(request["input"]):
+                raise FileNotFoundError(f"Файл {request['input']} не существует")
+            return await loop.run_in_executor(self._pool, run_job, request)
+
+        # Пакет раскладывается на отдельные файлы в общем пуле демона,
+        # поэтому --jobs клиента здесь не используется
+        started = time.perf_counter()
+        tasks = await asyncio.to_thread(
+            collect_tasks, request["cmd"], request["input"], request["output"]
+        )
+        if not tasks:
+            raise FileNotFoundError(f"Нет файлов: {request['input']}")
+        force = request.get("force")
+        todo = [t for t in tasks if force or not is_up_to_date(t[1], t[2])]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._pool, convert_task, t) for t in todo)
+        )
+        return batch_summary(len(tasks), results, time.perf_counter() - started)
+
+
+# --- Клиент ---
+
+
+def request(payload: dict, socket_path: str = DEFAULT_SOCKET) -> dict:
+    """Отправляет один запрос демону и возвращает ответ."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload, ensure_ascii=False).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("Демон закрыл соединение без ответа")
+    return json.loads(line)
+
+
+def _convert_payload(argv: list) -> dict:
+    import cli_convert
+
+    args = cli_convert.build_parser().parse_args(argv)
+    payload = vars(args)
+    # У демона своя рабочая папка: пути передаются абсолютными
+    payload["input"] = os.path.abspath(args.input)
+    payload["output"] = os.path.abspath(args.output)
+    return payload
+
+
+def _print_convert(payload: dict, response: dict) -> None:
+    import cli_convert
+
+    if not response["ok"]:
+        print(f"Ошибка конвертации: {response['error']}")
+        sys.exit(1)
+    if payload["batch"]:
+        cli_convert.print_batch_stats(response["result"])
+    elif payload.get("split"):
+        cli_convert.print_split_stats(response["result"])
+        print(f"Успешно: {payload['cmd']}")
+    else:
+        print(f"Успешно: {payload['cmd']}")
+
+
+def _print_stats(top: int, response: dict) -> None:
+    if not response["ok"]:
+        print(f"Ошибка анализа: {response['error']}", file=sys.stderr)
+        sys.exit(1)
+    result = response["result"]
+    # Тот же вывод, что у lib.print_stats
+    print(f"Всего слов: {result['total']}")
+    print(f"Уникальных слов: {result['unique']}")
+    print(f"Топ-{top}:")
+    for word, count in result["top"]:
+        print(f"{word}:{count}")
+    if "capacity" in result:
+        print(
+            f"Приближенный подсчет: до {result['capacity']} слов в памяти, "
+            f"погрешность частот не больше {result['max_error']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Демон конвертации и статистики")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Путь к сокету")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = commands.add_parser("serve", help="Запустить демон")
+    serve_cmd.add_argument(
+        "--workers", type=int, default=None, help="Процессов в пуле демона"
+    )
+    convert_cmd = commands.add_parser("convert", help="Аргументы cli_convert.py")
+    convert_cmd.add_argument("args", nargs=argparse.REMAINDER)
+    text_cmd = commands.add_parser("text", help="Аргументы cli_text.py")
+    text_cmd.add_argument("args", nargs=argparse.REMAINDER)
+    commands.add_parser("status", help="Счетчики запросов и задержек")
+    commands.add_parser("shutdown", help="Остановить демон")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        import asyncio
+
+        daemon = Daemon(args.socket, args.workers)
+        try:
+            asyncio.run(
+                daemon.serve(ready=lambda: print(f"Демон слушает {args.socket}"))
+            )
+        except RuntimeError as e:
+            print(f"Ошибка: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    try:
+        if args.command == "convert":
+            payload = _convert_payload(args.args)
+            _print_convert(payload, request(payload, args.socket))
+        elif args.command == "text":
+            import cli_text
+
+            text_args = cli_text.build_parser().parse_args(args.args)
+            if text_args.command is None:
+                cli_text.build_parser().print_help()
+                return
+            if text_args.command == "cat":
+                # Вывод файла не нагружает процессор: демон не нужен
+                cli_text.show_file_content(text_args.input, text_args.n)
+                return
+            payload = vars(text_args)
+            payload["cmd"] = payload.pop("command")
+            payload["input"] = os.path.abspath(text_args.input)
+            _print_stats(text_args.top, request(payload, args.socket))
+        else:
+            response = request({"cmd": args.command}, args.socket)
+            print(json.dumps(response.get("result"), ensure_ascii=False, indent=2))
+    except (ConnectionError, FileNotFoundError) as e:
+        print(f"Демон недоступен ({args.socket}): {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,28 @@
-﻿from .models import Student
+﻿from .models import Student, student_ages
 from .serialize import students_to_json, students_from_json
+from .serialize import (
+    students_to_ndjson, iter_students_ndjson, students_from_ndjson
+)
+from .bulk import students_from_dicts, students_from_json_bulk
+from .table import StudentTable
+from .registry import StudentRegistry
+from .snapshot import StudentSnapshot, write_snapshot
+from .schema import Codec, compile_codec
 
-__all__ = ['Student', 'students_to_json', 'students_from_json']
+__all__ = [
+    'Student',
+    'student_ages',
+    'students_to_json',
+    'students_from_json',
+    'students_to_ndjson',
+    'iter_students_ndjson',
+    'students_from_ndjson',
+    'students_from_dicts',
+    'students_from_json_bulk',
+    'StudentTable',
+    'StudentRegistry',
+    'StudentSnapshot',
+    'write_snapshot',
+    'Codec',
+    'compile_codec',
+]
@@ -0,0 +1,118 @@
+import json
+import re
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .models import Student
+except ImportError:
+    from models import Student
+
+# То же, что принимает datetime.strptime(value, "%Y-%m-%d"): месяц и день
+# могут быть из одной цифры, день - с ведущим пробелом
+_DATE_RE = re.compile(
+    r"(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])\Z"
+)
+_FIELDS = ("fio", "birthdate", "group")
+
+
+def _check_date(value: str, cache: Dict[str, bool]) -> bool:
+    # Дни рождения часто повторяются: каждая строка проверяется один раз
+    ok = cache.get(value)
+    if ok is None:
+        match = _DATE_RE.match(value)
+        ok = False
+        if match:
+            try:
+                date(*map(int, match.groups()))
+                ok = True
+            except ValueError:
+                pass
+        cache[value] = ok
+    return ok
+
+
+def validate_records(
+    items: Iterable[Any],
+) -> Tuple[List[Tuple[str, str, str, float]], List[Tuple[int, str]]]:
+    """
+    Проверяет все записи сразу, не создавая объектов Student.
+    Проверки и сообщения те же, что у Student.from_dict и __post_init__:
+    обязательные поля, float(gpa), дата YYYY-MM-DD, 0 <= gpa <= 5.
+    Записи, на которых поэлементная загрузка упала бы с TypeError
+    (не словарь, дата не строкой), тоже попадают в ошибки.
+    :return: кортежи (fio, birthdate, group, gpa) корректных записей
+        и список ошибок (номер записи, сообщение)
+    """
+    valid, errors = [], []
+    dates: Dict[str, bool] = {}
+    for index, item in enumerate(items):
+        try:
+            fio, birthdate, group = (item[field] for field in _FIELDS)
+            gpa = float(item["gpa"])
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append((index, str(e)))
+            continue
+        if not isinstance(birthdate, str):
+            errors.append((index, f"Дата должна быть строкой: {birthdate!r}"))
+        elif not _check_date(birthdate, dates):
+            errors.append(
+                (index, f"Неверный формат даты: {birthdate}. Ожидается YYYY-MM-DD")
+            )
+        elif not 0 <= gpa <= 5:
+            errors.append(
+                (index, f"GPA должен быть в диапазоне от 0 до 5. Получено: {gpa}")
+            )
+        else:
+            valid.append((fio, birthdate, group, gpa))
+    return valid, errors
+
+
+def students_from_dicts(
+    items: Iterable[Any],
+) -> Tuple[List[Student], List[Tuple[int, str]]]:
+    """
+    Пакетная загрузка: сначала проверка всех записей (validate_records),
+    затем создание объектов без повторной проверки в __post_init__.
+    Принимаются и пропускаются те же записи, что у Student.from_dict.
+    :return: список студентов и список ошибок (номер записи, сообщение)
+    """
+    valid, errors = validate_records(items)
+    new = object.__new__
+    students = []
+    for fio, birthdate, group, gpa in valid:
+        student = new(Student)
+        student.fio = fio
+        student.birthdate = birthdate
+        student.group = group
+        student.gpa = gpa
+        students.append(student)
+    return students, errors
+
+
+def students_from_json_bulk(path: str, max_errors: Optional[int] = 20) -> List[Student]:
+    """
+    Загружает список студентов из JSON файла пакетно.
+    Результат тот же, что у students_from_json, но все некорректные
+    записи печатаются одним отчетом после проверки.
+    :param max_errors: сколько ошибок показать (None - все)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print(f"Файл не найден: {path}")
+        return []
+    except json.JSONDecodeError as e:
+        print(f"Ошибка JSON в файле {path}: {e}")
+        return []
+
+    students, errors = students_from_dicts(data)
+    if errors:
+        print(f"Пропущено элементов: {len(errors)}")
+        for index, message in errors[:max_errors]:
+            print(f"  #{index}: {message}")
+        if max_errors is not None and len(errors) > max_errors:
+            print(f"  ... и еще {len(errors) - max_errors}")
+    print(f"Загружено студентов: {len(students)}")
+    return students
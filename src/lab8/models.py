@@ -1,10 +1,29 @@
 ﻿from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_birthdate(value: str) -> date:
+    # Дни рождения сильно повторяются: строка разбирается strptime один раз
+    # на весь процесс, а не в каждом объекте. ValueError не кешируется
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _age(birth: date, today: date) -> int:
+    age = today.year - birth.year
+    if (today.month, today.day) < (birth.month, birth.day):
+        age -= 1
+    return age
 
 
 @dataclass
 class Student:
+    # Без __dict__ объект занимает заметно меньше памяти в больших списках.
+    # _age_cache - не поле: (дата расчета, дата рождения, возраст)
+    __slots__ = ("fio", "birthdate", "group", "gpa", "_age_cache")
+
     fio: str
     birthdate: str
     group: str
@@ -13,22 +32,25 @@ class Student:
     def __post_init__(self):
         # Исправленная валидация формата даты и диапазона gpa
         try:
-            datetime.strptime(self.birthdate, "%Y-%m-%d")
+            _parse_birthdate(self.birthdate)
         except ValueError:
             raise ValueError(f"Неверный формат даты: {self.birthdate}. Ожидается YYYY-MM-DD")
         
         if not (0 <= self.gpa <= 5):
             raise ValueError(f"GPA должен быть в диапазоне от 0 до 5. Получено: {self.gpa}")
 
-    def age(self) -> int:
-        # Исправленный расчет возраста
-        birth_date = datetime.strptime(self.birthdate, "%Y-%m-%d").date()
-        today = date.today()
-        
-        age = today.year - birth_date.year
-        if (today.month, today.day) < (birth_date.month, birth_date.day):
-            age -= 1
-        
+    def age(self, as_of: Optional[date] = None) -> int:
+        """
+        Полных лет на дату as_of (по умолчанию - сегодня).
+        Результат запоминается до смены даты или даты рождения.
+        """
+        today = as_of or date.today()
+        # Объекты, созданные без __init__ (пакетная загрузка), кеша не имеют
+        cached = getattr(self, "_age_cache", None)
+        if cached is not None and cached[0] == today and cached[1] == self.birthdate:
+            return cached[2]
+        age = _age(_parse_birthdate(self.birthdate), today)
+        self._age_cache = (today, self.birthdate, age)
         return age
 
     def to_dict(self) -> Dict[str, any]:
@@ -55,6 +77,27 @@ class Student:
         return f"Студент: {self.fio}, группа: {self.group}, GPA: {self.gpa:.2f}"
 
 
+def student_ages(
+    students: Iterable[Student], as_of: Optional[date] = None
+) -> List[int]:
+    """
+    Возраст всех студентов на одну дату as_of (по умолчанию - сегодня).
+    Дата берется один раз на весь список, поэтому отчет, собранный около
+    полуночи, не смешивает возраст на два разных дня.
+    """
+    today = as_of or date.today()
+    ages: Dict[str, int] = {}
+    result = []
+    for student in students:
+        age = ages.get(student.birthdate)
+        if age is None:
+            age = ages[student.birthdate] = _age(
+                _parse_birthdate(student.birthdate), today
+            )
+        result.append(age)
+    return result
+
+
 # Тестирование при запуске файла
 if __name__ == "__main__":
     print("="*60)
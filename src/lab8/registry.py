@@ -0,0 +1,226 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import replace
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .models import Student, _parse_birthdate
+except ImportError:
+    from models import Student, _parse_birthdate
+
+
+def _birth_day(student: Student) -> int:
+    return _parse_birthdate(student.birthdate).toordinal()
+
+
+def _latest_birth(today: date, age: int) -> int:
+    """Номер последнего дня рождения, при котором на today исполнилось age лет."""
+    year = today.year - age
+    if year < date.min.year:
+        return 0
+    if year > date.max.year:
+        return date.max.toordinal()
+    day = today.day
+    while True:
+        try:
+            return date(year, today.month, day).toordinal()
+        except ValueError:
+            # 29 февраля в невисокосный год: граница - 28 февраля
+            day -= 1
+
+
+class _SortedIndex:
+    """
+    Отсортированные ключи и номера записей в двух параллельных списках.
+    Порядок - по паре (ключ, номер): среди равных ключей номера тоже
+    отсортированы, и позиция записи находится двумя bisect даже при
+    миллионах одинаковых ключей.
+    """
+
+    def __init__(self, keys: List = (), ids: List[int] = ()):
+        # Сортируем номера позиций, а не пары: не создаем миллион кортежей.
+        # ids возрастают, а sorted устойчив: равные ключи остаются по номерам
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[pos] for pos in order]
+        self.ids = [ids[pos] for pos in order]
+
+    def _position(self, key, sid: int) -> int:
+        lo, hi = bisect_left(self.keys, key), bisect_right(self.keys, key)
+        return bisect_left(self.ids, sid, lo, hi)
+
+    def add(self, key, sid: int) -> None:
+        pos = self._position(key, sid)
+        self.keys.insert(pos, key)
+        self.ids.insert(pos, sid)
+
+    def remove(self, key, sid: int) -> None:
+        pos = self._position(key, sid)
+        if pos == len(self.ids) or self.ids[pos] != sid or self.keys[pos] != key:
+            raise KeyError(sid)
+        del self.keys[pos]
+        del self.ids[pos]
+
+    def between(self, lo, hi) -> List[int]:
+        """Номера записей с lo <= ключ <= hi по возрастанию ключа."""
+        return self.ids[bisect_left(self.keys, lo) : bisect_right(self.keys, hi)]
+
+
+def _add_id(index: Dict[str, Any], key: str, sid: int) -> None:
+    # Единственный номер хранится как int: ФИО почти всегда уникальны,
+    # и миллион списков из одного элемента заметно замедлил бы загрузку.
+    # Списки номеров отсортированы: выдача идет в порядке добавления.
+    ids = index.get(key)
+    if ids is None:
+        index[key] = sid
+    elif isinstance(ids, int):
+        index[key] = [ids, sid] if ids < sid else [sid, ids]
+    elif ids[-1] < sid:
+        ids.append(sid)
+    else:
+        insort(ids, sid)
+
+
+def _remove_id(index: Dict[str, Any], key: str, sid: int) -> None:
+    ids = index[key]
+    if isinstance(ids, int):
+        del index[key]
+        return
+    del ids[bisect_left(ids, sid)]
+    if len(ids) == 1:
+        index[key] = ids[0]
+
+
+def _get_ids(index: Dict[str, Any], key: str) -> List[int]:
+    ids = index.get(key, ())
+    return [ids] if isinstance(ids, int) else ids
+
+
+class StudentRegistry:
+    """
+    Реестр студентов с индексами:
+    хеш-индексы по группе и ФИО, отсортированные индексы по GPA и дате
+    рождения (поиск диапазонов через bisect). Индексы обновляются при
+    add/remove/update. Каждой записи выдается номер (id).
+    """
+
+    def __init__(self, students: Iterable[Student] = ()):
+        self._students: Dict[int, Student] = {}
+        self._by_group: Dict[str, Any] = {}
+        self._by_fio: Dict[str, Any] = {}
+        self._next_id = 0
+        gpa, birth = [], []
+        for student in students:
+            sid = self._new_id(student)
+            self._index_hash(sid, student)
+            gpa.append(student.gpa)
+            birth.append(_birth_day(student))
+        # Начальная загрузка: одна сортировка вместо вставок по одной
+        ids = list(self._students)
+        self._gpa = _SortedIndex(gpa, ids)
+        self._birth = _SortedIndex(birth, ids)
+
+    def _new_id(self, student: Student) -> int:
+        sid = self._next_id
+        self._next_id += 1
+        self._students[sid] = student
+        return sid
+
+    def _index_hash(self, sid: int, student: Student) -> None:
+        _add_id(self._by_group, student.group, sid)
+        _add_id(self._by_fio, student.fio, sid)
+
+    def _unindex_hash(self, sid: int, student: Student) -> None:
+        _remove_id(self._by_group, student.group, sid)
+        _remove_id(self._by_fio, student.fio, sid)
+
+    # --- Изменение ---
+
+    def add(self, student: Student) -> int:
+        """Добавляет студента и возвращает его номер."""
+        sid = self._new_id(student)
+        self._index_hash(sid, student)
+        self._gpa.add(student.gpa, sid)
+        self._birth.add(_birth_day(student), sid)
+        return sid
+
+    def remove(self, sid: int) -> Student:
+        """Удаляет запись; KeyError, если номера нет."""
+        student = self._students.pop(sid)
+        self._unindex_hash(sid, student)
+        self._gpa.remove(student.gpa, sid)
+        self._birth.remove(_birth_day(student), sid)
+        return student
+
+    def update(self, sid: int, **changes) -> Student:
+        """
+        Меняет поля записи (fio, birthdate, group, gpa) с проверкой как
+        в Student и обновляет только затронутые индексы.
+        """
+        old = self._students[sid]
+        new = replace(old, **changes)
+        if (old.group, old.fio) != (new.group, new.fio):
+            self._unindex_hash(sid, old)
+            self._index_hash(sid, new)
+        if old.gpa != new.gpa:
+            self._gpa.remove(old.gpa, sid)
+            self._gpa.add(new.gpa, sid)
+        if old.birthdate != new.birthdate:
+            self._birth.remove(_birth_day(old), sid)
+            self._birth.add(_birth_day(new), sid)
+        self._students[sid] = new
+        return new
+
+    # --- Запросы ---
+
+    def __len__(self) -> int:
+        return len(self._students)
+
+    def __contains__(self, sid: int) -> bool:
+        return sid in self._students
+
+    def __iter__(self) -> Iterator[Student]:
+        return iter(self._students.values())
+
+    def get(self, sid: int) -> Optional[Student]:
+        return self._students.get(sid)
+
+    def _pick(self, ids: Iterable[int]) -> List[Student]:
+        students = self._students
+        return [students[sid] for sid in ids]
+
+    def by_group(self, group: str) -> List[Student]:
+        """Студенты группы в порядке добавления."""
+        return self._pick(_get_ids(self._by_group, group))
+
+    def by_fio(self, fio: str) -> List[Student]:
+        return self._pick(_get_ids(self._by_fio, fio))
+
+    def gpa_between(self, low: float, high: float) -> List[Student]:
+        """Студенты с low <= GPA <= high по возрастанию GPA."""
+        return self._pick(self._gpa.between(low, high))
+
+    def top_gpa(self, n: int) -> List[Student]:
+        """n студентов с наибольшим GPA (по убыванию)."""
+        if n <= 0:
+            return []
+        return self._pick(reversed(self._gpa.ids[-n:]))
+
+    def born_between(self, first: date, last: date) -> List[Student]:
+        """Студенты, родившиеся с first по last включительно (от старших)."""
+        return self._pick(self._birth.between(first.toordinal(), last.toordinal()))
+
+    def age_between(
+        self, youngest: int, oldest: int, today: Optional[date] = None
+    ) -> List[Student]:
+        """
+        Студенты, которым на дату today (по умолчанию - сегодня) от youngest
+        до oldest полных лет включительно; возраст считается как Student.age().
+        """
+        today = today or date.today()
+        if youngest > oldest:
+            return []
+        # Возраст >= youngest <=> родился не позже _latest_birth(youngest);
+        # возраст <= oldest <=> родился позже _latest_birth(oldest + 1)
+        first = _latest_birth(today, oldest + 1) + 1
+        last = _latest_birth(today, youngest)
+        return self._pick(self._birth.between(first, last))
@@ -0,0 +1,109 @@
+from dataclasses import MISSING, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple
+
+# Типы полей, значения которых приводятся при разборе, как float(gpa)
+# в Student.from_dict. Аннотации могут быть и строками
+_CONVERTERS = {float: "float", int: "int", "float": "float", "int": "int"}
+
+
+class Codec(NamedTuple):
+    """Сгенерированные функции кодирования и разбора одной модели."""
+
+    encode: Callable[[Any], Dict[str, Any]]
+    decode: Callable[[Dict[str, Any]], Any]
+    encode_many: Callable[[Any], List[Dict[str, Any]]]
+    decode_many: Callable[[Any], List[Any]]
+
+
+def _decode_lines(cls, trusted: bool, namespace: Dict[str, Any]) -> List[str]:
+    # Тело разбора словаря data в объект obj
+    params = cls.__dataclass_params__
+    lines = ["obj = new(cls)"]
+    for field in fields(cls):
+        key = repr(field.name)
+        if not field.init and not trusted:
+            # Как в __init__: значение по умолчанию до вызова __post_init__,
+            # а без него поле заполняет сам __post_init__
+            if field.default is not MISSING:
+                namespace[f"_d_{field.name}"] = field.default
+                value = f"_d_{field.name}"
+            elif field.default_factory is not MISSING:
+                namespace[f"_f_{field.name}"] = field.default_factory
+                value = f"_f_{field.name}()"
+            elif hasattr(cls, "__post_init__"):
+                continue
+            else:
+                raise TypeError(
+                    f"Поле {cls.__qualname__}.{field.name} с init=False "
+                    "не имеет значения по умолчанию"
+                )
+        elif field.default is not MISSING:
+            namespace[f"_d_{field.name}"] = field.default
+            value = f"data.get({key}, _d_{field.name})"
+        elif field.default_factory is not MISSING:
+            namespace[f"_f_{field.name}"] = field.default_factory
+            value = f"data[{key}] if {key} in data else _f_{field.name}()"
+        else:
+            value = f"data[{key}]"
+        converter = _CONVERTERS.get(field.type)
+        if converter and field.init and not trusted:
+            value = f"{converter}({value})"
+        if params.frozen:
+            lines.append(f"setattr_(obj, {key}, {value})")
+        else:
+            lines.append(f"obj.{field.name} = {value}")
+    if not trusted and hasattr(cls, "__post_init__"):
+        lines.append("obj.__post_init__()")
+    return lines
+
+
+@lru_cache(maxsize=None)
+def compile_codec(cls, trusted: bool = False) -> Codec:
+    """
+    Генерирует функции to_dict/from_dict для dataclass-модели по списку полей.
+    Разбор повторяет from_dict: обязательные ключи (KeyError), приведение
+    float/int полей, проверки __post_init__ - но без вызова __init__.
+    Поля с init=False получают значение по умолчанию, как в __init__.
+    trusted=True - для данных, записанных нами же (to_dict, снимки):
+    значения берутся как есть (и поля с init=False тоже),
+    __post_init__ не вызывается.
+    """
+    if not is_dataclass(cls) or not isinstance(cls, type):
+        raise TypeError(f"{cls!r} не является dataclass-классом")
+
+    namespace: Dict[str, Any] = {
+        "new": object.__new__,
+        "cls": cls,
+        "setattr_": object.__setattr__,
+    }
+    items = ", ".join(f"{f.name!r}: obj.{f.name}" for f in fields(cls))
+    body = _decode_lines(cls, trusted, namespace)
+    decode = "\n    ".join(body)
+    loop = "\n        ".join(body)
+    source = f"""
+def encode(obj):
+    return {{{items}}}
+
+def encode_many(objs):
+    return [{{{items}}} for obj in objs]
+
+def decode(data):
+    {decode}
+    return obj
+
+def decode_many(items):
+    result = []
+    append = result.append
+    for data in items:
+        {loop}
+        append(obj)
+    return result
+"""
+    exec(compile(source, f"<codec {cls.__qualname__}>", "exec"), namespace)
+    return Codec(
+        namespace["encode"],
+        namespace["decode"],
+        namespace["encode_many"],
+        namespace["decode_many"],
+    )
@@ -1,5 +1,6 @@
 ﻿import json
-from typing import List
+import os
+from typing import Iterable, Iterator, List
 
 # Используем абсолютный импорт с обработкой ошибок
 try:
@@ -52,6 +53,65 @@ def students_from_json(path: str) -> List[Student]:
         return []
 
 
+def students_to_ndjson(
+    students: Iterable[Student], path: str, append: bool = False
+) -> int:
+    """
+    Сохраняет студентов в формате JSON Lines: один объект на строку.
+    Студенты берутся по одному, поэтому подходит и генератор.
+    append=True дописывает строки в конец файла, не перезаписывая его.
+    Возвращает число записанных студентов.
+    """
+    count = 0
+    with open(path, 'a' if append else 'w', encoding='utf-8') as f:
+        if append and f.tell() > 0 and not _ends_with_newline(path):
+            # Последняя строка оборвана: не приклеиваем к ней новую запись
+            f.write('\n')
+        for student in students:
+            f.write(json.dumps(student.to_dict(), ensure_ascii=False))
+            f.write('\n')
+            count += 1
+
+    print(f"Данные сохранены в {path}")
+    return count
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def iter_students_ndjson(path: str) -> Iterator[Student]:
+    """
+    Читает студентов из файла JSON Lines по одной строке.
+    Некорректные строки пропускаются с сообщением и номером строки,
+    пустые строки игнорируются.
+    """
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Файл не найден: {path}")
+        return
+
+    with f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield Student.from_dict(json.loads(line))
+            except (KeyError, ValueError, TypeError) as e:
+                # json.JSONDecodeError - тоже ValueError
+                print(f"Пропущена строка {line_no}: {e}")
+
+
+def students_from_ndjson(path: str) -> List[Student]:
+    """Загружает список студентов из файла JSON Lines"""
+    students = list(iter_students_ndjson(path))
+    print(f"Загружено студентов: {len(students)}")
+    return students
+
+
 # Тестирование при запуске файла
 if __name__ == "__main__":
     print("="*60)
@@ -0,0 +1,24 @@
+from typing import List
+
+try:
+    from .models import Student
+    from .serialize import students_from_json, students_to_json
+except ImportError:
+    from models import Student
+    from serialize import students_from_json, students_to_json
+
+# lib лежит рядом с пакетами лабораторных: src.lib или lib, если src в пути
+try:
+    from ..lib.aio import run_blocking
+except ImportError:
+    from lib.aio import run_blocking
+
+
+async def students_to_json_async(students: List[Student], path: str) -> None:
+    """Асинхронно сохраняет список студентов в JSON файл"""
+    await run_blocking(students_to_json, students, path)
+
+
+async def students_from_json_async(path: str) -> List[Student]:
+    """Асинхронно загружает список студентов из JSON файла"""
+    return await run_blocking(students_from_json, path)
@@ -0,0 +1,150 @@
+import mmap  # Отображение файла в память при чтении
+import struct  # Заголовок и записи фиксированного размера
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Union
+
+try:
+    from .models import Student, _parse_birthdate
+except ImportError:
+    from models import Student, _parse_birthdate
+
+# Формат снимка .stus (все числа little-endian):
+#   заголовок: MAGIC, версия, число студентов, число строк, длина строк
+#   записи: по одной на студента (struct _RECORD) - номер ФИО в таблице
+#       строк, номер группы, дата рождения (date.toordinal), GPA
+#   таблица строк: смещения (nstrings + 1 чисел "<Q") и строки UTF-8 подряд
+# Одинаковые строки (группы, повторяющиеся ФИО) хранятся один раз.
+MAGIC = b"STUS"
+VERSION = 1
+_HEADER = struct.Struct("<4sHxxQQQ")
+_RECORD = struct.Struct("<IIid")
+_OFFSET = struct.Struct("<Q")
+
+
+def write_snapshot(students: Iterable[Student], path: Union[str, Path]) -> int:
+    """
+    Сохраняет студентов в двоичный снимок.
+    Дата рождения хранится номером дня, поэтому при чтении она
+    возвращается в виде YYYY-MM-DD (с ведущими нулями).
+    :return: число записанных студентов
+    """
+    strings: Dict[str, int] = {}
+    records = bytearray()
+    pack = _RECORD.pack
+    count = 0
+    for student in students:
+        fio_id = strings.setdefault(student.fio, len(strings))
+        group_id = strings.setdefault(student.group, len(strings))
+        day = _parse_birthdate(student.birthdate).toordinal()
+        records += pack(fio_id, group_id, day, student.gpa)
+        count += 1
+
+    offsets = [0]
+    blob = bytearray()
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, count, len(strings), len(blob)))
+        f.write(records)
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.write(blob)
+    return count
+
+
+class StudentSnapshot:
+    """
+    Чтение снимка через mmap: открытие не зависит от размера файла,
+    объект Student создается только при обращении к записи.
+    Значения уже проверены при записи, поэтому __post_init__ не вызывается.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл {path} пуст.")
+
+        size = len(self._mmap)
+        header = self._mmap[: _HEADER.size].ljust(_HEADER.size, b"\0")
+        magic, version, count, nstrings, blob_len = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Файл {path} не является снимком версии {VERSION}.")
+        self._count = count
+        self._offsets_start = _HEADER.size + count * _RECORD.size
+        self._strings_start = self._offsets_start + (nstrings + 1) * _OFFSET.size
+        if self._strings_start + blob_len != size:
+            self.close()
+            raise ValueError(f"Файл {path} поврежден: неверный размер.")
+
+    def _string(self, string_id: int) -> str:
+        start, end = struct.unpack_from(
+            "<QQ", self._mmap, self._offsets_start + string_id * _OFFSET.size
+        )
+        base = self._strings_start
+        return self._mmap[base + start : base + end].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Student:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("индекс вне снимка")
+        fio_id, group_id, day, gpa = _RECORD.unpack_from(
+            self._mmap, _HEADER.size + index * _RECORD.size
+        )
+        student = object.__new__(Student)
+        student.fio = self._string(fio_id)
+        student.birthdate = date.fromordinal(day).isoformat()
+        student.group = self._string(group_id)
+        student.gpa = gpa
+        return student
+
+    def __iter__(self) -> Iterator[Student]:
+        for index in range(self._count):
+            yield self[index]
+
+    def to_students(self) -> List[Student]:
+        """Все студенты списком; каждая строка декодируется один раз."""
+        base = self._strings_start
+        offsets = struct.unpack_from(
+            f"<{(base - self._offsets_start) // _OFFSET.size}Q",
+            self._mmap,
+            self._offsets_start,
+        )
+        blob = self._mmap[base : base + offsets[-1]]
+        strings = [
+            blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])
+        ]
+        dates: Dict[int, str] = {}
+        new = object.__new__
+        students = []
+        records = self._mmap[_HEADER.size : self._offsets_start]
+        for fio_id, group_id, day, gpa in _RECORD.iter_unpack(records):
+            birthdate = dates.get(day)
+            if birthdate is None:
+                birthdate = dates[day] = date.fromordinal(day).isoformat()
+            student = new(Student)
+            student.fio = strings[fio_id]
+            student.birthdate = birthdate
+            student.group = strings[group_id]
+            student.gpa = gpa
+            students.append(student)
+        return students
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "StudentSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
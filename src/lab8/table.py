@@ -0,0 +1,171 @@
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .bulk import validate_records
+    from .models import Student, _age, _parse_birthdate
+except ImportError:
+    from bulk import validate_records
+    from models import Student, _age, _parse_birthdate
+
+
+class StudentRow:
+    """
+    Строка StudentTable с тем же интерфейсом, что у Student:
+    поля, age(), to_dict(), __str__. Значения читаются из колонок таблицы.
+    Дата рождения возвращается в виде YYYY-MM-DD (с ведущими нулями).
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "StudentTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def fio(self) -> str:
+        return self._table._fio_at(self._index)
+
+    @property
+    def birthdate(self) -> str:
+        return date.fromordinal(self._table.birth_days[self._index]).isoformat()
+
+    @property
+    def group(self) -> str:
+        return self._table.groups[self._table.group_codes[self._index]]
+
+    @property
+    def gpa(self) -> float:
+        return self._table.gpa[self._index]
+
+    def age(self, as_of: Optional[date] = None) -> int:
+        """Полных лет на дату as_of (по умолчанию - сегодня), как Student.age."""
+        birth = date.fromordinal(self._table.birth_days[self._index])
+        return _age(birth, as_of or date.today())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fio": self.fio,
+            "birthdate": self.birthdate,
+            "group": self.group,
+            "gpa": self.gpa,
+        }
+
+    def to_student(self) -> Student:
+        return Student(self.fio, self.birthdate, self.group, self.gpa)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (StudentRow, Student)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"StudentRow(fio={self.fio!r}, birthdate={self.birthdate!r}, "
+            f"group={self.group!r}, gpa={self.gpa!r})"
+        )
+
+    def __str__(self) -> str:
+        # Без свойств: str() строк вызывается на всей таблице при отчетах
+        table, index = self._table, self._index
+        fio = table._fio_at(index)
+        group = table.groups[table.group_codes[index]]
+        return f"Студент: {fio}, группа: {group}, GPA: {table.gpa[index]:.2f}"
+
+
+class StudentTable:
+    """
+    Компактная таблица студентов по колонкам:
+    ФИО - одна строка UTF-8 и массив смещений, группа - номер в списке
+    уникальных групп, дата рождения - номер дня (date.toordinal),
+    GPA - массив double. Объекты создаются только при обращении к строке.
+    """
+
+    def __init__(self):
+        self._fio_blob = bytearray()
+        self._fio_offsets = array("Q", [0])
+        self.groups: List[str] = []
+        self._group_codes: Dict[str, int] = {}
+        self.group_codes = array("I")
+        self.birth_days = array("i")
+        self.gpa = array("d")
+
+    # --- Заполнение ---
+
+    def _append(self, fio: str, birth_day: int, group: str, gpa: float) -> None:
+        self._fio_blob += fio.encode("utf-8")
+        self._fio_offsets.append(len(self._fio_blob))
+        code = self._group_codes.get(group)
+        if code is None:
+            code = self._group_codes[group] = len(self.groups)
+            self.groups.append(group)
+        self.group_codes.append(code)
+        self.birth_days.append(birth_day)
+        self.gpa.append(gpa)
+
+    def append(self, student: Student) -> None:
+        """Добавляет уже проверенного студента (объект Student)."""
+        birth = _parse_birthdate(student.birthdate).toordinal()
+        self._append(student.fio, birth, student.group, student.gpa)
+
+    def extend(self, students: Iterable[Student]) -> None:
+        for student in students:
+            self.append(student)
+
+    @classmethod
+    def from_students(cls, students: Iterable[Student]) -> "StudentTable":
+        table = cls()
+        table.extend(students)
+        return table
+
+    @classmethod
+    def from_dicts(
+        cls, items: Iterable[Any]
+    ) -> Tuple["StudentTable", List[Tuple[int, str]]]:
+        """
+        Заполняет таблицу из словарей с теми же проверками, что у
+        students_from_dicts, не создавая объектов Student.
+        :return: таблица и список ошибок (номер записи, сообщение)
+        """
+        valid, errors = validate_records(items)
+        table = cls()
+        for fio, birthdate, group, gpa in valid:
+            day = _parse_birthdate(birthdate).toordinal()
+            table._append(fio, day, group, gpa)
+        return table, errors
+
+    # --- Чтение ---
+
+    def _fio_at(self, index: int) -> str:
+        start, end = self._fio_offsets[index], self._fio_offsets[index + 1]
+        return self._fio_blob[start:end].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.gpa)
+
+    def __getitem__(self, index: int) -> StudentRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("индекс вне таблицы")
+        return StudentRow(self, index)
+
+    def __iter__(self) -> Iterator[StudentRow]:
+        for index in range(len(self)):
+            yield StudentRow(self, index)
+
+    def ages(self, today: Optional[date] = None) -> array:
+        """Возраст всех студентов на дату today (по умолчанию - сегодня)."""
+        today = today or date.today()
+        cache: Dict[int, int] = {}
+        result = array("i")
+        for day in self.birth_days:
+            age = cache.get(day)
+            if age is None:
+                age = cache[day] = _age(date.fromordinal(day), today)
+            result.append(age)
+        return result
+
+    def to_students(self) -> List[Student]:
+        return [row.to_student() for row in self]
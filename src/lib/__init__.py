@@ -0,0 +1,26 @@
+from .text import (
+    normalize,
+    tokenize,
+    count_freq,
+    top_n,
+    count_words,
+    count_freq_stream,
+    print_stats,
+    stats_text,
+)
+from .parallel import count_freq_parallel
+from .sketch import SpaceSaving, count_freq_approx
+
+__all__ = [
+    "normalize",
+    "tokenize",
+    "count_freq",
+    "top_n",
+    "count_words",
+    "count_freq_stream",
+    "print_stats",
+    "stats_text",
+    "count_freq_parallel",
+    "SpaceSaving",
+    "count_freq_approx",
+]
@@ -0,0 +1,34 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Сколько блокирующих операций с файлами выполняется одновременно.
+# Модуль не реэкспортируется из lib: импорт asyncio замедлил бы запуск CLI.
+IO_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Общий ограниченный пул потоков для файловых операций."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(IO_WORKERS, thread_name_prefix="aio")
+    return _executor
+
+
+async def run_blocking(
+    func: Callable[..., Any],
+    *args: Any,
+    executor: Optional[ThreadPoolExecutor] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Выполняет блокирующую функцию в пуле потоков, не останавливая цикл
+    событий. Результат и исключения - те же, что у func(*args, **kwargs).
+    :param executor: свой пул; по умолчанию общий из get_executor()
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(executor or get_executor(), call)
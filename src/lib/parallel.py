@@ -0,0 +1,96 @@
+import codecs
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+try:
+    from .text import CHUNK_SIZE, count_freq_stream
+except ImportError:
+    from text import CHUNK_SIZE, count_freq_stream
+
+_WHITESPACE = " \t\n\r\f\v"
+_WHITESPACE_RE = re.compile(rb"[ \t\n\r\f\v]")
+
+
+def _splittable(encoding: str) -> bool:
+    # Резать по пробельным байтам можно, только если пробелы кодируются
+    # одним ASCII-байтом: в UTF-16/UTF-32 байт 0x20 бывает частью символа
+    return all(c.encode(encoding) == c.encode("ascii") for c in _WHITESPACE)
+
+
+def split_ranges(path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """Делит файл на диапазоны байтов с границами на пробельных символах.
+
+    В UTF-8 и однобайтовых кодировках ASCII-пробел не встречается внутри
+    многобайтового символа, поэтому каждый диапазон декодируется отдельно
+    и ни одно слово не разрезается.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            pos = max(size * i // parts, bounds[-1])
+            f.seek(pos)
+            while pos < size:
+                block = f.read(CHUNK_SIZE)
+                match = _WHITESPACE_RE.search(block)
+                if match:
+                    pos += match.start()
+                    break
+                pos += len(block)
+            bounds.append(min(pos, size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def _read_range(
+    path: Union[str, Path], start: int, end: int, encoding: str
+) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, "rb") as f:
+        f.seek(start)
+        left = end - start
+        while left > 0:
+            block = f.read(min(CHUNK_SIZE, left))
+            if not block:
+                break
+            left -= len(block)
+            yield decoder.decode(block)
+    yield decoder.decode(b"", final=True)
+
+
+def _count_range(args: Tuple[str, int, int, str]) -> Dict[str, int]:
+    path, start, end, encoding = args
+    return count_freq_stream(_read_range(path, start, end, encoding))
+
+
+def merge_freq(parts: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    """Складывает частичные словари частот в один."""
+    total: Dict[str, int] = {}
+    for part in parts:
+        for word, cnt in part.items():
+            total[word] = total.get(word, 0) + cnt
+    return total
+
+
+def count_freq_parallel(
+    path: Union[str, Path], workers: int = 1, encoding: str = "utf-8"
+) -> Dict[str, int]:
+    """Считает частоты слов в файле на нескольких процессах.
+
+    Результат совпадает с count_freq(tokenize(normalize(text))) для всего
+    файла (порядок ключей может отличаться, на top_n это не влияет).
+    Файл в кодировке, где пробел не однобайтовый ASCII (UTF-16, UTF-32),
+    нельзя делить по байтам - он считается в одном процессе.
+    """
+    path = str(path)
+    if workers <= 1 or not _splittable(encoding):
+        return _count_range((path, 0, os.path.getsize(path), encoding))
+    # concurrent.futures импортируется только здесь: он заметно замедляет
+    # запуск CLI, которому пул процессов не нужен
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(path, a, b, encoding) for a, b in split_ranges(path, workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return merge_freq(pool.map(_count_range, jobs))
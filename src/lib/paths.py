@@ -0,0 +1,18 @@
+from pathlib import Path
+from typing import Iterable, List
+
+# Модуль не реэкспортируется из lib: нужен только пакетным режимам.
+
+
+def unique_names(paths: Iterable[str], suffix: str = "") -> List[str]:
+    """Имена выходных файлов по именам входных (без расширения) плюс suffix.
+
+    Одинаковые имена из разных папок получают суффикс _2, _3, ...
+    """
+    names, seen = [], {}
+    for path in paths:
+        stem = Path(path).stem
+        seen[stem] = seen.get(stem, 0) + 1
+        name = stem if seen[stem] == 1 else f"{stem}_{seen[stem]}"
+        names.append(name + suffix)
+    return names
@@ -0,0 +1,123 @@
+import heapq
+import re
+from collections.abc import Mapping
+from typing import IO, Dict, Iterable, Iterator, List, Tuple, Union
+
+try:
+    from .text import CHUNK_SIZE, _iter_word_chunks, count_words
+except ImportError:
+    from text import CHUNK_SIZE, _iter_word_chunks, count_words
+
+# Примерная цена одного счетчика в байтах: ключ словаря, строка слова,
+# int счетчика и погрешности, элемент кучи
+BYTES_PER_ENTRY = 256
+
+_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*$", flags=re.IGNORECASE)
+
+
+def parse_size(size: str) -> int:
+    """Переводит строку вида "64MB", "512KB" или "1GB" в байты."""
+    match = _SIZE_RE.match(size)
+    if not match:
+        raise ValueError(f"Неверный размер памяти: {size}. Пример: 64MB")
+    number, unit = match.groups()
+    unit = unit.upper()
+    if unit and not unit.endswith("B"):
+        unit += "B"
+    return int(float(number) * _UNITS[unit])
+
+
+class SpaceSaving(Mapping):
+    """Приближенный счетчик частых слов (алгоритм Space-Saving).
+
+    Хранит не больше capacity слов. Когда место кончается, новое слово
+    вытесняет слово с минимальным счетчиком и наследует этот счетчик как
+    погрешность. Для каждого слова count - error <= настоящая частота <= count,
+    а любое слово с частотой больше total / capacity гарантированно есть
+    в счетчике. Сумма счетчиков всегда равна числу обработанных слов.
+
+    Ведет себя как словарь слово -> частота, поэтому подходит для top_n
+    и print_stats.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Размер счетчика должен быть больше 0")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        # у каждого слова ровно одна запись; счетчик в ней может отставать
+        self._heap: List[Tuple[int, str]] = []
+
+    @classmethod
+    def from_memory(cls, memory: Union[int, str]) -> "SpaceSaving":
+        if isinstance(memory, str):
+            memory = parse_size(memory)
+        return cls(max(1, memory // BYTES_PER_ENTRY))
+
+    def add(self, word: str, count: int = 1) -> None:
+        self.total += count
+        counts = self._counts
+        if word in counts:
+            counts[word] += count
+            return
+        if len(counts) < self.capacity:
+            counts[word] = count
+            self._errors[word] = 0
+            heapq.heappush(self._heap, (count, word))
+            return
+        min_count, min_word = self._pop_min()
+        del counts[min_word]
+        del self._errors[min_word]
+        counts[word] = min_count + count
+        self._errors[word] = min_count
+        heapq.heappush(self._heap, (min_count + count, word))
+
+    def update(self, freq: Dict[str, int]) -> None:
+        for word, count in freq.items():
+            self.add(word, count)
+
+    def _pop_min(self) -> Tuple[int, str]:
+        heap = self._heap
+        while True:
+            count, word = heapq.heappop(heap)
+            actual = self._counts[word]
+            if actual == count:
+                return count, word
+            heapq.heappush(heap, (actual, word))
+
+    def error(self, word: str) -> int:
+        """Насколько счетчик слова может превышать настоящую частоту."""
+        return self._errors.get(word, 0)
+
+    @property
+    def max_error(self) -> int:
+        """Общая граница погрешности: не больше total / capacity."""
+        return max(self._errors.values(), default=0)
+
+    def __getitem__(self, word: str) -> int:
+        return self._counts[word]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+def count_freq_approx(
+    source: Union[IO[str], Iterable[str]],
+    memory: Union[int, str] = "64MB",
+    chunk_size: int = CHUNK_SIZE,
+) -> SpaceSaving:
+    """Приближенно считает частоты слов в потоке с ограниченной памятью.
+
+    Каждый кусок текста сначала считается точно (count_words), а затем
+    его частоты добавляются в SpaceSaving.
+    """
+    sketch = SpaceSaving.from_memory(memory)
+    for text in _iter_word_chunks(source, chunk_size):
+        sketch.update(count_words(text))
+    return sketch
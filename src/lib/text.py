@@ -1,13 +1,25 @@
-﻿import re
+﻿import heapq
+import re
 from collections import Counter
-from typing import Dict, List, Tuple
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+CHUNK_SIZE = 1 << 20
+# Во сколько раз словарь должен быть больше n, чтобы top_n выбирал через кучу
+HEAP_RATIO = 8
+
+_TOKEN_RE = re.compile(r"[а-яa-z]+", flags=re.IGNORECASE)
+# Слова в исходном (не нормализованном) тексте: ё ещё не заменена на е
+_RAW_TOKEN_RE = re.compile(r"[а-яёa-z]+", flags=re.IGNORECASE)
+
+
+def _fold(text: str) -> str:
+    return text.lower().replace("ё", "е")
 
 
 def normalize(text: str) -> str:
     if not text:
         return ""
-    text = text.lower()
-    text = text.replace("ё", "е")
+    text = _fold(text)
     text = re.sub(r"\s+", " ", text)
     return text.strip()
 
@@ -15,7 +27,7 @@ def normalize(text: str) -> str:
 def tokenize(text: str) -> List[str]:
     if not text:
         return []
-    tokens = re.findall(r"[а-яa-z]+", text, flags=re.IGNORECASE)
+    tokens = _TOKEN_RE.findall(text)
     return tokens
 
 
@@ -26,5 +38,90 @@ def count_freq(tokens: List[str]) -> Dict[str, int]:
 def top_n(freq: Dict[str, int], n: int) -> List[Tuple[str, int]]:
     if not freq:
         return []
+    if 0 <= n and n * HEAP_RATIO < len(freq):
+        return heapq.nsmallest(n, freq.items(), key=lambda x: (-x[1], x[0]))
     sorted_items = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
     return sorted_items[:n]
+
+
+def _iter_chunks(
+    source: Union[IO[str], Iterable[str]], chunk_size: int
+) -> Iterator[str]:
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def count_words(text: str, freq: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Быстрый аналог count_freq(tokenize(normalize(text))) за один проход.
+
+    Слова ищутся прямо в исходном тексте, без нормализованной копии,
+    а к нижнему регистру и е приводятся только различные формы слов.
+    Текст разбирается окнами по CHUNK_SIZE символов, поэтому список слов
+    в памяти не больше одного окна.
+    Если передан freq, счетчики добавляются в него.
+    """
+    if freq is None:
+        freq = {}
+    forms = Counter()
+    pos = 0
+    while pos < len(text):
+        end = pos + CHUNK_SIZE
+        # Слово на границе окна не режем: окно заканчивается после него
+        word = _RAW_TOKEN_RE.match(text, end)
+        if word:
+            end = word.end()
+        forms.update(_RAW_TOKEN_RE.findall(text, pos, end))
+        pos = end
+    for form, cnt in forms.items():
+        for word in _TOKEN_RE.findall(_fold(form)):
+            freq[word] = freq.get(word, 0) + cnt
+    return freq
+
+
+def _split_tail(text: str) -> int:
+    i = len(text)
+    while i and _RAW_TOKEN_RE.match(text, i - 1):
+        i -= 1
+    return i
+
+
+def _iter_word_chunks(
+    source: Union[IO[str], Iterable[str]], chunk_size: int
+) -> Iterator[str]:
+    # куски исходного текста, которые не разрезают слова
+    carry = ""
+    for chunk in _iter_chunks(source, chunk_size):
+        text = carry + chunk
+        cut = _split_tail(text)
+        carry = text[cut:]
+        yield text[:cut]
+    yield carry
+
+
+def count_freq_stream(
+    source: Union[IO[str], Iterable[str]], chunk_size: int = CHUNK_SIZE
+) -> Dict[str, int]:
+    """Считает частоты слов, не загружая весь текст в память."""
+    freq: Dict[str, int] = {}
+    for text in _iter_word_chunks(source, chunk_size):
+        count_words(text, freq)
+    return freq
+
+
+def print_stats(freq: Dict[str, int], n: int = 5) -> None:
+    """Печатает общее число слов, число уникальных слов и топ-n."""
+    print(f"Всего слов: {sum(freq.values())}")
+    print(f"Уникальных слов: {len(freq)}")
+    print(f"Топ-{n}:")
+    for word, count in top_n(freq, n):
+        print(f"{word}:{count}")
+
+
+def stats_text(text: str, n: int = 5) -> None:
+    print_stats(count_words(text), n)
@@ -0,0 +1,55 @@
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lab4.io_async import read_text_async, write_csv_async
+from src.lab5.json_csv_async import convert_many_async, csv_to_json_async
+from src.lab8 import Student
+from src.lab8.serialize_async import students_from_json_async, students_to_json_async
+
+
+def test_async_io_matches_sync(tmp_path: Path):
+    """
+    Асинхронные версии ведут себя как синхронные:
+    1. Чтение, запись CSV и сериализация студентов дают те же данные
+    2. Ошибки (неверное расширение, нет файла) - те же исключения и сообщения
+    """
+
+    async def scenario():
+        csv_path = tmp_path / "words.csv"
+        await write_csv_async([("test", 3)], csv_path, header=("word", "count"))
+        assert await read_text_async(csv_path) == "word,count\ntest,3\n"
+        assert await read_text_async(tmp_path / "none.txt") == "Файл не найден."
+
+        await csv_to_json_async(str(csv_path), str(tmp_path / "words.json"))
+        with pytest.raises(ValueError):
+            await csv_to_json_async(str(csv_path), str(tmp_path / "words.txt"))
+
+        students = [Student("Иванов Иван", "2000-05-15", "SE-01", 4.5)]
+        await students_to_json_async(students, str(tmp_path / "s.json"))
+        assert await students_from_json_async(str(tmp_path / "s.json")) == students
+        assert await students_from_json_async(str(tmp_path / "none.json")) == []
+
+    asyncio.run(scenario())
+    data = json.loads((tmp_path / "words.json").read_text(encoding="utf-8"))
+    assert data == [{"word": "test", "count": "3"}]
+
+
+def test_convert_many_async_collects_errors(tmp_path: Path):
+    pairs = []
+    for i in range(20):
+        src = tmp_path / f"{i}.csv"
+        src.write_text(f"a\n{i}\n", encoding="utf-8")
+        pairs.append((str(src), str(tmp_path / f"{i}.json")))
+    pairs.append((str(tmp_path / "missing.csv"), str(tmp_path / "missing.json")))
+
+    errors = asyncio.run(convert_many_async(pairs))
+    assert errors[:20] == [None] * 20
+    assert isinstance(errors[20], FileNotFoundError)
+    assert json.loads((tmp_path / "7.json").read_text(encoding="utf-8")) == [{"a": "7"}]
@@ -0,0 +1,82 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+# cli_convert - скрипт с импортом соседнего ex1
+sys.path.append(os.path.join(ROOT, "src", "lab6"))
+
+import cli_convert
+from src.lab5.batch import collect_tasks, convert_batch
+
+
+def _write_inputs(folder: Path, count: int) -> None:
+    folder.mkdir()
+    for i in range(count):
+        (folder / f"f{i}.csv").write_text(f"a,b\n{i},x\n", encoding="utf-8")
+
+
+def test_batch_directory_skips_fresh_outputs(tmp_path: Path):
+    """
+    Пакетная конвертация папки:
+    1. Все файлы конвертируются в пуле процессов
+    2. Повторный запуск пропускает файлы, результат которых новее входа
+    3. Ошибка одного файла попадает в сводку и не останавливает остальные
+    """
+    src = tmp_path / "in"
+    out = tmp_path / "out"
+    _write_inputs(src, 5)
+
+    tasks = collect_tasks("csv2json", str(src), str(out))
+    assert len(tasks) == 5
+    stats = convert_batch(tasks, jobs=2)
+    assert (stats["converted"], stats["skipped"], stats["failures"]) == (5, 0, [])
+    assert json.loads((out / "f3.json").read_text(encoding="utf-8")) == [
+        {"a": "3", "b": "x"}
+    ]
+
+    (src / "bad.csv").write_text("", encoding="utf-8")
+    stats = convert_batch(collect_tasks("csv2json", str(src), str(out)), jobs=1)
+    assert stats["files"] == 6 and stats["skipped"] == 5
+    assert stats["converted"] == 0
+    assert [path for path, _ in stats["failures"]] == [str(src / "bad.csv")]
+
+    stats = convert_batch(tasks, jobs=1, force=True)
+    assert stats["converted"] == 5 and stats["skipped"] == 0
+
+
+def test_batch_glob_and_manifest(tmp_path: Path):
+    src = tmp_path / "in"
+    _write_inputs(src, 3)
+    (src / "sub").mkdir()
+    (src / "sub" / "f0.csv").write_text("a\n1\n", encoding="utf-8")
+
+    tasks = collect_tasks("csv2col", str(src / "**" / "*.csv"), str(tmp_path / "o"))
+    outputs = sorted(Path(dst).name for _, _, dst in tasks)
+    assert outputs == ["f0.col", "f0_2.col", "f1.col", "f2.col"]
+
+    manifest = tmp_path / "list.txt"
+    manifest.write_text(
+        "# входные файлы\nin/f1.csv\n\nin/f2.csv\tcustom/f2.json\n", encoding="utf-8"
+    )
+    tasks = collect_tasks("csv2json", str(manifest), str(tmp_path / "o"))
+    assert tasks == [
+        ("csv2json", str(tmp_path / "in/f1.csv"), str(tmp_path / "o/f1.json")),
+        ("csv2json", str(tmp_path / "in/f2.csv"), str(tmp_path / "custom/f2.json")),
+    ]
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "два"])
+def test_cli_rejects_bad_jobs(value: str, capsys):
+    parser = cli_convert.build_parser()
+    for option in ("--jobs", "--workers"):
+        argv = ["csv2xlsx", "--in", "a.csv", "--out", "a.xlsx", option, value]
+        with pytest.raises(SystemExit):
+            parser.parse_args(argv)
+        assert option in capsys.readouterr().err
+    args = parser.parse_args(["csv2json", "--in", "a", "--out", "b", "--jobs", "2"])
+    assert args.jobs == 2
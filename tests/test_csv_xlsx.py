@@ -0,0 +1,123 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.lab5 import csv_xlsx
+from src.lab5.csv_xlsx import csv_to_xlsx, csv_to_xlsx_split, csv_to_xlsx_stream
+
+ROWS = [
+    ["name", "age", "city"],
+    ["Аня", "20", "Москва"],
+    ["Bob", "21", "Санкт-Петербург"],
+    ["Очень длинное имя студента", "22", ""],
+]
+
+
+def write_csv(path: Path, rows) -> None:
+    path.write_text("\n".join(",".join(row) for row in rows) + "\n", encoding="utf-8")
+
+
+def read_sheet(sheet) -> tuple:
+    values = [list(row) for row in sheet.iter_rows(values_only=True)]
+    widths = {
+        letter: dim.width
+        for letter, dim in sheet.column_dimensions.items()
+        if dim.width
+    }
+    return values, widths
+
+
+def test_stream_matches_csv_to_xlsx(tmp_path: Path):
+    src = tmp_path / "people.csv"
+    write_csv(src, ROWS)
+    csv_to_xlsx(str(src), str(tmp_path / "full.xlsx"))
+    csv_to_xlsx_stream(str(src), str(tmp_path / "stream.xlsx"))
+
+    full = openpyxl.load_workbook(tmp_path / "full.xlsx")
+    stream = openpyxl.load_workbook(tmp_path / "stream.xlsx")
+    assert full.sheetnames == stream.sheetnames == ["Sheet1"]
+    full_values, full_widths = read_sheet(full["Sheet1"])
+    stream_values, stream_widths = read_sheet(stream["Sheet1"])
+    # Пустая ячейка: None в обоих вариантах
+    assert stream_values == full_values
+    assert stream_widths == full_widths
+    assert full_widths["A"] == len(ROWS[3][0]) + 2
+    assert full_widths["B"] == 8
+
+
+def test_stream_infers_types(tmp_path: Path):
+    src = tmp_path / "people.csv"
+    write_csv(src, ROWS)
+    csv_to_xlsx_stream(str(src), str(tmp_path / "typed.xlsx"), infer_types=True)
+    sheet = openpyxl.load_workbook(tmp_path / "typed.xlsx")["Sheet1"]
+    assert [row[1] for row in sheet.iter_rows(values_only=True)] == [
+        "age",
+        20,
+        21,
+        22,
+    ]
+
+
+def make_rows(count: int) -> list:
+    return [["id", "name"]] + [[str(i), f"студент {i}"] for i in range(count)]
+
+
+def sheet_values(path: Path) -> dict:
+    book = openpyxl.load_workbook(path)
+    return {
+        name: [list(row) for row in book[name].iter_rows(values_only=True)]
+        for name in book.sheetnames
+    }
+
+
+def test_split_sheets_and_files(tmp_path: Path):
+    src = tmp_path / "big.csv"
+    rows = make_rows(5)
+    write_csv(src, rows)
+
+    stats = csv_to_xlsx_split(str(src), str(tmp_path / "big.xlsx"), max_rows=3)
+    assert (stats["rows"], stats["parts"]) == (5, 3)
+    # Заголовок повторяется на каждом листе, max_rows включает его
+    assert sheet_values(tmp_path / "big.xlsx") == {
+        "Sheet1": [rows[0], rows[1], rows[2]],
+        "Sheet2": [rows[0], rows[3], rows[4]],
+        "Sheet3": [rows[0], rows[5]],
+    }
+
+    stats = csv_to_xlsx_split(
+        str(src), str(tmp_path / "part.xlsx"), mode="files", max_rows=4, workers=2
+    )
+    assert stats["outputs"] == [
+        str(tmp_path / "part_1.xlsx"),
+        str(tmp_path / "part_2.xlsx"),
+    ]
+    assert sheet_values(tmp_path / "part_1.xlsx") == {"Sheet1": rows[:4]}
+    assert sheet_values(tmp_path / "part_2.xlsx") == {
+        "Sheet1": [rows[0], rows[4], rows[5]]
+    }
+
+    with pytest.raises(ValueError):
+        csv_to_xlsx_split(str(src), str(tmp_path / "bad.xlsx"), max_rows=1)
+
+
+@pytest.mark.parametrize("convert", [csv_to_xlsx, csv_to_xlsx_stream])
+def test_rows_over_excel_limit_are_split(tmp_path: Path, monkeypatch, convert):
+    monkeypatch.setattr(csv_xlsx, "EXCEL_MAX_ROWS", 3)
+    src = tmp_path / "big.csv"
+    rows = make_rows(3)
+    write_csv(src, rows)
+    convert(str(src), str(tmp_path / "big.xlsx"))
+    assert sheet_values(tmp_path / "big.xlsx") == {
+        "Sheet1": rows[:3],
+        "Sheet2": [rows[0], rows[3]],
+    }
+
+    # Ровно по лимиту: один лист
+    write_csv(src, rows[:3])
+    convert(str(src), str(tmp_path / "fit.xlsx"))
+    assert sheet_values(tmp_path / "fit.xlsx") == {"Sheet1": rows[:3]}
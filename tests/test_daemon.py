@@ -0,0 +1,108 @@
+﻿import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lab6.daemon import Daemon, request
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="нужны Unix-сокеты"
+)
+
+
+def start(server: Daemon) -> threading.Thread:
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=lambda: asyncio.run(server.serve(ready=ready.set)), daemon=True
+    )
+    thread.start()
+    assert ready.wait(10), "демон не запустился"
+    return thread
+
+
+@pytest.fixture
+def daemon(tmp_path: Path):
+    server = Daemon(str(tmp_path / "d.sock"), workers=2)
+    thread = start(server)
+    yield server
+    request({"cmd": "shutdown"}, server.socket_path)
+    thread.join(10)
+    assert not os.path.exists(server.socket_path)
+
+
+def test_daemon_convert_stats_and_counters(daemon, tmp_path: Path):
+    """
+    Демон на Unix-сокете:
+    1. Конвертация и статистика выполняются в пуле процессов
+    2. Ошибка задания возвращается в ответе, демон продолжает работу
+    3. Пакетный режим и счетчики запросов
+    """
+    src = tmp_path / "a.csv"
+    src.write_text("name,age\nАня,20\n", encoding="utf-8")
+    dst = tmp_path / "a.json"
+    payload = {"cmd": "csv2json", "input": str(src), "output": str(dst)}
+    assert request(payload, daemon.socket_path) == {"ok": True, "result": {}}
+    assert json.loads(dst.read_text(encoding="utf-8")) == [{"name": "Аня", "age": "20"}]
+
+    text = tmp_path / "t.txt"
+    text.write_text("мама мыла раму, мама\n", encoding="utf-8")
+    payload = {"cmd": "stats", "input": str(text), "top": 1}
+    response = request(payload, daemon.socket_path)
+    assert response["result"] == {"total": 4, "unique": 3, "top": [["мама", 2]]}
+
+    missing = {"cmd": "csv2json", "input": str(tmp_path / "no.csv"), "output": "x"}
+    response = request(missing, daemon.socket_path)
+    assert not response["ok"] and "не существует" in response["error"]
+    assert not request({"cmd": "nope"}, daemon.socket_path)["ok"]
+    response = request({"cmd": "csv2json", "input": str(src)}, daemon.socket_path)
+    assert response == {"ok": False, "error": "Нет обязательного поля: output"}
+
+    batch = {
+        "cmd": "csv2col",
+        "input": str(tmp_path / "*.csv"),
+        "output": str(tmp_path / "out"),
+        "batch": True,
+    }
+    result = request(batch, daemon.socket_path)["result"]
+    assert (result["files"], result["converted"], result["failures"]) == (1, 1, [])
+    assert (tmp_path / "out" / "a.col").exists()
+
+    status = request({"cmd": "status"}, daemon.socket_path)["result"]
+    assert status["requests"] == 6 and status["errors"] == 3
+    assert status["commands"]["csv2json"]["count"] == 3
+    assert status["in_flight"] == 0
+
+
+def test_daemon_keeps_running_instance_and_replaces_stale_socket(daemon, tmp_path):
+    # Второй демон на том же сокете не отнимает его у работающего
+    with pytest.raises(RuntimeError, match="уже запущен"):
+        asyncio.run(Daemon(daemon.socket_path).serve())
+    assert request({"cmd": "status"}, daemon.socket_path)["ok"]
+
+    # Сокет, оставшийся от упавшего демона, заменяется
+    stale = str(tmp_path / "stale.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(stale)
+    assert os.path.exists(stale)
+    thread = start(Daemon(stale, workers=1))
+    assert request({"cmd": "shutdown"}, stale)["ok"]
+    thread.join(10)
+
+
+def test_daemon_reports_missing_fields(daemon):
+    # Запрос без нужного поля получает понятную ошибку, а не текст KeyError
+    for payload, field in (
+        ({}, "cmd"),
+        ({"cmd": "stats"}, "input"),
+        ({"cmd": "json2csv", "output": "a.csv"}, "input"),
+        ({"cmd": "csv2col", "input": "a.csv", "batch": True}, "output"),
+    ):
+        response = request(payload, daemon.socket_path)
+        assert response == {"ok": False, "error": f"Нет обязательного поля: {field}"}
@@ -0,0 +1,46 @@
+import json
+import sys
+import os
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.lab4.text3 import normalize, tokenize, count_freq
+from src.lab4.freq_index import update_index
+
+
+def full_count(path: Path) -> dict:
+    return dict(count_freq(tokenize(normalize(path.read_text(encoding="utf-8")))))
+
+
+def test_update_index_only_reads_appended_bytes(tmp_path: Path):
+    """
+    Повторный запуск после дописывания в файл продолжает с места остановки
+    и дает те же частоты, что и полный пересчет.
+    """
+    src = tmp_path / "log.txt"
+    index = tmp_path / "index.json"
+    src.write_text("Привет мир\nпривет ёжик, hel", encoding="utf-8")
+
+    assert update_index(src, index) == full_count(src)
+    processed = json.loads(index.read_text(encoding="utf-8"))["processed"]
+
+    with src.open("a", encoding="utf-8") as f:
+        f.write("lo world\nМир\n")
+
+    assert update_index(src, index) == full_count(src)
+    stored = json.loads(index.read_text(encoding="utf-8"))
+    assert stored["processed"] > processed
+    assert stored["processed"] == src.stat().st_size
+
+
+def test_update_index_rebuilds_when_file_rewritten(tmp_path: Path):
+    src = tmp_path / "log.txt"
+    index = tmp_path / "index.json"
+    src.write_text("один два три\n", encoding="utf-8")
+    update_index(src, index)
+
+    src.write_text("четыре пять шесть семь\n", encoding="utf-8")
+    assert update_index(src, index) == full_count(src)
+
+    src.write_text("восемь\n", encoding="utf-8")
+    assert update_index(src, index) == full_count(src)
@@ -0,0 +1,45 @@
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.lab4.io_txt_csv import iter_text
+
+TEXT = "мама мыла раму\nжили-были 3 кота\n" * 50
+
+
+def test_iter_text_keeps_multibyte_chars_across_chunks(tmp_path: Path):
+    path = tmp_path / "input.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    # Нечетный размер куска режет двухбайтовые буквы пополам
+    chunks = list(iter_text(path, chunk_size=7))
+    assert "".join(chunks) == TEXT
+    assert all(chunks)
+
+
+def test_iter_text_continues_from_current_position(tmp_path: Path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"skip\n" + TEXT.encode("utf-8"))
+    with open(path, "rb") as f:
+        f.readline()
+        assert "".join(iter_text(f, chunk_size=5)) == TEXT
+
+
+def test_iter_text_fallback_without_mmap():
+    # BytesIO не имеет fileno(): читается обычным read(); по байту,
+    # чтобы половина буквы давала пустой результат декодера
+    chunks = list(iter_text(io.BytesIO(TEXT.encode("utf-8")), chunk_size=1))
+    assert "".join(chunks) == TEXT
+    assert all(chunks)
+    assert list(iter_text(io.BytesIO(b""))) == []
+
+
+@pytest.mark.parametrize("chunk_size", [3, 1 << 20])
+def test_iter_text_decode_error(tmp_path: Path, chunk_size: int):
+    path = tmp_path / "cp1251.txt"
+    path.write_bytes(TEXT.encode("cp1251"))
+    with pytest.raises(UnicodeDecodeError):
+        list(iter_text(path, chunk_size=chunk_size))
@@ -1,4 +1,5 @@
 ﻿import pytest
+import io
 import json
 import csv
 from pathlib import Path
@@ -10,7 +11,15 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Импортируем функции для тестирования из модуля json_csv
-from src.lab5.json_csv import json_to_csv, csv_to_json
+from src.lab5.json_csv import (
+    json_to_csv,
+    csv_to_json,
+    json_to_csv_stream,
+    csv_to_json_stream,
+    iter_json_array,
+)
+from src.lab5.column_types import infer_column_type
+from src.lab5.columnar import ColumnarFile, csv_to_columnar, json_to_columnar
 
 
 def test_json_to_csv_roundtrip(tmp_path: Path):
@@ -300,3 +309,290 @@ def test_json_to_csv_empty_file(tmp_path: Path):
     # Проверяем что функция выбрасывает ValueError
     with pytest.raises(ValueError):
         json_to_csv(str(src), str(dst))
+
+
+def test_json_to_csv_stream_matches_json_to_csv(tmp_path: Path):
+    """
+    Тестирует потоковый JSON → CSV с маленьким куском чтения
+
+    Сценарий:
+    1. Создаем JSON с записями с разными наборами полей
+    2. Конвертируем обычной и потоковой функцией
+    3. Проверяем что файлы совпадают побайтно
+    """
+    src = tmp_path / "people.json"
+    expected = tmp_path / "expected.csv"
+    dst = tmp_path / "stream.csv"
+
+    data = [
+        {"name": "Алиса", "age": 25, "note": 'строка с "кавычками", и [скобками]'},
+        {"name": "Bob", "city": "Moscow"},
+        {"age": 30, "country": "Russia"},
+    ]
+    src.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    json_to_csv(str(src), str(expected))
+    json_to_csv_stream(str(src), str(dst), chunk_size=7)
+
+    assert dst.read_bytes() == expected.read_bytes()
+
+
+def test_json_to_csv_stream_header_options(tmp_path: Path):
+    """
+    Тестирует заголовок из первой записи и заголовок пользователя
+    """
+    src = tmp_path / "people.json"
+    dst = tmp_path / "people.csv"
+    src.write_text(
+        json.dumps([{"name": "Alice", "age": 22}, {"age": 25, "name": "Bob"}]),
+        encoding="utf-8",
+    )
+
+    json_to_csv_stream(str(src), str(dst), header="first")
+    with dst.open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == ["age", "name"]
+    assert rows[1]["name"] == "Bob"
+
+    json_to_csv_stream(str(src), str(dst), header=["name", "age", "city"])
+    with dst.open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == ["name", "age", "city"]
+    assert rows[0]["city"] == ""
+
+    with pytest.raises(ValueError):
+        # у записей есть поле age, которого нет в заголовке
+        json_to_csv_stream(str(src), str(tmp_path / "other.csv"), header=["name"])
+
+
+def test_json_to_csv_stream_invalid_input(tmp_path: Path):
+    """
+    Тестирует те же ошибки, что и у json_to_csv: некорректный JSON,
+    не список, элемент не словарь, пустой файл
+    """
+    dst = tmp_path / "output.csv"
+    for content in ("not a json", '{"a": 1}', '[{"a": 1}, 2]', "", '[{"a": 1}'):
+        src = tmp_path / "broken.json"
+        src.write_text(content, encoding="utf-8")
+        with pytest.raises(ValueError):
+            json_to_csv_stream(str(src), str(dst), chunk_size=3)
+        assert not dst.exists()
+
+
+def test_iter_json_array_values_split_by_chunks():
+    """
+    Тестирует границы кусков внутри чисел, true/false/null и строк:
+    при любом размере куска результат совпадает с json.loads
+    """
+    data = [
+        12345,
+        678,
+        -1.5e10,
+        0.25,
+        True,
+        False,
+        None,
+        'строка \\u0444 с "кавычками"',
+        {"a": [1, 22, 333], "b": "x"},
+        98765432109876543210,
+    ]
+    text = json.dumps(data, ensure_ascii=False)
+    for chunk_size in range(1, 12):
+        got = list(iter_json_array(io.StringIO(text), chunk_size))
+        assert got == data, chunk_size
+    assert list(iter_json_array(io.StringIO("[12345, 678]"), 3)) == [12345, 678]
+
+
+def test_iter_json_array_error_offsets():
+    """
+    Тестирует, что позиция ошибки указывает место в файле, а не в буфере,
+    и что битый JSON не дочитывается до конца
+    """
+    text = '[\n  {"a": 1},\n  {"a": 2} {"a": 3}\n]' + " " * 1000
+    expected = None
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as e:
+        expected = (e.pos, e.lineno, e.colno)
+    for chunk_size in (2, 5, 64):
+        with pytest.raises(json.JSONDecodeError) as info:
+            list(iter_json_array(io.StringIO(text), chunk_size))
+        err = info.value
+        assert (err.pos, err.lineno, err.colno) == expected
+        assert f"(char {expected[0]})" in str(err)
+
+    f = io.StringIO("[1, 2] 3" + " " * 100)
+    with pytest.raises(json.JSONDecodeError) as info:
+        list(iter_json_array(f, 4))
+    assert info.value.msg == "Extra data" and info.value.pos == 7
+
+    # Ошибка в начале большого файла: читается только пара кусков
+    f = io.StringIO('[{"a": @}' + ", 1" * 10000 + "]")
+    with pytest.raises(json.JSONDecodeError) as info:
+        list(iter_json_array(f, 16))
+    assert info.value.pos == 7
+    assert f.tell() < 100
+
+
+def test_csv_to_json_stream_formats(tmp_path: Path):
+    """
+    Тестирует потоковый CSV → JSON
+
+    Сценарий:
+    1. С отступом результат побайтно совпадает с csv_to_json
+    2. Без отступа и в JSON Lines данные те же
+    3. Пустой CSV дает ValueError
+    """
+    src = tmp_path / "people.csv"
+    with src.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["name", "age"])
+        writer.writeheader()
+        writer.writerow({"name": "Алиса", "age": "22"})
+        writer.writerow({"name": 'Bob "B"', "age": ""})
+
+    expected = tmp_path / "expected.json"
+    csv_to_json(str(src), str(expected))
+
+    pretty = tmp_path / "pretty.json"
+    csv_to_json_stream(str(src), str(pretty))
+    assert pretty.read_bytes() == expected.read_bytes()
+
+    compact = tmp_path / "compact.json"
+    csv_to_json_stream(str(src), str(compact), indent=None)
+    assert json.loads(compact.read_text(encoding="utf-8")) == json.loads(
+        expected.read_text(encoding="utf-8")
+    )
+
+    lines = tmp_path / "people.jsonl"
+    csv_to_json_stream(str(src), str(lines), lines=True)
+    rows = [json.loads(line) for line in lines.read_text(encoding="utf-8").splitlines()]
+    assert rows == json.loads(expected.read_text(encoding="utf-8"))
+
+    empty = tmp_path / "empty.csv"
+    empty.write_text("name,age\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        csv_to_json_stream(str(empty), str(tmp_path / "out.json"))
+
+
+def test_infer_column_type():
+    """
+    Тестирует определение типа колонки по образцу значений
+    """
+    assert infer_column_type(["1", "-2", ""]) == "int"
+    assert infer_column_type(["1", "2.5", "1e3"]) == "float"
+    assert infer_column_type(["true", "False"]) == "bool"
+    assert infer_column_type(["2024-01-02", ""]) == "date"
+    assert infer_column_type(["2024-02-30"]) == "str"
+    assert infer_column_type(["007", "010"]) == "str"  # коды с ведущими нулями
+    assert infer_column_type(["", ""]) == "str"
+    assert infer_column_type(["2024-01-02"], ("int", "float")) == "str"
+    # inf и nan не бывают в JSON: такие колонки остаются строками
+    assert infer_column_type(["1.5", "1e400"]) == "str"
+    assert infer_column_type(["nan", "inf"]) == "str"
+
+
+def test_csv_to_json_stream_infinite_floats_stay_strings(tmp_path: Path):
+    """
+    Тестирует, что переполнение float не превращается в Infinity
+    ни в образце, ни после него
+    """
+    src = tmp_path / "values.csv"
+    dst = tmp_path / "values.json"
+    src.write_text("a,b\n1.5,2.5\n1e400,3.5\n-2.0,-1e999\n", encoding="utf-8")
+
+    csv_to_json_stream(str(src), str(dst), infer_types=True, sample_rows=2)
+    text = dst.read_text(encoding="utf-8")
+    assert "Infinity" not in text
+    data = json.loads(text)
+    assert [row["a"] for row in data] == ["1.5", "1e400", "-2.0"]
+    assert [row["b"] for row in data] == [2.5, 3.5, "-1e999"]
+
+
+def test_csv_to_json_stream_infer_types(tmp_path: Path):
+    """
+    Тестирует CSV → JSON с определением типов колонок
+
+    Сценарий:
+    1. Числовые и логические колонки становятся JSON-числами и true/false
+    2. Пустые ячейки типизированных колонок становятся null
+    3. Значение после образца, не подходящее под тип, остается строкой
+    """
+    src = tmp_path / "people.csv"
+    dst = tmp_path / "people.json"
+    src.write_text(
+        "name,age,gpa,active,born\n"
+        "Alice,22,4.5,true,2001-02-03\n"
+        "Bob,,3,false,2000-01-01\n"
+        "Eve,n/a,5,true,\n",
+        encoding="utf-8",
+    )
+
+    csv_to_json_stream(str(src), str(dst), infer_types=True, sample_rows=2)
+    data = json.loads(dst.read_text(encoding="utf-8"))
+
+    assert data[0] == {
+        "name": "Alice",
+        "age": 22,
+        "gpa": 4.5,
+        "active": True,
+        "born": "2001-02-03",
+    }
+    assert data[1]["age"] is None
+    assert data[1]["gpa"] == 3.0
+    assert data[2]["age"] == "n/a"
+
+
+def test_columnar_roundtrip(tmp_path: Path):
+    """
+    Тестирует CSV/JSON → .col и чтение через mmap
+
+    Сценарий:
+    1. Типы колонок определяются по всем строкам, "007" остается строкой
+    2. Числовые колонки читаются как memoryview, пустые ячейки - через nulls()
+    3. JSON с теми же данными дает те же строки
+    """
+    src = tmp_path / "people.csv"
+    col = tmp_path / "people.col"
+    src.write_text(
+        "name,age,gpa,active,born,code\n"
+        "Аня,22,4.5,true,2001-02-03,007\n"
+        "Bob,,3,false,,010\n",
+        encoding="utf-8",
+    )
+
+    assert csv_to_columnar(str(src), str(col)) == 2
+    with ColumnarFile(col) as table:
+        types = [table.column_type(name) for name in table.columns]
+        assert types == ["str", "int", "float", "bool", "date", "str"]
+        assert sum(table.column("gpa")) == 7.5
+        assert list(table.nulls("age")) == [0, 1]
+        assert table.nulls("gpa") is None
+        rows = list(table.rows())
+    assert rows[0]["name"] == "Аня"
+    assert rows[0]["born"].isoformat() == "2001-02-03"
+    assert rows[1]["age"] is None and rows[1]["code"] == "010"
+
+    json_src = tmp_path / "people.json"
+    json_col = tmp_path / "people_json.col"
+    json_src.write_text(
+        json.dumps([{"a": 1, "b": "x"}, {"a": 2, "b": None}]), encoding="utf-8"
+    )
+    json_to_columnar(str(json_src), str(json_col))
+    with ColumnarFile(json_col) as table:
+        assert list(table.rows()) == [{"a": 1, "b": "x"}, {"a": 2, "b": ""}]
+
+    with pytest.raises(ValueError):
+        csv_to_columnar(str(src), str(tmp_path / "people.bin"))
+
+
+def test_columnar_duplicate_header(tmp_path: Path):
+    """
+    Тестирует, что повторяющиеся имена колонок не затирают друг друга
+    """
+    src = tmp_path / "dup.csv"
+    col = tmp_path / "dup.col"
+    src.write_text("a,b,a\n1,2,3\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Повторяющиеся имена колонок: a"):
+        csv_to_columnar(str(src), str(col))
+    assert not col.exists()
@@ -0,0 +1,58 @@
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Модули, без которых подкоманда должна обходиться при запуске
+HEAVY = ("concurrent.futures", "openpyxl", "column_types", "lab5.column_types")
+
+
+def loaded_after(script: Path, *argv: str) -> set:
+    """Запускает скрипт в новом процессе и возвращает загруженные из HEAVY модули."""
+    code = textwrap.dedent(f"""
+        import json, runpy, sys
+        sys.argv = {[str(script), *argv]!r}
+        sys.path.insert(0, {str(script.parent)!r})
+        try:
+            runpy.run_path(sys.argv[0], run_name="__main__")
+        finally:
+            print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))
+        """)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(json.loads(proc.stdout.splitlines()[-1]))
+
+
+def test_json2csv_skips_heavy_imports(tmp_path: Path):
+    src = tmp_path / "people.json"
+    src.write_text('[{"name": "Аня", "age": 20}]', encoding="utf-8")
+    cli = ROOT / "src" / "lab6" / "cli_convert.py"
+    out = tmp_path / "people.csv"
+    assert loaded_after(cli, "json2csv", "--in", str(src), "--out", str(out)) == set()
+    assert out.exists()
+
+
+def test_csv2xlsx_imports_pool_only_for_split(tmp_path: Path):
+    pytest.importorskip("openpyxl")
+    src = tmp_path / "people.csv"
+    src.write_text("name,age\nАня,20\n", encoding="utf-8")
+    cli = ROOT / "src" / "lab6" / "cli_convert.py"
+    out = tmp_path / "people.xlsx"
+    loaded = loaded_after(cli, "csv2xlsx", "--in", str(src), "--out", str(out))
+    assert "concurrent.futures" not in loaded
+    assert out.exists()
+
+
+def test_text_report_single_file_skips_pool(tmp_path: Path):
+    src = tmp_path / "input.txt"
+    src.write_text("мама мыла раму", encoding="utf-8")
+    script = ROOT / "src" / "lab4" / "text_report.py"
+    args = ("--in", str(src), "--out-dir", str(tmp_path))
+    assert "concurrent.futures" not in loaded_after(script, *args)
+    assert (tmp_path / "report.csv").exists()
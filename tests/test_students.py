@@ -0,0 +1,281 @@
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lab8 import Student, students_from_dicts, students_from_json
+from src.lab8 import StudentTable, students_from_json_bulk
+from src.lab8 import iter_students_ndjson, students_from_ndjson, students_to_ndjson
+from src.lab8 import StudentSnapshot, student_ages, write_snapshot
+from src.lab8 import compile_codec
+
+RECORDS = [
+    {"fio": "Иванов Иван", "birthdate": "2000-05-15", "group": "SE-01", "gpa": 4.5},
+    {"fio": "Петрова Анна", "birthdate": "2001-2-3", "group": "SE-02", "gpa": "3.8"},
+    {"fio": "Без даты", "group": "SE-01", "gpa": 4.0},
+    {"fio": "Плохая дата", "birthdate": "2001-02-30", "group": "SE-01", "gpa": 4},
+    {"fio": "Формат", "birthdate": "15.05.2000", "group": "SE-01", "gpa": 4},
+    {"fio": "Балл", "birthdate": "2000-01-01", "group": "SE-01", "gpa": 6},
+    {"fio": "Не число", "birthdate": "2000-01-01", "group": "SE-01", "gpa": "x"},
+    {"fio": "Пробел", "birthdate": "2000-01- 5", "group": "SE-03", "gpa": 0},
+    {"fio": "Нет", "birthdate": "0000-01-01", "group": "SE-03", "gpa": 1},
+    {"fio": "NaN", "birthdate": "2000-01-01", "group": "SE-03", "gpa": "nan"},
+]
+
+
+def _per_item(records):
+    # Поэлементный путь students_from_json
+    accepted, skipped = [], []
+    for index, item in enumerate(records):
+        try:
+            accepted.append(Student.from_dict(item))
+        except (KeyError, ValueError) as e:
+            skipped.append((index, str(e)))
+    return accepted, skipped
+
+
+def _age_on(student, today: date) -> int:
+    # Полных лет на дату today, без кода модели
+    year, month, day = map(int, student.birthdate.split("-"))
+    had_birthday = (today.month, today.day) >= (month, day)
+    return today.year - year - (0 if had_birthday else 1)
+
+
+def test_bulk_matches_per_item_path():
+    """Пакетная загрузка принимает и пропускает те же записи с теми же сообщениями"""
+    assert students_from_dicts(RECORDS) == _per_item(RECORDS)
+
+
+def test_bulk_reports_type_errors_and_loads_file(tmp_path: Path, capsys):
+    records = RECORDS + [["не", "словарь"], {**RECORDS[0], "birthdate": 20000515}]
+    students, errors = students_from_dicts(records)
+    assert len(students) == 3
+    assert [index for index, _ in errors][-2:] == [10, 11]
+
+    path = tmp_path / "students.json"
+    path.write_text(json.dumps(RECORDS, ensure_ascii=False), encoding="utf-8")
+    assert students_from_json_bulk(str(path)) == students_from_json(str(path))
+    assert "Пропущено элементов: 7" in capsys.readouterr().out
+
+
+def test_ndjson_streams_appends_and_skips_bad_lines(tmp_path: Path, capsys):
+    path = tmp_path / "students.ndjson"
+    expected, _ = _per_item(RECORDS)
+    assert students_to_ndjson(iter(expected[:2]), str(path)) == 2
+    # Оборванная строка в конце файла не портит дозапись
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"fio": "Оборв')
+    assert students_to_ndjson(expected[2:], str(path), append=True) == 1
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n[1, 2]\n" + json.dumps(RECORDS[2], ensure_ascii=False) + "\n")
+
+    capsys.readouterr()
+    stream = iter_students_ndjson(str(path))
+    assert next(stream) == expected[0]
+    assert list(stream) == expected[1:]
+    out = capsys.readouterr().out
+    assert [line.split(":")[0] for line in out.splitlines()] == [
+        "Пропущена строка 3",
+        "Пропущена строка 6",
+        "Пропущена строка 7",
+    ]
+    assert students_from_ndjson(str(tmp_path / "нет.ndjson")) == []
+
+
+def test_snapshot_round_trip(tmp_path: Path):
+    students, _ = _per_item(RECORDS)
+    path = tmp_path / "students.stus"
+    assert write_snapshot(iter(students), path) == 3
+    with StudentSnapshot(path) as snapshot:
+        assert len(snapshot) == 3
+        # Дата хранится номером дня и возвращается как YYYY-MM-DD
+        assert [s.birthdate for s in snapshot] == [
+            "2000-05-15",
+            "2001-02-03",
+            "2000-01-05",
+        ]
+        expected = {**students[-1].to_dict(), "birthdate": "2000-01-05"}
+        assert snapshot[-1].to_dict() == expected
+        assert snapshot.to_students() == list(snapshot)
+        assert [(s.fio, s.group, s.gpa) for s in snapshot] == [
+            (s.fio, s.group, s.gpa) for s in students
+        ]
+
+    path.write_bytes(b"STUS")
+    with pytest.raises(ValueError, match="не является снимком"):
+        StudentSnapshot(path)
+
+
+def test_age_cache_follows_date_and_birthdate():
+    student = Student("Иванов Иван", "2000-05-15", "SE-01", 4.5)
+    assert student.age(date(2020, 5, 14)) == 19
+    assert student.age(date(2020, 5, 15)) == 20
+    student.birthdate = "2001-05-15"
+    assert student.age(date(2020, 5, 15)) == 19
+    assert student.age() == _age_on(student, date.today())
+
+    # Объекты пакетной загрузки создаются без __init__
+    students, _ = students_from_dicts(RECORDS)
+    as_of = date(2021, 2, 3)
+    assert student_ages(students, as_of) == [20, 20, 21]
+    assert [s.age(as_of) for s in students] == [20, 20, 21]
+
+
+def test_compiled_codec_matches_model_methods():
+    codec = compile_codec(Student)
+    accepted, skipped = [], []
+    for index, item in enumerate(RECORDS):
+        try:
+            accepted.append(codec.decode(item))
+        except (KeyError, ValueError) as e:
+            skipped.append((index, str(e)))
+    assert (accepted, skipped) == _per_item(RECORDS)
+
+    dicts = codec.encode_many(accepted)
+    assert dicts == [student.to_dict() for student in accepted]
+    assert codec.encode(accepted[0]) == dicts[0]
+    trusted = compile_codec(Student, trusted=True)
+    assert trusted.decode_many(dicts) == accepted
+    assert compile_codec(Student) is codec
+    with pytest.raises(TypeError):
+        compile_codec(dict)
+
+
+def test_compiled_codec_init_false_fields():
+    @dataclass
+    class Row:
+        name: str
+        tags: List[str] = field(init=False, default_factory=list)
+        source: str = field(init=False, default="json")
+        size: int = field(init=False)
+
+        def __post_init__(self):
+            self.size = len(self.name)
+
+    row = Row("Аня")
+    row.tags.append("новый")
+    codec = compile_codec(Row)
+    data = codec.encode(row)
+    assert data == {"name": "Аня", "tags": ["новый"], "source": "json", "size": 3}
+    # Как и Row(**...): поля с init=False берутся не из словаря
+    decoded = codec.decode(data)
+    assert decoded == Row("Аня") and decoded.tags == []
+    assert codec.encode(decoded) == {**data, "tags": []}
+    # trusted восстанавливает записанные значения целиком
+    assert compile_codec(Row, trusted=True).decode(data) == row
+
+    @dataclass
+    class Broken:
+        size: int = field(init=False)
+
+    with pytest.raises(TypeError, match="init=False"):
+        compile_codec(Broken)
+
+
+def test_student_table_rows_behave_like_students():
+    students, _ = students_from_dicts(RECORDS)
+    table = StudentTable.from_students(students)
+    assert len(table) == len(students) == 3
+    assert table.groups == ["SE-01", "SE-02", "SE-03"]
+    assert not hasattr(students[0], "__dict__")
+
+    for row, student in zip(table, students):
+        assert str(row) == str(student)
+        assert row.age() == student.age()
+        as_of = date(2021, 2, 3)
+        assert row.age(as_of) == student.age(as_of)
+        assert row.fio == student.fio and row.gpa == student.gpa
+    # Дата хранится номером дня и отдается в полном формате
+    assert table[1].birthdate == "2001-02-03"
+    assert table[-1].to_dict() == {
+        "fio": "Пробел",
+        "birthdate": "2000-01-05",
+        "group": "SE-03",
+        "gpa": 0.0,
+    }
+    assert table[0] == students[0]
+    assert table.to_students()[0] == students[0]
+
+    from_dicts, errors = StudentTable.from_dicts(RECORDS)
+    assert list(from_dicts) == list(table)
+    assert len(errors) == 7
+
+
+def test_registry_queries_match_scans():
+    """
+    Ответы индексов совпадают с перебором списка, в том числе после
+    add/remove/update и для возраста на границе дня рождения (29 февраля)
+    """
+    import random
+    from datetime import date
+
+    from src.lab8 import StudentRegistry
+
+    rnd = random.Random(0)
+    students = [
+        Student(
+            f"Студент{i} Тест",
+            f"{rnd.randint(1996, 2004)}-{rnd.randint(1, 12)}-{rnd.randint(1, 28)}",
+            f"G-{rnd.randint(1, 5)}",
+            rnd.randint(0, 50) / 10,
+        )
+        for i in range(300)
+    ]
+    students.append(Student("Високосный Год", "2000-02-29", "G-1", 4.0))
+    registry = StudentRegistry(students[:200])
+    for student in students[200:]:
+        registry.add(student)
+    for sid in range(0, 300, 7):
+        registry.remove(sid)
+    for sid in range(1, 300, 11):
+        if sid in registry:
+            registry.update(sid, gpa=5.0, group="G-9", birthdate="2001-03-01")
+    alive = list(registry)
+    assert len(alive) == len(registry)
+
+    assert registry.by_group("G-9") == [s for s in alive if s.group == "G-9"]
+    fio = "Студент5 Тест"
+    assert registry.by_fio(fio) == [s for s in alive if s.fio == fio]
+    twin = registry.add(Student(fio, "2000-01-01", "G-1", 3.0))
+    assert len(registry.by_fio(fio)) == 2
+    registry.remove(twin)
+    assert registry.by_fio(fio) == [s for s in alive if s.fio == fio]
+    gpa_range = registry.gpa_between(3.0, 4.0)
+    assert sorted(map(id, gpa_range)) == sorted(
+        id(s) for s in alive if 3.0 <= s.gpa <= 4.0
+    )
+    assert [s.gpa for s in registry.top_gpa(5)] == sorted(
+        (s.gpa for s in alive), reverse=True
+    )[:5]
+
+    for today in (date(2021, 2, 28), date(2021, 3, 1), date(2024, 2, 29)):
+        expected = sorted(id(s) for s in alive if 20 <= _age_on(s, today) <= 21)
+        assert sorted(map(id, registry.age_between(20, 21, today))) == expected
+
+
+def test_registry_sorted_index_with_equal_keys():
+    """Одинаковые GPA и даты: записи в индексах упорядочены по (ключ, номер)"""
+    from src.lab8 import StudentRegistry
+
+    students = [Student(f"С{i}", "2000-01-01", "G", 4.0) for i in range(50)]
+    registry = StudentRegistry(students)
+    for sid in range(0, 50, 3):
+        registry.update(sid, gpa=3.0 if sid % 2 else 5.0)
+    for sid in range(1, 50, 4):
+        registry.remove(sid)
+    with pytest.raises(KeyError):
+        registry._gpa.remove(4.0, 1)
+
+    for index in (registry._gpa, registry._birth):
+        pairs = list(zip(index.keys, index.ids))
+        assert pairs == sorted(pairs)
+        assert sorted(index.ids) == sorted(sid for sid in range(50) if sid in registry)
+    alive = list(registry)
+    assert registry.gpa_between(4.0, 4.0) == [s for s in alive if s.gpa == 4.0]
@@ -1,9 +1,20 @@
 ﻿import pytest
+import io
+import random
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src.lib.text import normalize, tokenize, count_freq, top_n
+from src.lib.text import (
+    normalize,
+    tokenize,
+    count_freq,
+    top_n,
+    count_freq_stream,
+    count_words,
+)
+from src.lib.parallel import count_freq_parallel, split_ranges
+from src.lib.sketch import SpaceSaving, count_freq_approx, parse_size
 
 
 def test_normalize():
@@ -26,3 +37,123 @@ def test_top_n():
     freq = {"я": 3, "ты": 2, "мы": 1}
     result = top_n(freq, 2)
     assert result == [("я", 3), ("ты", 2)]
+
+
+def test_count_freq_stream_matches_pipeline():
+    text = "Ёжик  в тумане, ЁЖИК и Туман!\nHello hello WORLD ёлка"
+    expected = count_freq(tokenize(normalize(text)))
+    for chunk_size in (1, 2, 3, 5, 1024):
+        assert count_freq_stream(io.StringIO(text), chunk_size) == expected
+
+
+def test_count_freq_stream_word_on_chunk_boundary():
+    chunks = ["при", "вет м", "ир ", "ПРИ", "ВЕТ"]
+    assert count_freq_stream(chunks) == {"привет": 2, "мир": 1}
+    assert count_freq_stream(["ж", " ", "z"]) == {"ж": 1, "z": 1}
+
+
+def test_count_words_matches_pipeline():
+    text = "Ёжик  в тумане, ЁЖИК и Туман!\nHello hello WORLD ёлка"
+    assert count_words(text) == count_freq(tokenize(normalize(text)))
+    freq = {"ежик": 1}
+    count_words("ёжик", freq)
+    assert freq == {"ежик": 2}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_count_words_windows_do_not_split_words(monkeypatch, chunk_size):
+    import src.lib.text as text_module
+
+    monkeypatch.setattr(text_module, "CHUNK_SIZE", chunk_size)
+    text = "Ёжик  в тумане, ЁЖИК и Туман!\nHello hello WORLD ёлка"
+    assert count_words(text) == count_freq(tokenize(normalize(text)))
+
+
+def test_count_freq_parallel_matches_sequential(tmp_path):
+    text = "Ёжик  в тумане, ЁЖИК и Туман!\nHello hello WORLD ёлка\n" * 50
+    path = tmp_path / "input.txt"
+    path.write_text(text, encoding="utf-8")
+    expected = count_words(text)
+    for workers in (1, 3, 7):
+        result = count_freq_parallel(path, workers)
+        assert result == expected
+        assert top_n(result, 5) == top_n(expected, 5)
+
+
+def test_count_freq_parallel_wide_encodings(tmp_path):
+    # В UTF-16/UTF-32 байт пробела встречается внутри символов ("Ġ" = 0x0120),
+    # поэтому такие файлы считаются без деления на диапазоны
+    text = "Ġ Ġ слово word Ġ\n" * 50
+    expected = count_words(text)
+    for encoding in ("utf-16", "utf-16-le", "utf-32"):
+        path = tmp_path / f"{encoding}.txt"
+        path.write_text(text, encoding=encoding)
+        assert count_freq_parallel(path, 3, encoding=encoding) == expected
+
+
+def test_split_ranges_cover_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("привет мир hello " * 100, encoding="utf-8")
+    ranges = split_ranges(path, 4)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == path.stat().st_size
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+
+def test_top_n_large_vocabulary_keeps_tie_break():
+    freq = {f"w{i:03d}": i % 7 for i in range(500)}
+    expected = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
+    assert top_n(freq, 5) == expected[:5]
+    assert top_n(freq, 100) == expected[:100]
+
+
+def test_lab_top_n_heap_branch_keeps_tie_break():
+    import src.lib.text as text_module
+    from src.lab3 import text as lab3_text
+    from src.lab4 import text3 as lab4_text
+
+    freq = {f"w{i:03d}": i % 7 for i in range(500)}
+    expected = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
+    for module in (lab3_text, lab4_text):
+        assert module.HEAP_RATIO == text_module.HEAP_RATIO
+        assert module.top_n(freq, 5) == expected[:5]
+        assert module.top_n(freq, 100) == expected[:100]
+
+
+def _zipf_text(words, vocabulary):
+    letters = "абвгдежзийклмнопрстуфхцчшщэюя"
+    vocab = [letters[i % 29] + letters[i // 29 % 29] + "x" for i in range(vocabulary)]
+    counts = [words // (i + 1) for i in range(vocabulary)]
+    tokens = [vocab[i] for i, c in enumerate(counts) for _ in range(c)]
+    random.Random(0).shuffle(tokens)
+    return " ".join(tokens)
+
+
+def test_space_saving_recall_and_error_bounds():
+    text = _zipf_text(2000, 400)
+    exact = count_words(text)
+    sketch = count_freq_approx(io.StringIO(text), 100 * 256, chunk_size=500)
+    assert sketch.capacity == 100
+    assert len(sketch) <= 100
+    assert sketch.total == sum(exact.values()) == sum(sketch.values())
+    for word, count in sketch.items():
+        assert count - sketch.error(word) <= exact.get(word, 0) <= count
+    expected = {word for word, _ in top_n(exact, 10)}
+    found = {word for word, _ in top_n(sketch, 10)}
+    assert len(expected & found) / len(expected) >= 0.9
+
+
+def test_space_saving_exact_when_fits():
+    sketch = SpaceSaving(10)
+    sketch.update({"a": 3, "b": 2})
+    sketch.add("a")
+    assert dict(sketch) == {"a": 4, "b": 2}
+    assert sketch.max_error == 0
+
+
+def test_parse_size():
+    assert parse_size("64MB") == 64 * 1024 * 1024
+    assert parse_size("512k") == 512 * 1024
+    assert parse_size("100") == 100
+    with pytest.raises(ValueError):
+        parse_size("много")
@@ -0,0 +1,45 @@
+import csv
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.lab4 import text_report
+
+
+def read_report(path: Path) -> dict:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["word", "count"]
+    return {word: int(count) for word, count in rows[1:]}
+
+
+def test_report_batch_skips_unreadable_files(tmp_path: Path, capsys):
+    src = tmp_path / "in"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("мама мыла раму", encoding="utf-8")
+    (src / "sub" / "a.txt").write_text("мама пела", encoding="utf-8")
+    bad = src / "bad.txt"
+    bad.write_bytes("ошибка в кодировке".encode("cp1251"))
+    out = tmp_path / "out"
+
+    failed = text_report.report_batch(str(src / "**" / "*.txt"), str(out), workers=2)
+
+    assert failed == {str(bad): "Ошибка изменения кодировки."}
+    assert read_report(out / "report.csv") == {
+        "мама": 2,
+        "мыла": 1,
+        "раму": 1,
+        "пела": 1,
+    }
+    # Одинаковые имена из разных папок не перезаписывают друг друга
+    assert read_report(out / "report_a.csv") == {"мама": 1, "мыла": 1, "раму": 1}
+    assert read_report(out / "report_a_2.csv") == {"мама": 1, "пела": 1}
+    assert not (out / "report_bad.csv").exists()
+    with (out / "timings.csv").open(encoding="utf-8") as f:
+        assert str(bad) not in f.read()
+    assert "Не удалось прочитать файлов: 1" in capsys.readouterr().out
+
+
+def test_report_batch_without_files(tmp_path: Path):
+    assert text_report.report_batch(str(tmp_path / "*.txt"), str(tmp_path)) == {}